@@ -395,6 +395,7 @@ class Surface(abstract.Surface):
     Please refer to the :py:class:`.abstract.Surface()` documentation for more details.
     """
     # __slots__ = ('_insert_knot_func', '_remove_knot_func', '_control_points2D')
+    _cow_attrs = ('_eval_points', '_knot_vector', '_control_points', '_control_points2D')
 
     def __init__(self, **kwargs):
         super(Surface, self).__init__(**kwargs)
@@ -462,6 +463,7 @@ class Surface(abstract.Surface):
         :setter: Sets the control points as a 2-dimensional array in [u][v] format
         :type: list
         """
+        self._cow_materialize('_control_points2D')
         return self._control_points2D
 
     @ctrlpts2d.setter
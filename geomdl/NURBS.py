@@ -85,6 +85,12 @@ class Curve(BSpline.Curve):
         # Variables for caching
         self.init_cache()
 
+    def __copy__(self):
+        # Call parent method
+        result = super(Curve, self).__copy__()
+        result.init_cache()
+        return result
+
     def __deepcopy__(self, memo):
         # Call parent method
         result = super(Curve, self).__deepcopy__(memo)
@@ -107,6 +113,7 @@ class Curve(BSpline.Curve):
         :getter: Gets the weighted control points
         :setter: Sets the weighted control points
         """
+        self._cow_materialize('_control_points')
         return self._control_points
 
     @ctrlptsw.setter
@@ -289,6 +296,12 @@ class Surface(BSpline.Surface):
         # Variables for caching
         self.init_cache()
 
+    def __copy__(self):
+        # Call parent method
+        result = super(Surface, self).__copy__()
+        result.init_cache()
+        return result
+
     def __deepcopy__(self, memo):
         # Call parent method
         result = super(Surface, self).__deepcopy__(memo)
@@ -310,6 +323,7 @@ class Surface(BSpline.Surface):
         :getter: Gets weighted control points
         :setter: Sets weighted control points
         """
+        self._cow_materialize('_control_points')
         return self._control_points
 
     @ctrlptsw.setter
@@ -458,6 +472,12 @@ class Volume(BSpline.Volume):
         # Variables for caching
         self.init_cache()
 
+    def __copy__(self):
+        # Call parent method
+        result = super(Volume, self).__copy__()
+        result.init_cache()
+        return result
+
     def __deepcopy__(self, memo):
         # Call parent method
         result = super(Volume, self).__deepcopy__(memo)
@@ -498,6 +518,7 @@ class Volume(BSpline.Volume):
         :getter: Gets weighted control points
         :setter: Sets weighted control points
         """
+        self._cow_materialize('_control_points')
         return self._control_points
 
     @ctrlptsw.setter
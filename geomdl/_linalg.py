@@ -7,6 +7,9 @@
 
 """
 
+import math
+from .exceptions import GeomdlException
+
 # Initialize an empty __all__ for controlling imports
 __all__ = []
 
@@ -40,3 +43,172 @@ def doolittle(matrix_a):
                     matrix_l[k][i] = 0.0
 
     return matrix_l, matrix_u
+
+
+def doolittle_banded(matrix_ab, num_lower, num_upper):
+    """ Doolittle's Method for LU-factorization of banded matrices without pivoting.
+
+    The input matrix is stored row-wise in band storage, i.e. the element :math:`a_{ij}` is stored in
+    ``matrix_ab[i][j - i + num_lower]``. L and U factors are stored in the same band storage and the unit diagonal of L
+    is not stored.
+
+    :param matrix_ab: input matrix in band storage
+    :type matrix_ab: list, tuple
+    :param num_lower: number of sub-diagonals
+    :type num_lower: int
+    :param num_upper: number of super-diagonals
+    :type num_upper: int
+    :return: L and U factors in band storage
+    :rtype: list
+    """
+    size = len(matrix_ab)
+    matrix_lu = [[float(a) for a in row] for row in matrix_ab]
+
+    for k in range(size):
+        row_k = matrix_lu[k]
+        pivot = row_k[num_lower]
+        if pivot == 0.0:
+            raise GeomdlException("Matrix is singular or requires pivoting", data=dict(row=k))
+        j_end = min(size, k + num_upper + 1)
+        for i in range(k + 1, min(size, k + num_lower + 1)):
+            row_i = matrix_lu[i]
+            offset = num_lower - i
+            factor = row_i[k + offset] / pivot
+            row_i[k + offset] = factor
+            if factor == 0.0:
+                continue
+            for j in range(k + 1, j_end):
+                row_i[j + offset] -= factor * row_k[j - k + num_lower]
+
+    return matrix_lu
+
+
+def lu_substitution_banded(matrix_lu, num_lower, num_upper, matrix_b):
+    """ Forward and backward substitution using the L and U factors in band storage.
+
+    :param matrix_lu: L and U factors in band storage generated by :func:`doolittle_banded`
+    :type matrix_lu: list, tuple
+    :param num_lower: number of sub-diagonals
+    :type num_lower: int
+    :param num_upper: number of super-diagonals
+    :type num_upper: int
+    :param matrix_b: matrix of column vectors, i.e. each row contains the right-hand side values of the equation
+    :type matrix_b: list, tuple
+    :return: solution matrix
+    :rtype: list
+    """
+    size = len(matrix_lu)
+    matrix_x = [[float(b) for b in row] for row in matrix_b]
+    dim = len(matrix_x[0]) if size > 0 else 0
+
+    # Forward substitution, Ly = b
+    for i in range(size):
+        row_lu = matrix_lu[i]
+        x_i = matrix_x[i]
+        for j in range(max(0, i - num_lower), i):
+            l_ij = row_lu[j - i + num_lower]
+            if l_ij == 0.0:
+                continue
+            x_j = matrix_x[j]
+            for d in range(dim):
+                x_i[d] -= l_ij * x_j[d]
+
+    # Backward substitution, Ux = y
+    for i in range(size - 1, -1, -1):
+        row_lu = matrix_lu[i]
+        x_i = matrix_x[i]
+        for j in range(i + 1, min(size, i + num_upper + 1)):
+            u_ij = row_lu[j - i + num_lower]
+            if u_ij == 0.0:
+                continue
+            x_j = matrix_x[j]
+            for d in range(dim):
+                x_i[d] -= u_ij * x_j[d]
+        u_ii = row_lu[num_lower]
+        for d in range(dim):
+            x_i[d] /= u_ii
+
+    return matrix_x
+
+
+def cholesky_banded(matrix_ab, bandwidth):
+    """ Cholesky factorization of symmetric positive-definite banded matrices.
+
+    The lower triangle of the input matrix is stored row-wise in band storage, i.e. the element :math:`a_{ij}`,
+    :math:`j \\leq i`, is stored in ``matrix_ab[i][j - i + bandwidth]``. The factor L is stored in the same format.
+
+    :param matrix_ab: lower triangle of the input matrix in band storage
+    :type matrix_ab: list, tuple
+    :param bandwidth: number of sub-diagonals
+    :type bandwidth: int
+    :return: L factor in band storage
+    :rtype: list
+    """
+    size = len(matrix_ab)
+    matrix_l = [[0.0 for _ in range(bandwidth + 1)] for _ in range(size)]
+
+    for i in range(size):
+        row_a = matrix_ab[i]
+        row_i = matrix_l[i]
+        for j in range(max(0, i - bandwidth), i + 1):
+            row_j = matrix_l[j]
+            # Sum over the common columns of rows i and j
+            val = float(row_a[j - i + bandwidth])
+            for k in range(max(0, i - bandwidth), j):
+                val -= row_i[k - i + bandwidth] * row_j[k - j + bandwidth]
+            if i == j:
+                if val <= 0.0:
+                    raise GeomdlException("Matrix is not positive-definite", data=dict(row=i))
+                row_i[bandwidth] = math.sqrt(val)
+            else:
+                row_i[j - i + bandwidth] = val / row_j[bandwidth]
+
+    return matrix_l
+
+
+def cholesky_substitution_banded(matrix_l, bandwidth, matrix_b):
+    """ Forward and backward substitution using the Cholesky factor in band storage.
+
+    :param matrix_l: L factor in band storage generated by :func:`cholesky_banded`
+    :type matrix_l: list, tuple
+    :param bandwidth: number of sub-diagonals
+    :type bandwidth: int
+    :param matrix_b: matrix of column vectors, i.e. each row contains the right-hand side values of the equation
+    :type matrix_b: list, tuple
+    :return: solution matrix
+    :rtype: list
+    """
+    size = len(matrix_l)
+    matrix_x = [[float(b) for b in row] for row in matrix_b]
+    dim = len(matrix_x[0]) if size > 0 else 0
+
+    # Forward substitution, Ly = b
+    for i in range(size):
+        row_l = matrix_l[i]
+        x_i = matrix_x[i]
+        for j in range(max(0, i - bandwidth), i):
+            l_ij = row_l[j - i + bandwidth]
+            if l_ij == 0.0:
+                continue
+            x_j = matrix_x[j]
+            for d in range(dim):
+                x_i[d] -= l_ij * x_j[d]
+        l_ii = row_l[bandwidth]
+        for d in range(dim):
+            x_i[d] /= l_ii
+
+    # Backward substitution, L^T x = y
+    for i in range(size - 1, -1, -1):
+        x_i = matrix_x[i]
+        for j in range(i + 1, min(size, i + bandwidth + 1)):
+            l_ji = matrix_l[j][i - j + bandwidth]
+            if l_ji == 0.0:
+                continue
+            x_j = matrix_x[j]
+            for d in range(dim):
+                x_i[d] -= l_ji * x_j[d]
+        l_ii = matrix_l[i][bandwidth]
+        for d in range(dim):
+            x_i[d] /= l_ii
+
+    return matrix_x
@@ -7,7 +7,10 @@
 
 """
 
-from . import linalg, helpers
+from bisect import bisect_left, bisect_right
+from itertools import product
+from operator import mul
+from . import linalg, helpers, utilities
 from .exceptions import GeomdlException
 
 
@@ -30,7 +33,7 @@ def tangent_curve_single(obj, u, normalize):
     :rtype: tuple
     """
     # 1st derivative of the curve gives the tangent
-    ders = obj.derivatives(u, 1)
+    ders = curve_derivatives(obj, [u], 1)[0]
 
     point = ders[0]
     vector = linalg.vector_normalize(ders[1]) if normalize else ders[1]
@@ -51,9 +54,9 @@ def tangent_curve_single_list(obj, param_list, normalize):
     :rtype: tuple
     """
     ret_vector = []
-    for param in param_list:
-        temp = tangent_curve_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for ders in curve_derivatives(obj, param_list, 1):
+        vector = linalg.vector_normalize(ders[1]) if normalize else ders[1]
+        ret_vector.append((tuple(ders[0]), tuple(vector)))
     return tuple(ret_vector)
 
 
@@ -72,7 +75,7 @@ def tangent_surface_single(obj, uv, normalize):
     :rtype: list
     """
     # Tangent is the 1st derivative of the surface
-    skl = obj.derivatives(uv[0], uv[1], 1)
+    skl = surface_derivatives(obj, [uv], 1)[0]
 
     point = skl[0][0]
     vector_u = linalg.vector_normalize(skl[1][0]) if normalize else skl[1][0]
@@ -94,9 +97,10 @@ def tangent_surface_single_list(obj, param_list, normalize):
     :rtype: tuple
     """
     ret_vector = []
-    for param in param_list:
-        temp = tangent_surface_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for skl in surface_derivatives(obj, param_list, 1):
+        vector_u = linalg.vector_normalize(skl[1][0]) if normalize else skl[1][0]
+        vector_v = linalg.vector_normalize(skl[0][1]) if normalize else skl[0][1]
+        ret_vector.append((tuple(skl[0][0]), tuple(vector_u), tuple(vector_v)))
     return tuple(ret_vector)
 
 
@@ -115,7 +119,7 @@ def normal_surface_single(obj, uv, normalize):
     :rtype: list
     """
     # Take the 1st derivative of the surface
-    skl = obj.derivatives(uv[0], uv[1], 1)
+    skl = surface_derivatives(obj, [uv], 1)[0]
 
     point = skl[0][0]
     vector = linalg.vector_cross(skl[1][0], skl[0][1])
@@ -137,12 +141,211 @@ def normal_surface_single_list(obj, param_list, normalize):
     :rtype: tuple
     """
     ret_vector = []
-    for param in param_list:
-        temp = normal_surface_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for skl in surface_derivatives(obj, param_list, 1):
+        vector = linalg.vector_cross(skl[1][0], skl[0][1])
+        vector = linalg.vector_normalize(vector) if normalize else vector
+        ret_vector.append((tuple(skl[0][0]), tuple(vector)))
     return tuple(ret_vector)
 
 
+def hodograph_rows(degree, knotvector, rows):
+    """ Computes the control points rows of the hodograph (first derivative) on a parametric direction.
+
+    Please refer to the Eqn. 3.8 of The NURBS Book (2nd Edition), p.94 for details.
+
+    :param degree: degree on the parametric direction
+    :type degree: int
+    :param knotvector: knot vector on the parametric direction
+    :type knotvector: list, tuple
+    :param rows: rows of the control points grid generated by :func:`.ctrlpts_to_rows`
+    :type rows: list, tuple
+    :return: rows of the hodograph control points grid
+    :rtype: list
+    """
+    result = []
+    for i in range(len(rows) - 1):
+        span = knotvector[i + degree + 1] - knotvector[i + 1]
+        coeff = degree / span if span != 0.0 else 0.0
+        result.append([coeff * (c2 - c1) for c1, c2 in zip(rows[i], rows[i + 1])])
+    return result
+
+
+def hodograph(obj, order):
+    """ Returns the hodograph of the spline geometry for the input derivative order.
+
+    The hodographs are computed from the (weighted) control points by successive differentiation and cached on the
+    geometry until its degree, knot vector or control points change. The derivatives vanishing identically are
+    represented by None.
+
+    :param obj: spline geometry
+    :type obj: abstract.SplineGeometry
+    :param order: derivative order on each parametric direction
+    :type order: tuple
+    :return: degrees, knot vectors, sizes, control points and control points rows of the hodograph
+    :rtype: tuple
+    """
+    cache = obj._cache.setdefault('hodographs', dict())
+    if order in cache:
+        return cache[order]
+
+    if not any(order):
+        datadict = obj.data
+        hodo = (datadict['degree'], datadict['knotvector'], datadict['size'], datadict['control_points'])
+    else:
+        # Differentiate the hodograph of one lower order on the last parametric direction
+        d = max(idx for idx, o in enumerate(order) if o > 0)
+        prev = hodograph(obj, order[:d] + (order[d] - 1,) + order[d + 1:])
+        if prev is None or prev[0][d] == 0:
+            hodo = None
+        else:
+            degrees, kvs, sizes, cpts = [list(val) for val in prev[:4]]
+            rows = hodograph_rows(degrees[d], kvs[d], ctrlpts_to_rows(cpts, sizes, d))
+            degrees[d] -= 1
+            kvs[d] = kvs[d][1:-1]
+            sizes[d] -= 1
+            hodo = (tuple(degrees), tuple(kvs), tuple(sizes), rows_to_ctrlpts(rows, sizes, d, len(cpts[0])))
+
+    # Store the control points grouped on the u-direction for the evaluation
+    if hodo is not None:
+        hodo += (ctrlpts_to_rows(hodo[3], hodo[2], 0),)
+    cache[order] = hodo
+    return hodo
+
+
+def evaluate_hodographs(obj, orders, params):
+    """ Evaluates the hodographs of the curve or the surface at the input parameters.
+
+    The points are evaluated using Algorithm A3.1 and A3.5, i.e. no derivatives of the basis functions are computed.
+    The knot spans are found once, since each differentiation removes one knot from both ends of the knot vector.
+    Please refer to :func:`.ctrlpts_to_rows` for the control points rows.
+
+    :param obj: curve or surface
+    :type obj: abstract.Curve or abstract.Surface
+    :param orders: derivative orders on each parametric direction
+    :type orders: list, tuple
+    :param params: parameters on all parametric directions
+    :type params: list, tuple
+    :return: evaluated (weighted) points for each derivative order
+    :rtype: list
+    """
+    dimension = obj.dimension + 1 if obj.rational else obj.dimension
+    degrees, kvs, sizes, _, _ = hodograph(obj, tuple(0 for _ in range(obj.pdimension)))
+    knots = [[param[d] for param in params] for d in range(obj.pdimension)]
+    spans = [helpers.find_spans(degrees[d], kvs[d], sizes[d], knots[d]) for d in range(obj.pdimension)]
+
+    result = []
+    bases = dict()
+    for order in orders:
+        hodo = hodograph(obj, order)
+        if hodo is None:
+            result.append([[0.0 for _ in range(dimension)] for _ in params])
+            continue
+        degrees, kvs, sizes, _, rows = hodo
+
+        # Find the knot spans and the non-vanishing basis functions of the hodograph
+        hspans = []
+        for d, k in enumerate(order):
+            hspans.append([span - k for span in spans[d]])
+            if (d, k) not in bases:
+                bases[(d, k)] = helpers.basis_functions(degrees[d], kvs[d], hspans[d], knots[d])
+
+        pts = []
+        if len(order) == 1:
+            p = degrees[0]
+            for span, bfuns in zip(hspans[0], bases[(0, order[0])]):
+                pts.append([sum(map(mul, bfuns, coords)) for coords in zip(*rows[span - p:span + 1])])
+        else:
+            p, q = degrees
+            for span_u, span_v, bfuns_u, bfuns_v in zip(hspans[0], hspans[1], bases[(0, order[0])],
+                                                        bases[(1, order[1])]):
+                # Evaluate the curves on the u-direction first, then the curve on the v-direction
+                start, stop = (span_v - q) * dimension, (span_v + 1) * dimension
+                temp = [sum(map(mul, bfuns_u, coords))
+                        for coords in zip(*[row[start:stop] for row in rows[span_u - p:span_u + 1]])]
+                pts.append([sum(map(mul, bfuns_v, temp[c::dimension])) for c in range(dimension)])
+        result.append(pts)
+    return result
+
+
+def curve_derivatives(obj, params, order):
+    """ Evaluates the curve derivatives at the input parameters using the cached hodograph curves.
+
+    The derivatives of the rational curves are computed from the derivatives of the weighted curve (Algorithm A4.2).
+
+    :param obj: input curve
+    :type obj: abstract.Curve
+    :param params: parameters
+    :type params: list, tuple
+    :param order: derivative order
+    :type order: int
+    :return: a list containing up to {order}-th derivatives of the curve for each parameter
+    :rtype: list
+    """
+    # Check all variables are set before the curve evaluation
+    obj._check_variables()
+    if obj._kv_normalize and not utilities.check_params(params):
+        raise GeomdlException("Parameters should be between 0 and 1")
+
+    ders = evaluate_hodographs(obj, [(k,) for k in range(order + 1)], [(u,) for u in params])
+    if not obj.rational:
+        return [list(aders) for aders in zip(*ders)]
+
+    result = []
+    for aders in zip(*ders):
+        ck = []
+        for k in range(order + 1):
+            v = aders[k][:-1]
+            for i in range(1, k + 1):
+                coeff = linalg.binomial_coefficient(k, i) * aders[i][-1]
+                v = [c - coeff * c2 for c, c2 in zip(v, ck[k - i])]
+            ck.append([c / aders[0][-1] for c in v])
+        result.append(ck)
+    return result
+
+
+def surface_derivatives(obj, params, order):
+    """ Evaluates the surface derivatives at the input parameters using the cached hodograph surfaces.
+
+    The derivatives of the rational surfaces are computed from the derivatives of the weighted surface (Algorithm A4.4).
+
+    :param obj: input surface
+    :type obj: abstract.Surface
+    :param params: (u, v) parameter pairs
+    :type params: list, tuple
+    :param order: derivative order
+    :type order: int
+    :return: a list containing the derivatives SKL[k][l] (k + l <= order) of the surface for each parameter pair
+    :rtype: list
+    """
+    # Check all variables are set before the surface evaluation
+    obj._check_variables()
+    if obj._kv_normalize and not all(utilities.check_params(uv) for uv in params):
+        raise GeomdlException("Parameters should be between 0 and 1")
+
+    orders = [(k, l) for k in range(order + 1) for l in range(order + 1 - k)]
+    ders = evaluate_hodographs(obj, orders, params)
+
+    result = []
+    for aders in zip(*ders):
+        aders = dict(zip(orders, aders))
+        skl = [[[0.0 for _ in range(obj.dimension)] for _ in range(order + 1)] for _ in range(order + 1)]
+        for k, l in orders:
+            if not obj.rational:
+                skl[k][l] = aders[(k, l)]
+                continue
+            v = aders[(k, l)][:-1]
+            for j in range(1, l + 1):
+                coeff = linalg.binomial_coefficient(l, j) * aders[(0, j)][-1]
+                v = [c - coeff * c2 for c, c2 in zip(v, skl[k][l - j])]
+            for i in range(1, k + 1):
+                for j in range(0, l + 1):
+                    coeff = linalg.binomial_coefficient(k, i) * linalg.binomial_coefficient(l, j) * aders[(i, j)][-1]
+                    v = [c - coeff * c2 for c, c2 in zip(v, skl[k - i][l - j])]
+            skl[k][l] = [c / aders[(0, 0)][-1] for c in v]
+        result.append(skl)
+    return result
+
+
 def find_ctrlpts_curve(t, curve, **kwargs):
     """ Finds the control points involved in the evaluation of the curve point defined by the input parameter.
 
@@ -267,3 +470,617 @@ def link_curves(*args, **kwargs):
     kv_connected.pop()
 
     return kv, cpts, wgts, kv_connected
+
+
+def ctrlpts_grid_strides(sizes):
+    """ Computes the index increments of the parametric directions on the 1-dimensional control points array.
+
+    :param sizes: number of control points on the parametric directions
+    :type sizes: list, tuple
+    :return: index increments on the parametric directions
+    :rtype: list
+    """
+    if len(sizes) == 3:
+        return [sizes[1], 1, sizes[0] * sizes[1]]
+    if len(sizes) == 2:
+        return [sizes[1], 1]
+    return [1]
+
+
+def ctrlpts_to_rows(ctrlpts, sizes, direction):
+    """ Groups the control points sharing the same index on the parametric direction into rows.
+
+    Each row is a flat list of floats containing the coordinates of all control points with the same index on the
+    input parametric direction. Therefore, the spline algorithms can process the whole control points grid at once
+    by treating each row as a single control point.
+
+    :param ctrlpts: 1-dimensional control points array
+    :type ctrlpts: list, tuple
+    :param sizes: number of control points on the parametric directions
+    :type sizes: list, tuple
+    :param direction: index of the parametric direction
+    :type direction: int
+    :return: rows of the control points grid
+    :rtype: list
+    """
+    stride = ctrlpts_grid_strides(sizes)[direction]
+    size = sizes[direction]
+    rows = [[] for _ in range(size)]
+    for start in range(0, len(ctrlpts), stride):
+        rows[(start // stride) % size].extend([c for pt in ctrlpts[start:start + stride] for c in pt])
+    return rows
+
+
+def rows_to_ctrlpts(rows, sizes, direction, dimension):
+    """ Converts the rows generated by :func:`.ctrlpts_to_rows` back to the 1-dimensional control points array.
+
+    :param rows: rows of the control points grid
+    :type rows: list, tuple
+    :param sizes: number of control points on the parametric directions, including the updated direction
+    :type sizes: list, tuple
+    :param direction: index of the parametric direction
+    :type direction: int
+    :param dimension: spatial dimension of the control points
+    :type dimension: int
+    :return: 1-dimensional control points array
+    :rtype: list
+    """
+    chunk = ctrlpts_grid_strides(sizes)[direction] * dimension
+    return [row[i:i + dimension] for start in range(0, len(rows[0]), chunk) for row in rows
+            for i in range(start, start + chunk, dimension)]
+
+
+def decompose_ctrlpts(ctrlpts, sizes, degrees, knotvectors, directions):
+    """ Decomposes the control points array into the control points arrays of the Bezier patches.
+
+    On each parametric direction, the control points sharing the same index are concatenated into a single row and
+    all rows are decomposed together via :func:`.helpers.bezier_decomposition`.
+
+    :param ctrlpts: 1-dimensional control points array (use Pw if rational)
+    :type ctrlpts: list, tuple
+    :param sizes: number of control points on the parametric directions
+    :type sizes: list, tuple
+    :param degrees: degrees on the parametric directions
+    :type degrees: list, tuple
+    :param knotvectors: knot vectors on the parametric directions
+    :type knotvectors: list, tuple
+    :param directions: indices of the parametric directions to be decomposed
+    :type directions: list, tuple
+    :return: a list of (control points, sizes, knot vectors) for each patch
+    :rtype: list
+    """
+    dim = len(ctrlpts[0])
+    patches = [(ctrlpts, list(sizes), [list(kv) for kv in knotvectors])]
+    for d in directions:
+        order = degrees[d] + 1
+        patches_new = []
+        for cpts, cpsize, kvs in patches:
+            # Decompose all rows of the parametric direction at once
+            rows = ctrlpts_to_rows(cpts, cpsize, d)
+            segments, knots = helpers.bezier_decomposition(degrees[d], kvs[d], rows)
+
+            # Convert the rows of the segments back to 1-dimensional control points arrays
+            cpsize_new = list(cpsize)
+            cpsize_new[d] = order
+            for seg, k_start, k_end in zip(segments, knots[:-1], knots[1:]):
+                kvs_new = list(kvs)
+                kvs_new[d] = [k_start for _ in range(order)] + [k_end for _ in range(order)]
+                patches_new.append((rows_to_ctrlpts(seg, cpsize_new, d, dim), cpsize_new, kvs_new))
+        patches = patches_new
+    return patches
+
+
+def split_ctrlpts(ctrlpts, sizes, degrees, knotvectors, params):
+    """ Splits the control points array at the input parameters.
+
+    On each parametric direction, all parameters are inserted as knots until their multiplicities are equal to the
+    degree in a single knot refinement pass. Then, the refined control points are sliced into the pieces.
+
+    :param ctrlpts: 1-dimensional control points array (use Pw if rational)
+    :type ctrlpts: list, tuple
+    :param sizes: number of control points on the parametric directions
+    :type sizes: list, tuple
+    :param degrees: degrees on the parametric directions
+    :type degrees: list, tuple
+    :param knotvectors: knot vectors on the parametric directions
+    :type knotvectors: list, tuple
+    :param params: parameters to split in [params_u, params_v, params_w] format
+    :type params: list, tuple
+    :return: a list of (control points, sizes, knot vectors) for each piece
+    :rtype: list
+    """
+    dim = len(ctrlpts[0])
+    patches = [(ctrlpts, list(sizes), [list(kv) for kv in knotvectors])]
+    for d, prm in enumerate(params):
+        if not prm:
+            continue
+        degree = degrees[d]
+        cuts = sorted(set(prm))
+        patches_new = []
+        for cpts, cpsize, kvs in patches:
+            # Insert all parameters at once
+            kv = kvs[d]
+            knot_list = [c for c in cuts for _ in range(degree - helpers.find_multiplicity(c, kv))]
+            rows = ctrlpts_to_rows(cpts, cpsize, d)
+            kv_new = sorted(kv + knot_list)
+            if knot_list:
+                rows = helpers.knot_refinement_apply(helpers.knot_refinement_oslo(degree, kv, kv_new), rows)
+
+            # Slice the refined control points
+            cpt_start = 0
+            kv_start = 0
+            kv_head = []
+            for c in cuts + [None]:
+                if c is None:
+                    rows_piece = rows[cpt_start:]
+                    kv_piece = kv_head + kv_new[kv_start:]
+                else:
+                    k_first = bisect_left(kv_new, c)
+                    k_last = bisect_right(kv_new, c)
+                    rows_piece = rows[cpt_start:k_first]
+                    kv_piece = kv_head + kv_new[kv_start:k_first] + [c for _ in range(degree + 1)]
+                    cpt_start = k_last - degree - 1
+                    kv_start = k_last
+                    kv_head = [c for _ in range(degree + 1)]
+                cpsize_new = list(cpsize)
+                cpsize_new[d] = len(rows_piece)
+                kvs_new = list(kvs)
+                kvs_new[d] = kv_piece
+                patches_new.append((rows_to_ctrlpts(rows_piece, cpsize_new, d, dim), cpsize_new, kvs_new))
+        patches = patches_new
+    return patches
+
+
+def generate_geometries(obj, patches):
+    """ Generates spline geometries of the same type with the input spline geometry from the control points arrays.
+
+    :param obj: spline geometry
+    :type obj: abstract.SplineGeometry
+    :param patches: a list of (control points, sizes, knot vectors)
+    :type patches: list, tuple
+    :return: a list of spline geometries
+    :rtype: list
+    """
+    ret = []
+    for cpts, cpsize, kvs in patches:
+        geom = obj.__class__()
+        geom.degree = obj.degree
+        geom.set_ctrlpts(cpts, *cpsize)
+        geom.knotvector = kvs[0] if obj.pdimension == 1 else kvs
+        ret.append(geom)
+    return ret
+
+
+def decompose_geometry(obj, directions):
+    """ Decomposes the spline geometry into Bezier patches on the given parametric directions.
+
+    :param obj: spline geometry
+    :type obj: abstract.SplineGeometry
+    :param directions: indices of the parametric directions to be decomposed
+    :type directions: list, tuple
+    :return: a list of Bezier patches
+    :rtype: list
+    """
+    datadict = obj.data
+    patches = decompose_ctrlpts(datadict['control_points'], datadict['size'], datadict['degree'],
+                                datadict['knotvector'], directions)
+    return generate_geometries(obj, patches)
+
+
+def split_geometry(obj, params):
+    """ Splits the spline geometry at the input parameters.
+
+    :param obj: spline geometry
+    :type obj: abstract.SplineGeometry
+    :param params: parameters to split in [params_u, params_v, params_w] format
+    :type params: list, tuple
+    :return: a list of spline geometries
+    :rtype: list
+    """
+    datadict = obj.data
+    patches = split_ctrlpts(datadict['control_points'], datadict['size'], datadict['degree'],
+                            datadict['knotvector'], params)
+    return generate_geometries(obj, patches)
+
+
+def transform_geometry(obj, matrix):
+    """ Applies the homogeneous transformation matrix to the control points of the spline geometry in-place.
+
+    The matrix is applied to the weighted control points of the rational geometries, which makes the affine and the
+    projective transformations exact. 2-dimensional geometries are assumed to lie on the xy-plane.
+
+    :param obj: spline geometry
+    :type obj: abstract.SplineGeometry
+    :param matrix: 4x4 transformation matrix
+    :type matrix: list, tuple
+    """
+    (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23), (m30, m31, m32, m33) = matrix
+    if obj.rational:
+        if obj.dimension == 2:
+            cpts = [[m00 * x + m01 * y + m03 * w,
+                     m10 * x + m11 * y + m13 * w,
+                     m30 * x + m31 * y + m33 * w] for x, y, w in obj.ctrlptsw]
+        else:
+            cpts = [[m00 * x + m01 * y + m02 * z + m03 * w,
+                     m10 * x + m11 * y + m12 * z + m13 * w,
+                     m20 * x + m21 * y + m22 * z + m23 * w,
+                     m30 * x + m31 * y + m32 * z + m33 * w] for x, y, z, w in obj.ctrlptsw]
+        if any(pt[-1] <= 0.0 for pt in cpts):
+            raise GeomdlException("The transformation generates non-positive weights", data=dict(matrix=matrix))
+    else:
+        if obj.dimension == 2:
+            cpts = [[m00 * x + m01 * y + m03,
+                     m10 * x + m11 * y + m13] for x, y in obj.ctrlpts]
+        else:
+            cpts = [[m00 * x + m01 * y + m02 * z + m03,
+                     m10 * x + m11 * y + m12 * z + m13,
+                     m20 * x + m21 * y + m22 * z + m23] for x, y, z in obj.ctrlpts]
+    obj.set_ctrlpts(cpts, *obj.cpsize)
+
+
+class PointGrid(object):
+    """ Uniform grid of points for the nearest point queries.
+
+    :param points: points to be indexed
+    :type points: list, tuple
+    :param cell_size: edge length of the grid cells
+    :type cell_size: float
+    """
+    def __init__(self, points, cell_size):
+        self._points = points
+        self._cell_size = float(cell_size)
+        self._bbmin = [min(c) for c in zip(*points)]
+        self._bbmax = [max(c) for c in zip(*points)]
+        self._dims = [int((mx - mn) / self._cell_size) + 1 for mn, mx in zip(self._bbmin, self._bbmax)]
+        self._cells = {}
+        for idx, pt in enumerate(points):
+            self._cells.setdefault(self._cell(pt), []).append(idx)
+
+    def _cell(self, pt):
+        return tuple(min(max(int((c - mn) / self._cell_size), 0), d - 1)
+                     for c, mn, d in zip(pt, self._bbmin, self._dims))
+
+    def _ring(self, base, radius):
+        """ Generates the cells whose Chebyshev distance to the base cell is equal to the radius. """
+        ranges = [range(max(b - radius, 0), min(b + radius, d - 1) + 1) for b, d in zip(base, self._dims)]
+        for key in product(*ranges):
+            if max(abs(k - b) for k, b in zip(key, base)) == radius:
+                yield key
+
+    def nearest(self, pt):
+        """ Finds the index of the nearest point to the input point.
+
+        :param pt: query point
+        :type pt: list, tuple
+        :return: index of the nearest point
+        :rtype: int
+        """
+        # Distance to the bounding box. Since the box is convex, the distance from the query point to any point inside
+        # the box is bounded by the distance from the clamped point.
+        pt_clamped = [min(max(c, mn), mx) for c, mn, mx in zip(pt, self._bbmin, self._bbmax)]
+        dist_box = sum((c1 - c2) ** 2 for c1, c2 in zip(pt, pt_clamped))
+        base = self._cell(pt_clamped)
+
+        best_idx = None
+        best_dist = float('inf')
+        for radius in range(max(self._dims)):
+            for key in self._ring(base, radius):
+                for idx in self._cells.get(key, ()):
+                    dist = sum((c1 - c2) ** 2 for c1, c2 in zip(pt, self._points[idx]))
+                    if dist < best_dist:
+                        best_idx = idx
+                        best_dist = dist
+            # Points in the next ring are at least (radius * cell size) away from the clamped point
+            if best_idx is not None and dist_box + (radius * self._cell_size) ** 2 >= best_dist:
+                break
+        return best_idx
+
+
+def project_curve(obj, points, **kwargs):
+    """ Finds the parameters of the closest points on the curve to the input points.
+
+    Please refer to the Section 6.1 of The NURBS Book (2nd Edition), pp.229-232 for details.
+
+    :param obj: input curve
+    :type obj: abstract.Curve
+    :param points: input points
+    :type points: list, tuple
+    :return: parameters
+    :rtype: list
+    """
+    sample_size = kwargs.get('sample_size', max(10 * len(obj.ctrlpts), 20))
+    tol = kwargs.get('tol', 10e-8)
+    max_iter = kwargs.get('max_iter', 20)
+
+    # Evaluate the seed points
+    datadict = obj.data
+    datadict['sample_size'] = [sample_size]
+    start = obj.knotvector[obj.degree]
+    stop = obj.knotvector[-(obj.degree + 1)]
+    seeds = obj._evaluator.evaluate(datadict, start=start, stop=stop)
+    params = linalg.linspace(start, stop, sample_size, decimals=datadict['precision'])
+
+    # Index the seed points in a uniform grid with the cell size close to the distance between the seeds
+    spacing = [linalg.point_distance(p1, p2) for p1, p2 in zip(seeds[1:], seeds[:-1])]
+    grid = PointGrid(seeds, max(2.0 * sum(spacing) / len(spacing), tol))
+
+    # Refine the seed parameters using Newton iteration
+    result = []
+    for pt in points:
+        u = params[grid.nearest(pt)]
+        for _ in range(max_iter):
+            ders = curve_derivatives(obj, [u], 2)[0]
+            diff = [c1 - c2 for c1, c2 in zip(ders[0], pt)]
+            diff_len = linalg.vector_magnitude(diff)
+            d1_len = linalg.vector_magnitude(ders[1])
+            # Point coincidence and zero cosine checks - Eqn. 6.4
+            if diff_len <= tol or d1_len == 0.0:
+                break
+            numerator = linalg.vector_dot(ders[1], diff)
+            if abs(numerator) / (d1_len * diff_len) <= tol:
+                break
+            # Newton step - Eqn. 6.3
+            denominator = linalg.vector_dot(ders[2], diff) + d1_len ** 2
+            if denominator == 0.0:
+                break
+            u_new = min(max(u - numerator / denominator, start), stop)
+            # Parameter change check - Eqn. 6.5
+            if abs(u_new - u) * d1_len <= tol:
+                u = u_new
+                break
+            u = u_new
+        result.append(u)
+
+    return result
+
+
+def project_surface(obj, points, **kwargs):
+    """ Finds the parameters of the closest points on the surface to the input points.
+
+    Please refer to the Section 6.1 of The NURBS Book (2nd Edition), pp.232-234 for details.
+
+    :param obj: input surface
+    :type obj: abstract.Surface
+    :param points: input points
+    :type points: list, tuple
+    :return: parameters
+    :rtype: list
+    """
+    sample_size = kwargs.get('sample_size', (max(5 * obj.ctrlpts_size_u, 10), max(5 * obj.ctrlpts_size_v, 10)))
+    if not isinstance(sample_size, (list, tuple)):
+        sample_size = (sample_size, sample_size)
+    tol = kwargs.get('tol', 10e-8)
+    max_iter = kwargs.get('max_iter', 20)
+
+    # Evaluate the seed points
+    datadict = obj.data
+    datadict['sample_size'] = list(sample_size)
+    start = (obj.knotvector_u[obj.degree_u], obj.knotvector_v[obj.degree_v])
+    stop = (obj.knotvector_u[-(obj.degree_u + 1)], obj.knotvector_v[-(obj.degree_v + 1)])
+    seeds = obj._evaluator.evaluate(datadict, start=start, stop=stop)
+    params_u = linalg.linspace(start[0], stop[0], sample_size[0], decimals=datadict['precision'])
+    params_v = linalg.linspace(start[1], stop[1], sample_size[1], decimals=datadict['precision'])
+
+    # Index the seed points in a uniform grid with the cell size close to the distance between the seeds
+    spacing = [linalg.point_distance(seeds[idx], seeds[idx + 1])
+               for idx in range(len(seeds) - 1) if (idx + 1) % sample_size[1] != 0]
+    spacing += [linalg.point_distance(seeds[idx], seeds[idx + sample_size[1]])
+                for idx in range(len(seeds) - sample_size[1])]
+    grid = PointGrid(seeds, max(2.0 * sum(spacing) / len(spacing), tol))
+
+    # Refine the seed parameters using Newton iteration
+    result = []
+    for pt in points:
+        idx = grid.nearest(pt)
+        u = params_u[idx // sample_size[1]]
+        v = params_v[idx % sample_size[1]]
+        best = None  # closest iterate as [distance, u, v]
+        for _ in range(max_iter):
+            skl = surface_derivatives(obj, [(u, v)], 2)[0]
+            diff = [c1 - c2 for c1, c2 in zip(skl[0][0], pt)]
+            diff_len = linalg.vector_magnitude(diff)
+            if best is None or diff_len < best[0]:
+                best = [diff_len, u, v]
+            su, sv = skl[1][0], skl[0][1]
+            su_len = linalg.vector_magnitude(su)
+            sv_len = linalg.vector_magnitude(sv)
+            # Point coincidence check - Eqn. 6.8
+            if diff_len <= tol or su_len == 0.0 or sv_len == 0.0:
+                break
+            f = linalg.vector_dot(su, diff)
+            g = linalg.vector_dot(sv, diff)
+            # A parameter is fixed on the boundary if the distance decreases towards the outside of the domain
+            fixed_u = (u <= start[0] and f > 0.0) or (u >= stop[0] and f < 0.0)
+            fixed_v = (v <= start[1] and g > 0.0) or (v >= stop[1] and g < 0.0)
+            # Zero cosine check on the free parameters - Eqn. 6.8
+            if (fixed_u or abs(f) / (su_len * diff_len) <= tol) and (fixed_v or abs(g) / (sv_len * diff_len) <= tol):
+                break
+            if fixed_u and fixed_v:
+                break
+            j00 = su_len ** 2 + linalg.vector_dot(diff, skl[2][0])
+            j01 = linalg.vector_dot(su, sv) + linalg.vector_dot(diff, skl[1][1])
+            j11 = sv_len ** 2 + linalg.vector_dot(diff, skl[0][2])
+            if fixed_u:
+                # Newton step along the boundary curve on the v-direction
+                if j11 == 0.0:
+                    break
+                u_new, v_new = u, v - g / j11
+            elif fixed_v:
+                # Newton step along the boundary curve on the u-direction
+                if j00 == 0.0:
+                    break
+                u_new, v_new = u - f / j00, v
+            else:
+                # Newton step - Eqn. 6.7
+                det = j00 * j11 - j01 * j01
+                if det == 0.0:
+                    break
+                u_new = u + (-f * j11 + g * j01) / det
+                v_new = v + (-g * j00 + f * j01) / det
+                # Continue along the boundary curve if the step leaves the domain
+                if not start[0] <= u_new <= stop[0] and j11 != 0.0:
+                    v_new = v - g / j11
+                elif not start[1] <= v_new <= stop[1] and j00 != 0.0:
+                    u_new = u - f / j00
+            u_new = min(max(u_new, start[0]), stop[0])
+            v_new = min(max(v_new, start[1]), stop[1])
+            # Parameter change check - Eqn. 6.9
+            step = [(u_new - u) * c1 + (v_new - v) * c2 for c1, c2 in zip(su, sv)]
+            u, v = u_new, v_new
+            if linalg.vector_magnitude(step) <= tol:
+                break
+        result.append(best[1:])
+
+    return result
+
+
+def curve_first_derivatives(obj, spans, params):
+    """ Evaluates the first derivatives of the curve at the input parameters in a single pass.
+
+    The knot spans of the parameters are provided by the caller, therefore no knot span search is required.
+
+    :param obj: input curve
+    :type obj: abstract.Curve
+    :param spans: knot spans of the parameters
+    :type spans: list, tuple
+    :param params: parameters
+    :type params: list, tuple
+    :return: first derivatives
+    :rtype: list
+    """
+    datadict = obj.data
+    degree = datadict['degree'][0]
+    cpts = datadict['control_points']
+    bfuns = helpers.basis_functions_ders(degree, datadict['knotvector'][0], spans, params, 1)
+
+    result = []
+    for span, ders in zip(spans, bfuns):
+        pts = cpts[span - degree:span + 1]
+        der = [sum(bf * pt[i] for bf, pt in zip(ders[1], pts)) for i in range(len(pts[0]))]
+        if datadict['rational']:
+            # Apply the quotient rule to the weighted derivatives - Eqn. 4.8
+            pt_w = [sum(bf * pt[i] for bf, pt in zip(ders[0], pts)) for i in range(len(pts[0]))]
+            der = [(d - der[-1] * c / pt_w[-1]) / pt_w[-1] for d, c in zip(der[:-1], pt_w[:-1])]
+        result.append(der)
+    return result
+
+
+class ArcLengthTable(object):
+    """ Arc length to parameter lookup table of a curve.
+
+    Each non-zero knot span of the curve is divided into equal intervals and the arc length of each interval is
+    computed by integrating the curve speed using Gauss-Legendre quadrature. The parameter at an arc length is found
+    using binary search on the cumulative arc lengths and monotone cubic Hermite interpolation inside the interval,
+    where the derivative of the parameter w.r.t. the arc length is the inverse of the curve speed.
+
+    :param obj: input curve
+    :type obj: abstract.Curve
+    :param num_gauss: number of Gauss-Legendre points on each interval
+    :type num_gauss: int
+    :param num_intervals: number of intervals on each knot span
+    :type num_intervals: int
+    """
+    def __init__(self, obj, num_gauss, num_intervals):
+        datadict = obj.data
+        degree = datadict['degree'][0]
+        kv = datadict['knotvector'][0]
+
+        # Find the parameters on the interval boundaries and their knot spans
+        params = []
+        spans = []
+        for span in range(degree, len(kv) - degree - 1):
+            if kv[span] == kv[span + 1]:
+                continue
+            step = (kv[span + 1] - kv[span]) / num_intervals
+            params += [kv[span] + (i * step) for i in range(num_intervals)]
+            spans += [span for _ in range(num_intervals)]
+        params.append(kv[-(degree + 1)])
+        spans.append(spans[-1])
+
+        # Find the Gauss-Legendre points on the intervals
+        nodes, weights = linalg.gauss_legendre(num_gauss)
+        gauss_params = []
+        for u0, u1 in zip(params[:-1], params[1:]):
+            gauss_params += [((u0 + u1) + (u1 - u0) * x) / 2.0 for x in nodes]
+        gauss_spans = [span for span in spans[:-1] for _ in range(num_gauss)]
+
+        # Evaluate the curve speed on the interval boundaries and the Gauss-Legendre points at once
+        ders = curve_first_derivatives(obj, spans + gauss_spans, params + gauss_params)
+        speeds = [linalg.vector_magnitude(der) for der in ders]
+
+        # Integrate the curve speed on the intervals
+        lengths = [0.0]
+        for idx, (u0, u1) in enumerate(zip(params[:-1], params[1:])):
+            gauss_speeds = speeds[len(params) + (idx * num_gauss):len(params) + ((idx + 1) * num_gauss)]
+            lengths.append(lengths[-1] + (u1 - u0) / 2.0 * sum(w * s for w, s in zip(weights, gauss_speeds)))
+
+        self._params = params
+        self._speeds = speeds[:len(params)]
+        self._lengths = lengths
+
+    @property
+    def length(self):
+        """ Arc length of the curve.
+
+        :getter: Gets the arc length
+        :type: float
+        """
+        return self._lengths[-1]
+
+    def param(self, length):
+        """ Finds the parameter at the input arc length.
+
+        :param length: arc length from the start of the curve
+        :type length: float
+        :return: parameter
+        :rtype: float
+        """
+        # Find the interval
+        lengths = self._lengths
+        length = min(max(length, 0.0), lengths[-1])
+        idx = min(bisect_right(lengths, length), len(lengths) - 1) - 1
+        s0, s1 = lengths[idx], lengths[idx + 1]
+        u0, u1 = self._params[idx], self._params[idx + 1]
+        if s1 - s0 <= 0.0:
+            return u0
+
+        # Compute the slopes and limit them to keep the interpolant monotone (Fritsch-Carlson method)
+        secant = (u1 - u0) / (s1 - s0)
+        alpha, beta = [1.0 / (sp * secant) if sp * secant > 1.0 / 3.0 else 3.0 for sp in self._speeds[idx:idx + 2]]
+        if alpha ** 2 + beta ** 2 > 9.0:
+            tau = 3.0 / (alpha ** 2 + beta ** 2) ** 0.5
+            alpha *= tau
+            beta *= tau
+
+        # Evaluate the cubic Hermite interpolant
+        t = (length - s0) / (s1 - s0)
+        h00 = (2.0 * t ** 3) - (3.0 * t ** 2) + 1.0
+        h10 = t ** 3 - (2.0 * t ** 2) + t
+        h01 = (3.0 * t ** 2) - (2.0 * t ** 3)
+        h11 = t ** 3 - t ** 2
+        return (h00 * u0) + (h10 * alpha * (u1 - u0)) + (h01 * u1) + (h11 * beta * (u1 - u0))
+
+
+def arc_length_table(obj, **kwargs):
+    """ Returns the arc length to parameter lookup table of the curve.
+
+    The table is stored in the cache of the curve and it is generated again when the curve changes.
+
+    :param obj: input curve
+    :type obj: abstract.Curve
+    :return: lookup table
+    :rtype: ArcLengthTable
+    """
+    num_gauss = kwargs.get('gauss_points', obj.degree + 1)
+    num_intervals = kwargs.get('intervals', 8)
+
+    if num_gauss < 1 or num_intervals < 1:
+        raise GeomdlException("Number of Gauss points and intervals must be positive integers",
+                              data=dict(gauss_points=num_gauss, intervals=num_intervals))
+
+    key = (num_gauss, num_intervals)
+    cached = obj._cache.get('arc_length_table', None)
+    if cached is None or cached[0] != key:
+        cached = (key, ArcLengthTable(obj, num_gauss, num_intervals))
+        obj._cache['arc_length_table'] = cached
+    return cached[1]
@@ -7,9 +7,14 @@
 
 """
 
+import math
+from functools import partial
+from itertools import product
 from . import linalg
 from . import ray
-from .elements import Vertex, Triangle, Quad
+from .elements import Vertex, Triangle, Quad, Mesh
+from .exceptions import GeomdlException
+from ._utilities import pool_context
 
 # Initialize an empty __all__ for controlling imports
 __all__ = []
@@ -31,12 +36,18 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
     * ``trims``: List of trim curves passed to the tessellation function
     * ``tessellate_func``: Function called for tessellation. *Default:* :func:`.tessellate.surface_tessellate`
     * ``tessellate_args``: Arguments passed to the tessellation function (as a dict)
+    * ``num_procs``: number of concurrent processes for tessellating the tiles of the grid. *Default: 1*
+    * ``tile_size``: number of quad elements on each side of a tile (used when ``num_procs > 1``). *Default: 32*
 
     The tessellation function is designed to generate triangles from 4 vertices. It takes 4 :py:class:`.Vertex` objects,
     index values for setting the triangle and vertex IDs and additional parameters as its function arguments.
     It returns a tuple of :py:class:`.Vertex` and :py:class:`.Triangle` object lists generated from the input vertices.
     A default triangle generator is provided as a prototype for implementation in the source code.
 
+    If ``num_procs`` is bigger than 1, the grid is split into blocks of quad elements (tiles) which are tessellated
+    concurrently using ``multiprocessing``. The results are merged into a single vertex and triangle list with global
+    numbering. Please note that the tessellation function must be picklable, i.e. defined at the module level.
+
     The return value of this function is a tuple containing two lists. First one is the list of vertices and the second
     one is the list of triangles.
 
@@ -49,32 +60,6 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
     :return: a tuple containing lists of vertices and triangles
     :rtype: tuple
     """
-    def fix_numbering(vertex_list, triangle_list):
-        # Initialize variables
-        final_vertices = []
-
-        # Get all vertices inside the triangle list
-        tri_vertex_ids = []
-        for tri in triangle_list:
-            for td in tri.data:
-                if td not in tri_vertex_ids:
-                    tri_vertex_ids.append(td)
-
-        # Find vertices used in triangles
-        seen_vertices = []
-        for vertex in vertex_list:
-            if vertex.id in tri_vertex_ids and vertex.id not in seen_vertices:
-                final_vertices.append(vertex)
-                seen_vertices.append(vertex.id)
-
-        # Fix vertex numbering (automatically fixes triangle vertex numbering)
-        vert_new_id = 0
-        for vertex in final_vertices:
-            vertex.id = vert_new_id
-            vert_new_id += 1
-
-        return final_vertices, triangle_list
-
     # Vertex spacing for triangulation
     vertex_spacing = kwargs.get('vertex_spacing', 1)  # defines the size of the triangles
     trim_curves = kwargs.get('trims', [])
@@ -85,17 +70,49 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
         tsl_func = surface_tessellate
     tsl_args = kwargs.get('tessellate_args', dict())
 
-    # Numbering
-    vrt_idx = 0  # vertex index numbering start
-    tri_idx = 0  # triangle index numbering start
+    # Number of concurrent processes
+    num_procs = kwargs.get('num_procs', 1)
+
+    # Generate vertices directly from input points (preliminary evaluation)
+    vertices, varr_size_u, varr_size_v = make_vertex_grid(points, size_u, size_v, vertex_spacing)
+
+    # Tessellate the grid concurrently
+    if num_procs > 1:
+        tile_size = int(kwargs.get('tile_size', 32))
+        return make_triangle_mesh_tiled(vertices, varr_size_u, varr_size_v, tile_size, num_procs,
+                                        tsl_func, trim_curves, tsl_args)
+
+    # Generate triangles and final vertices
+    _, vlst, triangles = tessellate_tile((vertices, varr_size_u, varr_size_v), tsl_func, trim_curves, tsl_args)
+
+    # Fix vertex and triangle numbering (ID values)
+    vertices, triangles = fix_numbering(vertices + vlst, triangles)
+
+    return vertices, triangles
 
+
+def make_vertex_grid(points, size_u, size_v, vertex_spacing=1):
+    """ Generates the grid of vertices from an array of points.
+
+    :param points: input points
+    :type points: list, tuple
+    :param size_u: number of elements on the u-direction
+    :type size_u: int
+    :param size_v: number of elements on the v-direction
+    :type size_v: int
+    :param vertex_spacing: jump value between the points
+    :type vertex_spacing: int
+    :return: a tuple containing the list of vertices and the vertex grid sizes on the u- and v-directions
+    :rtype: tuple
+    """
     # Variable initialization
     u_jump = (1.0 / float(size_u - 1)) * vertex_spacing  # for computing vertex parametric u value
     v_jump = (1.0 / float(size_v - 1)) * vertex_spacing  # for computing vertex parametric v value
     varr_size_u = int(round((float(size_u) / float(vertex_spacing)) + 10e-8))  # vertex array size on the u-direction
     varr_size_v = int(round((float(size_v) / float(vertex_spacing)) + 10e-8))  # vertex array size on the v-direction
 
-    # Generate vertices directly from input points (preliminary evaluation)
+    # Generate vertices directly from input points
+    vrt_idx = 0
     vertices = [Vertex() for _ in range(varr_size_v * varr_size_u)]
     u = 0.0
     for i in range(0, size_u, vertex_spacing):
@@ -109,6 +126,33 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
             v += v_jump
         u += u_jump
 
+    return vertices, varr_size_u, varr_size_v
+
+
+def tessellate_tile(tile, tessellate_func, trims, tessellate_args):
+    """ Tessellates a block of quad elements on the vertex grid.
+
+    The input tile is a tuple of the vertex list and the number of vertices on the u- and v-directions of the block.
+    The vertices generated by the tessellation function are numbered starting from the size of the vertex list.
+
+    .. note:: Helper function required for ``multiprocessing``
+
+    :param tile: vertices of the block and the block sizes in (vertices, size_u, size_v) format
+    :type tile: tuple
+    :param tessellate_func: tessellation function
+    :param trims: trim curves
+    :type trims: list, tuple
+    :param tessellate_args: tessellation arguments
+    :type tessellate_args: dict
+    :return: lists of grid vertices, generated vertices and triangles in (vertices, new_vertices, triangles) format
+    :rtype: tuple
+    """
+    vertices, size_u, size_v = tile
+
+    # Numbering
+    vrt_idx = len(vertices)  # vertex index numbering start
+    tri_idx = 0  # triangle index numbering start
+
     #
     # Organization of vertices in a quad element on the parametric space:
     #
@@ -121,31 +165,132 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
     # v1      v2
     #
 
-    # Generate triangles and final vertices
+    new_vertices = []
     triangles = []
-    for i in range(varr_size_u - 1):
-        for j in range(varr_size_v - 1):
+    for i in range(size_u - 1):
+        for j in range(size_v - 1):
             # Find vertex indices for a quad element
-            vertex1 = vertices[j + (i * varr_size_v)]
-            vertex2 = vertices[j + ((i + 1) * varr_size_v)]
-            vertex3 = vertices[j + 1 + ((i + 1) * varr_size_v)]
-            vertex4 = vertices[j + 1 + (i * varr_size_v)]
+            vertex1 = vertices[j + (i * size_v)]
+            vertex2 = vertices[j + ((i + 1) * size_v)]
+            vertex3 = vertices[j + 1 + ((i + 1) * size_v)]
+            vertex4 = vertices[j + 1 + (i * size_v)]
 
             # Call tessellation function
-            vlst, tlst = tsl_func(vertex1, vertex2, vertex3, vertex4, vrt_idx, tri_idx, trim_curves, tsl_args)
+            vlst, tlst = tessellate_func(vertex1, vertex2, vertex3, vertex4, vrt_idx, tri_idx, trims, tessellate_args)
 
             # Add tessellation results to the return lists
-            vertices += vlst
+            new_vertices += vlst
             triangles += tlst
 
             # Increment index values
             vrt_idx += len(vlst)
             tri_idx += len(tlst)
 
+    return vertices, new_vertices, triangles
+
+
+def make_triangle_mesh_tiled(vertices, size_u, size_v, tile_size, num_procs, tessellate_func, trims, tessellate_args):
+    """ Tessellates the vertex grid by splitting it into tiles and processing them concurrently.
+
+    Neighboring tiles share their boundary vertices. Since each process works on a copy of its tile, the vertices and
+    the triangles returned from the processes are mapped back to the input vertex grid and renumbered globally.
+
+    :param vertices: vertex grid
+    :type vertices: list
+    :param size_u: number of vertices on the u-direction
+    :type size_u: int
+    :param size_v: number of vertices on the v-direction
+    :type size_v: int
+    :param tile_size: number of quad elements on each side of a tile
+    :type tile_size: int
+    :param num_procs: number of concurrent processes
+    :type num_procs: int
+    :param tessellate_func: tessellation function
+    :param trims: trim curves
+    :type trims: list, tuple
+    :param tessellate_args: tessellation arguments
+    :type tessellate_args: dict
+    :return: a tuple containing lists of vertices and triangles
+    :rtype: tuple
+    """
+    if tile_size < 1:
+        raise GeomdlException("Tile size should be bigger than zero")
+
+    # Evaluate the trim curves before sending them to the processes
+    for trim in trims:
+        trim.evalpts
+
+    # Split the grid into tiles
+    tile_ids = []
+    tiles = []
+    for i0 in range(0, size_u - 1, tile_size):
+        i1 = min(i0 + tile_size, size_u - 1)
+        for j0 in range(0, size_v - 1, tile_size):
+            j1 = min(j0 + tile_size, size_v - 1)
+            ids = [j + (i * size_v) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)]
+            tile_ids.append(ids)
+            tiles.append(([vertices[k] for k in ids], i1 - i0 + 1, j1 - j0 + 1))
+
+    # Tessellate the tiles
+    with pool_context(processes=num_procs) as pool:
+        results = pool.map(partial(tessellate_tile, tessellate_func=tessellate_func, trims=trims,
+                                   tessellate_args=tessellate_args), tiles)
+
+    # Update the vertex grid using the processed copies (the last processed tile sets the trimming flags)
+    for ids, res in zip(tile_ids, results):
+        for k, vert in zip(ids, res[0]):
+            vertices[k] = vert
+
+    # Merge the results with the global numbering
+    vrt_idx = len(vertices)
+    tri_idx = 0
+    new_vertices = []
+    triangles = []
+    for ids, res in zip(tile_ids, results):
+        # Map the boundary vertex copies to the vertex grid
+        vmap = {id(vert): vertices[k] for k, vert in zip(ids, res[0])}
+        for vert in res[1]:
+            vert.id = vrt_idx
+            vrt_idx += 1
+        new_vertices += res[1]
+        for tri in res[2]:
+            tri._data = tuple(vmap.get(id(vert), vert) for vert in tri._data)
+            tri.id = tri_idx
+            tri_idx += 1
+        triangles += res[2]
+
     # Fix vertex and triangle numbering (ID values)
-    vertices, triangles = fix_numbering(vertices, triangles)
+    return fix_numbering(vertices + new_vertices, triangles)
 
-    return vertices, triangles
+
+def fix_numbering(vertex_list, triangle_list):
+    """ Removes the vertices unused by the triangles and renumbers the remaining ones.
+
+    :param vertex_list: list of vertices
+    :type vertex_list: list
+    :param triangle_list: list of triangles
+    :type triangle_list: list
+    :return: a tuple containing lists of vertices and triangles
+    :rtype: tuple
+    """
+    # Get all vertices inside the triangle list
+    tri_vertex_ids = set()
+    for tri in triangle_list:
+        tri_vertex_ids.update(tri.data)
+
+    # Find vertices used in triangles
+    final_vertices = []
+    seen_vertices = set()
+    for vertex in vertex_list:
+        if vertex.id in tri_vertex_ids and vertex.id not in seen_vertices:
+            final_vertices.append(vertex)
+            seen_vertices.add(vertex.id)
+
+    # Fix vertex numbering (automatically fixes triangle vertex numbering)
+    for vert_new_id, vertex in enumerate(final_vertices):
+        vertex.id = vert_new_id
+
+    return final_vertices, triangle_list
 
 
 def polygon_triangulate(tri_idx, *args):
@@ -406,3 +551,369 @@ def surface_trim_tessellate(v1, v2, v3, v4, vidx, tidx, trims, tessellate_args):
             tris_final.append(tri)
 
     return tris_vertices, tris_final
+
+
+def weld_points(points, tol=10e-8):
+    """ Finds the coincident points using a spatial hash.
+
+    The points are binned into the cells of a uniform grid with a cell size of ``tol``. Each point is only compared
+    with the points in its own and neighboring cells, which makes the operation expected linear time.
+
+    :param points: list of points
+    :type points: list, tuple
+    :param tol: distance tolerance for considering two points coincident
+    :type tol: float
+    :return: a tuple containing the list of unique point indices for each input point and the list of unique points
+    :rtype: tuple
+    """
+    if tol <= 0:
+        raise GeomdlException("Tolerance value should be bigger than zero")
+
+    cells = {}
+    unique_points = []
+    indices = []
+    offsets = None
+    for pt in points:
+        key = tuple(int(math.floor(c / tol)) for c in pt)
+        if offsets is None:
+            offsets = list(product((-1, 0, 1), repeat=len(key)))
+
+        # Search the neighboring cells for a coincident point
+        found = -1
+        for offset in offsets:
+            for uidx in cells.get(tuple(k + o for k, o in zip(key, offset)), ()):
+                if linalg.point_distance(unique_points[uidx], pt) <= tol:
+                    found = uidx
+                    break
+            if found >= 0:
+                break
+
+        # Add a new unique point
+        if found < 0:
+            found = len(unique_points)
+            unique_points.append(pt)
+            cells.setdefault(key, []).append(found)
+        indices.append(found)
+
+    return indices, unique_points
+
+
+def weld_vertices(vertices, faces, tol=10e-8):
+    """ Merges the coincident vertices and generates a single indexed mesh.
+
+    This function generates new :py:class:`.Vertex` and face (:py:class:`.Triangle` or :py:class:`.Quad`) instances,
+    i.e. the input vertices and faces are not modified. The faces collapsed by the welding operation and the vertices
+    not used by any face are removed.
+
+    :param vertices: list of vertices
+    :type vertices: list, tuple
+    :param faces: list of faces composed of the input vertices
+    :type faces: list, tuple
+    :param tol: distance tolerance for considering two vertices coincident
+    :type tol: float
+    :return: a tuple containing lists of welded vertices and faces
+    :rtype: tuple
+    """
+    indices, _ = weld_points([vert.data for vert in vertices], tol)
+
+    # Generate the welded vertices
+    vmap = {}
+    new_vertices = []
+    for vert, uidx in zip(vertices, indices):
+        vmap[id(vert)] = uidx
+        if uidx == len(new_vertices):
+            nvert = Vertex(*vert.data, id=uidx)
+            nvert.uv = vert.uv
+            new_vertices.append(nvert)
+
+    # Generate the faces using the welded vertices
+    new_faces = []
+    for face in faces:
+        fids = [vmap[id(vert)] for vert in face.vertices]
+        if len(set(fids)) < len(fids):
+            continue  # collapsed face
+        new_faces.append(face.__class__(*[new_vertices[fid] for fid in fids], id=len(new_faces)))
+
+    # Remove the unused vertices and fix vertex numbering
+    return fix_numbering(new_vertices, new_faces)
+
+
+def weld_mesh(mesh, tol=10e-8):
+    """ Merges the coincident vertices of the mesh.
+
+    This function generates a new :py:class:`.Mesh` instance, i.e. the input mesh is not modified. The faces collapsed
+    by the welding operation and the vertices not used by any face are removed. The surface indices of the faces are
+    preserved and the vertex normals are discarded.
+
+    :param mesh: input mesh
+    :type mesh: elements.Mesh
+    :param tol: distance tolerance for considering two vertices coincident
+    :type tol: float
+    :return: welded mesh
+    :rtype: elements.Mesh
+    """
+    indices, _ = weld_points(mesh.positions, tol)
+
+    # Generate the faces using the welded vertex indices
+    faces = []
+    surface_ids = []
+    for face, sid in zip(mesh.faces, mesh.surface_ids):
+        fids = tuple(indices[idx] for idx in face)
+        if len(set(fids)) < len(fids):
+            continue  # collapsed face
+        faces.append(fids)
+        surface_ids.append(sid)
+
+    # Find the vertices used by the faces, i.e. the first occurrences of the welded vertices
+    first = {}
+    for idx, uidx in enumerate(indices):
+        if uidx not in first:
+            first[uidx] = idx
+    used = sorted(set(fid for face in faces for fid in face))
+    vmap = {uidx: vidx for vidx, uidx in enumerate(used)}
+
+    # Generate the new mesh
+    res = Mesh()
+    res._positions = [mesh.positions[first[uidx]] for uidx in used]
+    if mesh.uvs is not None:
+        res._uvs = [mesh.uvs[first[uidx]] for uidx in used]
+    res._faces = [tuple(vmap[fid] for fid in face) for face in faces]
+    res._surface_ids = surface_ids
+    return res
+
+
+def surface_boundaries(surf):
+    """ Extracts the boundary curves of a surface.
+
+    The boundaries are ordered as u = 0, u = 1, v = 0 and v = 1. Each boundary is represented by its (weighted) control
+    points, knot vector and degree.
+
+    :param surf: surface
+    :type surf: abstract.Surface
+    :return: list of boundaries in (ctrlpts, knotvector, degree) format
+    :rtype: list
+    """
+    cpts = surf.ctrlptsw if surf.rational else surf.ctrlpts
+    size_u = surf.ctrlpts_size_u
+    size_v = surf.ctrlpts_size_v
+    return [
+        ([cpts[v] for v in range(size_v)], surf.knotvector_v, surf.degree_v),
+        ([cpts[v + (size_v * (size_u - 1))] for v in range(size_v)], surf.knotvector_v, surf.degree_v),
+        ([cpts[size_v * u] for u in range(size_u)], surf.knotvector_u, surf.degree_u),
+        ([cpts[size_v - 1 + (size_v * u)] for u in range(size_u)], surf.knotvector_u, surf.degree_u),
+    ]
+
+
+def match_boundaries(bnd1, bnd2, tol=10e-8):
+    """ Checks if two boundary curves are identical, including their parametrization.
+
+    :param bnd1: boundary 1 in (ctrlpts, knotvector, degree) format
+    :type bnd1: tuple
+    :param bnd2: boundary 2 in (ctrlpts, knotvector, degree) format
+    :type bnd2: tuple
+    :param tol: tolerance value
+    :type tol: float
+    :return: None if the boundaries do not match, otherwise a flag showing that the boundaries have opposite directions
+    :rtype: None or bool
+    """
+    cpts1, kv1, deg1 = bnd1
+    cpts2, kv2, deg2 = bnd2
+    if deg1 != deg2 or len(cpts1) != len(cpts2) or len(kv1) != len(kv2):
+        return None
+    for rev in (False, True):
+        cpts = cpts2[::-1] if rev else cpts2
+        kv = [kv2[0] + kv2[-1] - k for k in reversed(kv2)] if rev else kv2
+        if all(abs(k1 - k2) <= tol for k1, k2 in zip(kv1, kv)) and \
+                all(linalg.point_distance(p1, p2) <= tol for p1, p2 in zip(cpts1, cpts)):
+            return rev
+    return None
+
+
+def find_shared_boundaries(surfaces, tol=10e-8):
+    """ Finds the boundaries shared by the surfaces.
+
+    The candidate boundary pairs are found by welding the end points of the boundary curves, and then the candidates
+    are checked by comparing their control points and knot vectors. The boundary indices are ordered as u = 0, u = 1,
+    v = 0 and v = 1.
+
+    :param surfaces: list of surfaces
+    :type surfaces: list, tuple
+    :param tol: tolerance value
+    :type tol: float
+    :return: list of shared boundaries in ((surface 1, boundary 1), (surface 2, boundary 2), reversed) format
+    :rtype: list
+    """
+    # Extract boundaries
+    bnds = []
+    for sidx, srf in enumerate(surfaces):
+        for bidx, bnd in enumerate(surface_boundaries(srf)):
+            bnds.append((sidx, bidx, bnd))
+
+    # Group boundaries using their welded end points
+    endpts = []
+    for bnd in bnds:
+        endpts += [bnd[2][0][0], bnd[2][0][-1]]
+    indices, _ = weld_points(endpts, tol)
+    candidates = {}
+    for idx in range(len(bnds)):
+        key = tuple(sorted((indices[2 * idx], indices[2 * idx + 1])))
+        candidates.setdefault(key, []).append(idx)
+
+    # Check candidates
+    shared = []
+    for group in candidates.values():
+        for i in range(len(group)):
+            for j in range(i + 1, len(group)):
+                b1 = bnds[group[i]]
+                b2 = bnds[group[j]]
+                if b1[0] == b2[0]:
+                    continue
+                rev = match_boundaries(b1[2], b2[2], tol)
+                if rev is not None:
+                    shared.append(((b1[0], b1[1]), (b2[0], b2[1]), rev))
+    return shared
+
+
+def sample_shared_boundaries(surfaces, meshes, shared, tol=10e-8):
+    """ Evaluates the mesh vertices on the shared boundaries using a common set of boundary parameters.
+
+    The boundary parameters of both meshes on a shared boundary are merged and each parameter is evaluated once on the
+    first surface of the shared boundary pair. Therefore, the vertices corresponding to the same boundary parameter get
+    identical coordinates on both meshes. If the surfaces are sampled differently, the boundary parameters missing on a
+    mesh are inserted as new vertices by splitting the faces adjacent to the boundary, which removes the T-junctions.
+
+    The input meshes are updated in-place and they must have parametric coordinates.
+
+    :param surfaces: list of surfaces
+    :type surfaces: list, tuple
+    :param meshes: list of meshes generated from the tessellated surfaces
+    :type meshes: list, tuple
+    :param shared: list of shared boundaries generated by :func:`find_shared_boundaries`
+    :type shared: list, tuple
+    :param tol: tolerance value for finding the vertices on the boundaries
+    :type tol: float
+    """
+    # Boundary definitions on the parametric space in (fixed direction, fixed value) format
+    bnd_defs = ((0, 0.0), (0, 1.0), (1, 0.0), (1, 1.0))
+
+    def boundary_params(mesh, bidx, flip):
+        fdir, fval = bnd_defs[bidx]
+        params = {}
+        for vidx, uv in enumerate(mesh.uvs):
+            if abs(uv[fdir] - fval) <= tol:
+                t = min(max(uv[1 - fdir], 0.0), 1.0)
+                params[vidx] = 1.0 - t if flip else t
+        return params
+
+    for (sidx1, bidx1), (sidx2, bidx2), rev in shared:
+        fdir1, fval1 = bnd_defs[bidx1]
+        sides = ((meshes[sidx1], bidx1, False), (meshes[sidx2], bidx2, rev))
+        side_params = [boundary_params(mesh, bidx, flip) for mesh, bidx, flip in sides]
+
+        # Evaluate each boundary parameter once on the first surface
+        evalpts = {}
+        for params in side_params:
+            for t in params.values():
+                key = round(t, 10)
+                if key not in evalpts:
+                    uv = [fval1, fval1]
+                    uv[1 - fdir1] = t
+                    evalpts[key] = tuple(surfaces[sidx1].evaluate_single(uv))
+        common = sorted(evalpts.keys())
+
+        for (mesh, bidx, flip), params in zip(sides, side_params):
+            fdir, fval = bnd_defs[bidx]
+            for vidx, t in params.items():
+                mesh._positions[vidx] = evalpts[round(t, 10)]
+
+            # Insert the missing boundary parameters into the faces adjacent to the boundary
+            faces = []
+            surface_ids = []
+            for face, sid in zip(mesh.faces, mesh.surface_ids):
+                nv = len(face)
+                for idx in range(nv):
+                    a, b = face[idx], face[(idx + 1) % nv]
+                    if a not in params or b not in params:
+                        continue
+                    ta, tb = params[a], params[b]
+                    missing = [t for t in common if min(ta, tb) + tol < t < max(ta, tb) - tol]
+                    if not missing:
+                        continue
+                    missing.sort(reverse=ta > tb)
+                    loop = [a]
+                    for t in missing:
+                        uv = [fval, fval]
+                        uv[1 - fdir] = 1.0 - t if flip else t
+                        loop.append(len(mesh._positions))
+                        mesh._positions.append(evalpts[t])
+                        mesh._uvs.append(tuple(uv))
+                    loop += [face[(idx + j) % nv] for j in range(1, nv)]
+                    # Triangulate the face as a fan around its last vertex
+                    for j in range(len(loop) - 2):
+                        faces.append((loop[-1], loop[j], loop[j + 1]))
+                        surface_ids.append(sid)
+                    break
+                else:
+                    faces.append(face)
+                    surface_ids.append(sid)
+            mesh._faces = faces
+            mesh._surface_ids = surface_ids
+            mesh._normals = None  # vertex normals must be recomputed
+
+
+def subsample_grid(points, size_u, size_v, step):
+    """ Picks every ``step``-th point of a point grid in both parametric directions.
+
+    The grid sizes must satisfy ``(size - 1) % step == 0`` to keep the first and the last rows and columns.
+
+    :param points: points ordered as v-varies-first
+    :type points: list, tuple
+    :param size_u: number of points on the u-direction
+    :type size_u: int
+    :param size_v: number of points on the v-direction
+    :type size_v: int
+    :param step: jump value between the points
+    :type step: int
+    :return: a tuple containing the list of points and the new grid sizes on the u- and v-directions
+    :rtype: tuple
+    """
+    if (size_u - 1) % step != 0 or (size_v - 1) % step != 0:
+        raise GeomdlException("Grid cannot be subsampled with the given step", data=dict(step=step))
+    pts = [points[j + (i * size_v)] for i in range(0, size_u, step) for j in range(0, size_v, step)]
+    return pts, ((size_u - 1) // step) + 1, ((size_v - 1) // step) + 1
+
+
+def grid_deviation(points, size_u, size_v, step):
+    """ Computes the maximum distance between a point grid and its subsampled version.
+
+    Each point of the input grid is compared with the bilinear interpolation of the corners of the containing cell of
+    the subsampled grid generated by :func:`subsample_grid`.
+
+    :param points: points ordered as v-varies-first
+    :type points: list, tuple
+    :param size_u: number of points on the u-direction
+    :type size_u: int
+    :param size_v: number of points on the v-direction
+    :type size_v: int
+    :param step: jump value between the points
+    :type step: int
+    :return: maximum distance
+    :rtype: float
+    """
+    if step == 1:
+        return 0.0
+    max_dist = 0.0
+    for i in range(size_u):
+        i0 = min(i // step, ((size_u - 1) // step) - 1) * step
+        a = float(i - i0) / float(step)
+        for j in range(size_v):
+            j0 = min(j // step, ((size_v - 1) // step) - 1) * step
+            b = float(j - j0) / float(step)
+            p00 = points[j0 + (i0 * size_v)]
+            p10 = points[j0 + ((i0 + step) * size_v)]
+            p01 = points[j0 + step + (i0 * size_v)]
+            p11 = points[j0 + step + ((i0 + step) * size_v)]
+            pt = [((1.0 - a) * (1.0 - b) * c00) + (a * (1.0 - b) * c10) + ((1.0 - a) * b * c01) + (a * b * c11)
+                  for c00, c10, c01, c11 in zip(p00, p10, p01, p11)]
+            max_dist = max(max_dist, linalg.point_distance(pt, points[j + (i * size_v)]))
+    return max_dist
@@ -65,3 +65,16 @@ def export(fn):
     else:
         mod.__all__ = [fn.__name__]
     return fn
+
+
+def copy_array(arr):
+    """ Copies nested lists of numbers, e.g. control points and knot vectors, without the overhead of deepcopy.
+
+    :param arr: nested lists of numbers
+    :type arr: list, tuple
+    :return: copy of the input
+    :rtype: list
+    """
+    if arr and isinstance(arr[0], (list, tuple)):
+        return [copy_array(a) for a in arr]
+    return list(arr)
@@ -7,6 +7,8 @@
 
 """
 
+import math
+from bisect import bisect_left, bisect_right
 from functools import partial
 from . import linalg
 from ._utilities import pool_context
@@ -15,6 +17,11 @@ from .exceptions import GeomdlException
 # Initialize an empty __all__ for controlling imports
 __all__ = []
 
+# Relative offsets of the ray positions from the voxel centers in x- and y-directions. The rays are shifted by these
+# small (and different) amounts to avoid hitting the edges and the vertices of the triangles, which are usually
+# aligned with the voxel centers for the structured meshes.
+_RAY_OFFSETS = (1.4142135623730951e-6, 1.7320508075688772e-6)
+
 
 def find_inouts_st(voxel_grid, datapts, **kwargs):
     """ Single-threaded ins and outs finding (default)
@@ -46,8 +53,229 @@ def find_inouts_mp(voxel_grid, datapts, **kwargs):
     return filled
 
 
-def generate_voxel_grid(bbox, szval, use_cubes=False):
-    """ Generates the voxel grid with the desired size.
+def find_inouts_bin(voxel_ranges, datapts, **kwargs):
+    """ Single-pass ins and outs finding by binning the points into the voxels
+
+    Each point is mapped to its voxel index arithmetically, i.e. :math:`\\lfloor (p - bb_{min}) / step \\rfloor`, and
+    only the voxels around this index are checked against the padded voxel boundaries. The result is the same as
+    :func:`find_inouts_st` but the complexity is O(points) instead of O(voxels x points).
+
+    :param voxel_ranges: voxel ranges and step sizes generated by :func:`generate_voxel_ranges`
+    :param datapts: data points
+    :return: in-outs
+    """
+    ranges, _ = voxel_ranges
+    sizes = [len(rng) for rng in ranges]
+    filled = [0 for _ in range(sizes[0] * sizes[1] * sizes[2])]
+    for idx in find_filled_bin(voxel_ranges, datapts, **kwargs):
+        filled[idx] = 1
+    return filled
+
+
+def find_filled_bin(voxel_ranges, datapts, **kwargs):
+    """ Finds the indices of the filled voxels by binning the points into the voxels.
+
+    Please see :func:`find_inouts_bin` for details.
+
+    :param voxel_ranges: voxel ranges and step sizes generated by :func:`generate_voxel_ranges`
+    :param datapts: data points
+    :return: indices of the filled voxels (may contain duplicates)
+    :rtype: generator
+    """
+    tol = kwargs.get('tol', 10e-8)
+    ranges, steps = voxel_ranges
+
+    # Padded voxel boundaries in each direction, i.e. (bbmin, basis vector, squared basis vector)
+    bounds = []
+    for rng, step in zip(ranges, steps):
+        bnd = []
+        for r in rng:
+            bbmin = r - tol
+            basis = ((r + step) + tol) - bbmin
+            bnd.append((bbmin, basis, basis * basis))
+        bounds.append(bnd)
+
+    # Number of neighboring voxels to be checked in each direction
+    spans = [int(tol / step) + 1 if step > 0 else None for step in steps]
+
+    # Find the voxel indices in each direction
+    indices = [_bin_indices([pt[d] for pt in datapts], ranges[d][0], steps[d], spans[d], bounds[d]) for d in range(3)]
+
+    sizes = [len(rng) for rng in ranges]
+    for idx_u, idx_v, idx_w in zip(*indices):
+        for i in idx_u:
+            for j in idx_v:
+                offset = (i * sizes[1] + j) * sizes[2]
+                for k in idx_w:
+                    yield offset + k
+
+
+def _bin_indices(values, start, step, span, bounds):
+    """ Finds the indices of the voxels containing the values in a single direction.
+
+    :param values: coordinate values
+    :param start: minimum coordinate of the first voxel
+    :param step: step size
+    :param span: number of neighboring voxels to be checked
+    :param bounds: padded voxel boundaries
+    :return: voxel indices for each value
+    """
+    floor = math.floor
+    size = len(bounds)
+    res = []
+    for val in values:
+        if span is None:
+            lo, hi = 0, size
+        else:
+            center = int(floor((val - start) / step))
+            lo = center - span if center > span else 0
+            hi = center + span + 1 if center + span + 1 < size else size
+        # Use the same comparison as is_point_inside_voxel
+        res.append([i for i in range(lo, hi) if bounds[i][2] > (val - bounds[i][0]) * bounds[i][1] >= 0.0])
+    return res
+
+
+def find_inouts_parity(voxel_ranges, triangles, **kwargs):
+    """ Ins and outs finding by ray parity for closed shells
+
+    Please see :func:`find_inouts_parity_rows` for details.
+
+    :param voxel_ranges: voxel ranges and step sizes generated by :func:`generate_voxel_ranges`
+    :param triangles: shell triangles as lists of 3 points
+    :return: in-outs
+    """
+    filled = []
+    for row in find_inouts_parity_rows(voxel_ranges, triangles, **kwargs):
+        filled += row
+    return filled
+
+
+def find_inouts_parity_rows(voxel_ranges, triangles, **kwargs):
+    """ Row-by-row ins and outs finding by ray parity for closed shells
+
+    A ray is cast in z-direction through the center of each voxel column and the intersections with the shell
+    triangles are computed. A voxel is filled if its center has an odd number of intersections below it, i.e. the
+    voxel center is inside the shell. The rows of voxels in x-direction are processed in parallel, if ``num_procs`` is
+    bigger than 1.
+
+    :param voxel_ranges: voxel ranges and step sizes generated by :func:`generate_voxel_ranges`
+    :param triangles: shell triangles as lists of 3 points
+    :return: in-outs of the rows of voxels in x-direction
+    :rtype: generator
+    """
+    num_procs = kwargs.get('num_procs', 1)
+    ranges, steps = voxel_ranges
+
+    # Ray positions in x- and y-directions and voxel centers in z-direction
+    pos_x = [r + steps[0] * (0.5 + _RAY_OFFSETS[0]) for r in ranges[0]]
+    pos_y = [r + steps[1] * (0.5 + _RAY_OFFSETS[1]) for r in ranges[1]]
+    pos_z = [r + steps[2] * 0.5 for r in ranges[2]]
+
+    # Find the triangles crossing the rows
+    rows = [[] for _ in range(len(pos_x))]
+    for tri in triangles:
+        xs = [pt[0] for pt in tri]
+        for i in range(bisect_left(pos_x, min(xs)), bisect_right(pos_x, max(xs))):
+            rows[i].append(tri)
+
+    # Find in-outs row by row
+    if num_procs > 1:
+        with pool_context(processes=num_procs) as pool:
+            for res in pool.imap(partial(find_inouts_row, pos_y=pos_y, pos_z=pos_z), zip(pos_x, rows)):
+                yield res
+    else:
+        for row in zip(pos_x, rows):
+            yield find_inouts_row(row, pos_y, pos_z)
+
+
+def find_inouts_row(row, pos_y, pos_z):
+    """ Finds the ins and outs of a row of voxels by ray parity.
+
+    .. note:: Helper function required for ``multiprocessing``
+
+    :param row: ray position in x-direction and the triangles crossing the row
+    :type row: tuple
+    :param pos_y: ray positions in y-direction
+    :type pos_y: list
+    :param pos_z: voxel centers in z-direction
+    :type pos_z: list
+    :return: in-outs of the row
+    :rtype: list
+    """
+    px, triangles = row
+
+    # Find the z-coordinates of the ray-triangle intersections for each column
+    hits = [[] for _ in range(len(pos_y))]
+    for tri in triangles:
+        (x0, y0, z0), (x1, y1, z1), (x2, y2, z2) = tri
+        det = (y1 - y2) * (x0 - x2) + (x2 - x1) * (y0 - y2)
+        if det == 0:
+            continue  # triangle is parallel to the rays
+        ys = (y0, y1, y2)
+        for j in range(bisect_left(pos_y, min(ys)), bisect_right(pos_y, max(ys))):
+            py = pos_y[j]
+            # Barycentric coordinates of the ray position on the projected triangle
+            a = ((y1 - y2) * (px - x2) + (x2 - x1) * (py - y2)) / det
+            b = ((y2 - y0) * (px - x2) + (x0 - x2) * (py - y2)) / det
+            c = 1.0 - a - b
+            if a >= 0.0 and b >= 0.0 and c >= 0.0:
+                hits[j].append(a * z0 + b * z1 + c * z2)
+
+    # Voxel center is inside the shell, if there is an odd number of intersections below the center
+    filled = []
+    for col in hits:
+        col.sort()
+        filled += [bisect_left(col, pz) % 2 for pz in pos_z]
+    return filled
+
+
+def shell_triangles(obj):
+    """ Generates the triangles of the closed shell bounding the input geometry.
+
+    The shell of the surfaces is generated by tessellating the surfaces. The shell of a volume is generated from the
+    evaluated points on the boundary faces of the volume.
+
+    :param obj: input surface(s) or volume
+    :type obj: abstract.Surface, multi.SurfaceContainer or abstract.Volume
+    :return: list of triangles as lists of 3 points
+    :rtype: list
+    """
+    if obj.pdimension == 2:
+        mesh = obj.mesh
+        pts = mesh.positions
+        return [[pts[face[0]], pts[face[idx]], pts[face[idx + 1]]]
+                for face in mesh.faces for idx in range(1, len(face) - 1)]
+
+    if obj.pdimension != 3:
+        raise GeomdlException("Can only generate the shell of surfaces and volumes")
+
+    # Boundary faces of the evaluated points grid
+    pts = obj.evalpts
+    su, sv, sw = obj.sample_size_u, obj.sample_size_v, obj.sample_size_w
+    quads = []
+    for i in (0, su - 1):
+        quads += [(i, j, k, 0, 1, 1) for j in range(sv - 1) for k in range(sw - 1)]
+    for j in (0, sv - 1):
+        quads += [(i, j, k, 1, 0, 1) for i in range(su - 1) for k in range(sw - 1)]
+    for k in (0, sw - 1):
+        quads += [(i, j, k, 1, 1, 0) for i in range(su - 1) for j in range(sv - 1)]
+
+    triangles = []
+    for i, j, k, di, dj, dk in quads:
+        # Find the corners of the quad spanning the 2 directions with non-zero increments
+        if di == 0:
+            corners = [(i, j, k), (i, j + 1, k), (i, j + 1, k + 1), (i, j, k + 1)]
+        elif dj == 0:
+            corners = [(i, j, k), (i + 1, j, k), (i + 1, j, k + 1), (i, j, k + 1)]
+        else:
+            corners = [(i, j, k), (i + 1, j, k), (i + 1, j + 1, k), (i, j + 1, k)]
+        p = [pts[(ci * sv + cj) * sw + ck] for ci, cj, ck in corners]
+        triangles += [[p[0], p[1], p[2]], [p[0], p[2], p[3]]]
+    return triangles
+
+
+def generate_voxel_ranges(bbox, szval, use_cubes=False):
+    """ Generates the minimum coordinates of the voxels and the step sizes in x-, y-, z-directions.
 
     :param bbox: bounding box
     :type bbox: list, tuple
@@ -55,8 +283,8 @@ def generate_voxel_grid(bbox, szval, use_cubes=False):
     :type szval: list, tuple
     :param use_cubes: use cube voxels instead of cuboid ones
     :type use_cubes: bool
-    :return: voxel grid
-    :rtype: list
+    :return: a tuple containing the list of ranges and the list of step sizes
+    :rtype: tuple
     """
     # Input validation
     if szval[0] <= 1 or szval[1] <= 1 or szval[2] <= 1:
@@ -73,6 +301,24 @@ def generate_voxel_grid(bbox, szval, use_cubes=False):
     # Find range in each direction
     ranges = [list(linalg.frange(bbox[0][idx], bbox[1][idx], steps[idx])) for idx in range(0, 3)]
 
+    return ranges, steps
+
+
+def generate_voxel_grid(bbox, szval, use_cubes=False):
+    """ Generates the voxel grid with the desired size.
+
+    :param bbox: bounding box
+    :type bbox: list, tuple
+    :param szval: size in x-, y-, z-directions
+    :type szval: list, tuple
+    :param use_cubes: use cube voxels instead of cuboid ones
+    :type use_cubes: bool
+    :return: voxel grid
+    :rtype: list
+    """
+    # Find ranges and step sizes
+    ranges, steps = generate_voxel_ranges(bbox, szval, use_cubes)
+
     voxel_grid = []
     for u in ranges[0]:
         for v in ranges[1]:
@@ -83,6 +329,33 @@ def generate_voxel_grid(bbox, szval, use_cubes=False):
     return voxel_grid
 
 
+def bb_to_faces(bb):
+    """ Converts a voxel defined by its min and max coordinates to a voxel defined by faces.
+
+    :param bb: bounding box of the voxel
+    :type bb: list, tuple
+    :return: faces of the voxel
+    :rtype: list
+    """
+    # Vertices
+    p1 = bb[0]
+    p2 = [bb[1][0], bb[0][1], bb[0][2]]
+    p3 = [bb[1][0], bb[1][1], bb[0][2]]
+    p4 = [bb[0][0], bb[1][1], bb[0][2]]
+    p5 = [bb[0][0], bb[0][1], bb[1][2]]
+    p6 = [bb[1][0], bb[0][1], bb[1][2]]
+    p7 = bb[1]
+    p8 = [bb[0][0], bb[1][1], bb[1][2]]
+    # Faces
+    fb = [p1, p2, p3, p4]  # bottom face
+    ft = [p5, p6, p7, p8]  # top face
+    fs1 = [p1, p2, p6, p5]  # side face 1
+    fs2 = [p2, p3, p7, p6]  # side face 2
+    fs3 = [p3, p4, p8, p7]  # side face 3
+    fs4 = [p1, p4, p8, p5]  # side face 4
+    return [fb, fs1, fs2, fs3, fs4, ft]
+
+
 def is_point_inside_voxel(bbox, ptsarr, **kwargs):
     """ Finds if any point is contained inside the voxel boundaries (inouts array).
 
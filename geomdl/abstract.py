@@ -13,6 +13,8 @@ import warnings
 import math
 from . import vis, helpers, knotvector, voxelize, utilities
 from . import tessellate
+from . import _tessellate as tsl
+from . import _operations as ops
 from .evaluators import AbstractEvaluator
 from .exceptions import GeomdlException
 from . import _utilities as utl
@@ -218,13 +220,58 @@ class Geometry(GeomdlBase):
     * ``id``: object ID (as integer)
     * ``precision``: number of decimal places to round to. *Default: 18*
     """
-    # __slots__ = ('_iter_index', '_array_type', '_eval_points')
+    # __slots__ = ('_iter_index', '_array_type', '_eval_points', '_cow_buffers', '_cow_exposed')
+    _cow_attrs = ('_eval_points',)  # buffers shared with the copies until they are exposed for update
 
     def __init__(self, **kwargs):
         self._geometry_type = "default" if not hasattr(self, '_geometry_type') else self._geometry_type  # geometry type
         super(Geometry, self).__init__(**kwargs)
         self._array_type = list if not hasattr(self, '_array_type') else self._array_type  # array storage type
         self._eval_points = self._init_array()  # evaluated points
+        self._cow_buffers = dict()  # buffers shared with the copy-on-write copies
+        self._cow_exposed = set()  # buffers returned by the getters, which can be updated via the references
+
+    def __copy__(self):
+        # Share the buffers with the copy and materialize them on the first write access (copy-on-write)
+        result = super(Geometry, self).__copy__()
+        result._cache = dict()
+        result._opt_data = dict(self._opt_data)
+        result._cow_buffers = dict()
+        result._cow_exposed = set()
+        for attr in self._cow_attrs:
+            buffer = getattr(self, attr)
+            if attr in self._cow_exposed:
+                # The references returned before the copy can still update the buffer
+                setattr(result, attr, utl.copy_array(buffer))
+            else:
+                self._cow_buffers[attr] = buffer
+                result._cow_buffers[attr] = buffer
+        return result
+
+    def __deepcopy__(self, memo):
+        # Call parent method
+        result = super(Geometry, self).__deepcopy__(memo)
+        # Deep copies don't share any buffers
+        result._cow_buffers = dict()
+        result._cow_exposed = set()
+        return result
+
+    def _cow_materialize(self, attr, expose=True):
+        """ Copies the buffer if it is shared with a copy-on-write copy, so that it can be updated safely.
+
+        The getters mark the buffer as exposed, since the caller may keep a reference to it. The exposed buffers are
+        copied, instead of being shared, when the geometry is copied.
+
+        :param attr: attribute name of the buffer
+        :type attr: str
+        :param expose: if True, the buffer is returned to the caller
+        :type expose: bool
+        """
+        buffer = getattr(self, attr)
+        if self._cow_buffers.pop(attr, None) is buffer:
+            setattr(self, attr, utl.copy_array(buffer))
+        if expose:
+            self._cow_exposed.add(attr)
 
     def __iter__(self):
         self._iter_index = 0
@@ -263,6 +310,7 @@ class Geometry(GeomdlBase):
         """
         if self._eval_points is None or len(self._eval_points) == 0:
             self.evaluate()
+        self._cow_materialize('_eval_points')
         return self._eval_points
 
     @abc.abstractmethod
@@ -310,6 +358,7 @@ class SplineGeometry(Geometry):
     #     '_pdim', '_dinit', '_rational', '_degree', '_knot_vector', '_control_points', '_control_points_size',
     #     '_delta', '_bounding_box', '_evaluator', '_vis_component', '_span_func', '_kv_normalize'
     # )
+    _cow_attrs = ('_eval_points', '_knot_vector', '_control_points')
 
     def __init__(self, **kwargs):
         self._geometry_type = "spline" if not hasattr(self, '_geometry_type') else self._geometry_type  # geometry type
@@ -328,6 +377,16 @@ class SplineGeometry(Geometry):
         self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)  # default "find_span" function
         self._kv_normalize = kwargs.get('normalize_kv', True)  # flag to control knot vector normalization
 
+    def __copy__(self):
+        # Call parent method
+        result = super(SplineGeometry, self).__copy__()
+        # Copy the small containers which are updated in-place
+        result._degree = list(self._degree)
+        result._control_points_size = list(self._control_points_size)
+        result._delta = list(self._delta)
+        result._vis_component = copy.deepcopy(self._vis_component)
+        return result
+
     def __eq__(self, other):
         if not hasattr(other, '_pdim'):
             return False
@@ -456,6 +515,7 @@ class SplineGeometry(Geometry):
         :setter: Sets the knot vector
         :type: list
         """
+        self._cow_materialize('_knot_vector')
         return self._knot_vector
 
     @knotvector.setter
@@ -473,6 +533,7 @@ class SplineGeometry(Geometry):
         :setter: Sets the control points
         :type: list
         """
+        self._cow_materialize('_control_points')
         return self._control_points
 
     @ctrlpts.setter
@@ -798,6 +859,7 @@ class Curve(SplineGeometry):
         :setter: Sets the knot vector
         :type: list
         """
+        self._cow_materialize('_knot_vector')
         return self._knot_vector[0]
 
     @knotvector.setter
@@ -813,6 +875,7 @@ class Curve(SplineGeometry):
         self.reset(evalpts=True)
 
         # Set knot vector
+        self._cow_materialize('_knot_vector', expose=False)
         self._knot_vector[0] = knotvector.normalize(value, decimals=self._precision) if self._kv_normalize else value
 
     @property
@@ -826,6 +889,7 @@ class Curve(SplineGeometry):
         :setter: Sets the control points
         :type: list
         """
+        self._cow_materialize('_control_points')
         return self._control_points
 
     @ctrlpts.setter
@@ -928,9 +992,11 @@ class Curve(SplineGeometry):
 
     def reverse(self):
         """ Reverses the curve """
+        self.reset(evalpts=True)
         self._control_points = list(reversed(self._control_points))
         max_k = self.knotvector[-1]
         new_kv = [max_k - k for k in self.knotvector]
+        self._cow_materialize('_knot_vector', expose=False)
         self._knot_vector[0] = list(reversed(new_kv))
         self.reset(evalpts=True)
 
@@ -1082,6 +1148,11 @@ class Curve(SplineGeometry):
         if reset_evalpts:
             self._eval_points = self._init_array()
 
+        # Delete the arc length table and the hodographs
+        if reset_ctrlpts or reset_evalpts:
+            self._cache.pop('arc_length_table', None)
+            self._cache.pop('hodographs', None)
+
     # Checks whether the curve evaluation is possible or not
     def _check_variables(self):
         works = True
@@ -1165,6 +1236,39 @@ class Curve(SplineGeometry):
             if not utilities.check_params([u]):
                 raise GeomdlException("Parameters should be between 0 and 1")
 
+    def project(self, points, **kwargs):
+        """ Finds the parameters of the closest points on the curve to the input points (point inversion).
+
+        The curve is evaluated on a coarse grid of parameters and the evaluated points are indexed in a uniform grid.
+        For each input point, the parameter of the nearest evaluated point is used as the initial guess and it is
+        refined using Newton iteration on the curve derivatives. Please refer to the Section 6.1 of The NURBS Book
+        (2nd Edition), pp.229-232 for details.
+
+        .. code-block:: python
+            :linenos:
+
+            # Find the parameters and the closest points on the curve
+            params = curve.project(points)
+            closest_points = curve.evaluate_list(params)
+
+        Keyword Arguments:
+            * ``sample_size``: number of the initial guesses. *Default: 10 times the number of control points*
+            * ``tol``: tolerance for the distance and the zero cosine checks. *Default: 10e-8*
+            * ``max_iter``: maximum number of Newton iterations. *Default: 20*
+
+        :param points: a single point or a list of points
+        :type points: list, tuple
+        :return: a parameter or a list of parameters
+        :rtype: float or list
+        """
+        # Check all variables are set before the curve evaluation
+        self._check_variables()
+
+        # Single point input
+        if isinstance(points[0], (int, float)):
+            return ops.project_curve(self, [points], **kwargs)[0]
+        return ops.project_curve(self, points, **kwargs)
+
 
 @utl.add_metaclass(abc.ABCMeta)
 class Surface(SplineGeometry):
@@ -1231,6 +1335,13 @@ class Surface(SplineGeometry):
         self._tsl_component = None  # tessellation component
         self._trims = self._init_array()  # trimming curves
 
+    def __copy__(self):
+        # Call parent method
+        result = super(Surface, self).__copy__()
+        result._tsl_component = copy.deepcopy(self._tsl_component)
+        result._trims = list(self._trims)
+        return result
+
     @property
     def order_u(self):
         """ Order for the u-direction.
@@ -1340,6 +1451,7 @@ class Surface(SplineGeometry):
         :setter: Sets the knot vector
         :type: list
         """
+        self._cow_materialize('_knot_vector')
         return self._knot_vector
 
     @knotvector.setter
@@ -1363,6 +1475,7 @@ class Surface(SplineGeometry):
         :setter: Sets knot vector for the u-direction
         :type: list
         """
+        self._cow_materialize('_knot_vector')
         return self._knot_vector[0]
 
     @knotvector_u.setter
@@ -1378,6 +1491,7 @@ class Surface(SplineGeometry):
         self.reset(evalpts=True)
 
         # Set knot vector
+        self._cow_materialize('_knot_vector', expose=False)
         self._knot_vector[0] = knotvector.normalize(value, decimals=self._precision) if self._kv_normalize else value
 
     @property
@@ -1394,6 +1508,7 @@ class Surface(SplineGeometry):
         :setter: Sets knot vector for the v-direction
         :type: list
         """
+        self._cow_materialize('_knot_vector')
         return self._knot_vector[1]
 
     @knotvector_v.setter
@@ -1409,6 +1524,7 @@ class Surface(SplineGeometry):
         self.reset(evalpts=True)
 
         # Set knot vector
+        self._cow_materialize('_knot_vector', expose=False)
         self._knot_vector[1] = knotvector.normalize(value, decimals=self._precision) if self._kv_normalize else value
 
     @property
@@ -1427,6 +1543,7 @@ class Surface(SplineGeometry):
         :setter: Sets the control points
         :type: list
         """
+        self._cow_materialize('_control_points')
         return self._control_points
 
     @ctrlpts.setter
@@ -1735,6 +1852,22 @@ class Surface(SplineGeometry):
             self.tessellate()
         return self.tessellator.faces
 
+    @property
+    def mesh(self):
+        """ Vertices and faces generated by the tessellation operation as a structure of arrays.
+
+        Please see :py:class:`.elements.Mesh` for details. If the tessellation component is set to None, the result will
+        be None.
+
+        :getter: Gets the mesh
+        :type: elements.Mesh
+        """
+        if self.tessellator is None:
+            return None
+        if not self.tessellator.is_tessellated():
+            self.tessellate()
+        return self.tessellator.mesh
+
     @property
     def trims(self):
         """ Curves for trimming the surface.
@@ -1989,7 +2122,18 @@ class Surface(SplineGeometry):
     def tessellate(self, **kwargs):
         """ Tessellates the surface.
 
-        Keyword arguments are directly passed to the tessellation component.
+        Keyword arguments are directly passed to the tessellation component. The default tessellation components,
+        :class:`.tessellate.TriangularTessellate` and :class:`.tessellate.TrimTessellate`, accept the following keyword
+        arguments for tessellating a single surface concurrently:
+
+        * ``num_procs``: number of concurrent processes for tessellating the tiles of the grid. *Default: 1*
+        * ``tile_size``: number of quad elements on each side of a tile. *Default: 32*
+
+        .. code-block:: python
+            :linenos:
+
+            # Split the surface grid into tiles and tessellate them using 4 processes
+            surf.tessellate(num_procs=4, tile_size=16)
         """
         # Keyword arguments
         force_tessellate = kwargs.pop('force', False)  # force re-tessellation
@@ -2015,6 +2159,87 @@ class Surface(SplineGeometry):
                 continue
             self._tsl_component.vertices[idx].data = self.evaluate_single(uv)
 
+    def tessellate_lod(self, **kwargs):
+        """ Generates a level-of-detail (LOD) pyramid of tessellated meshes.
+
+        The surface is evaluated once on the finest grid and the coarser levels are generated by halving the number of
+        the evaluated points on both parametric directions. Therefore, the sample size of the finest level is the
+        sample size of the surface rounded up to the next value that can be halved ``num_levels - 1`` times.
+        Each level is tessellated using a new instance of the tessellation component of the surface.
+
+        The return value is a list of dicts ordered from the finest to the coarsest level. Each dict contains the
+        following keys:
+
+        * ``vertices``: vertices generated by the tessellation component
+        * ``faces``: faces generated by the tessellation component
+        * ``sample_size``: sample size of the level on the u- and v-directions
+        * ``error``: maximum distance between the finest evaluated points and the grid of the level
+
+        Keyword Arguments:
+            * ``num_levels``: number of levels in the pyramid. *Default: 4*
+
+        Remaining keyword arguments are directly passed to the tessellation component. Please see
+        :func:`.tessellate.select_lod` for selecting a level using the geometric or the screen-space error.
+
+        :return: list of levels
+        :rtype: list
+        """
+        num_levels = int(kwargs.pop('num_levels', 4))
+        if num_levels < 1:
+            raise GeomdlException("Number of levels should be bigger than zero")
+
+        # Check all parameters are set before the evaluation
+        self._check_variables()
+
+        # Remove duplicate elements from the kwargs dictionary
+        kwlist = ["size_u", "size_v", "trims", "force"]
+        for kw in kwlist:
+            if kw in kwargs:
+                kwargs.pop(kw)
+
+        # Find the sample size of the finest level
+        step = 2 ** (num_levels - 1)
+        sample_size = [int(math.ceil((sz - 1) / float(step))) * step + 1
+                       for sz in (max(self.sample_size_u, 2), max(self.sample_size_v, 2))]
+
+        # Evaluate the finest level
+        datadict = self.data
+        datadict['sample_size'] = sample_size
+        evalpts = self._evaluator.evaluate(datadict,
+                                           start=(self.knotvector_u[self.degree_u],
+                                                  self.knotvector_v[self.degree_v]),
+                                           stop=(self.knotvector_u[-(self.degree_u + 1)],
+                                                 self.knotvector_v[-(self.degree_v + 1)]))
+
+        levels = []
+        for lvl in range(num_levels):
+            # Generate the grid of the level from the finest evaluated points
+            lstep = 2 ** lvl
+            pts, size_u, size_v = tsl.subsample_grid(evalpts, sample_size[0], sample_size[1], lstep)
+
+            # Tessellate the level
+            tsl_comp = self._tsl_component.__class__()
+            tsl_comp.arguments = self._tsl_component.arguments
+            tsl_comp.tessellate(pts, size_u=size_u, size_v=size_v, trims=self.trims, **kwargs)
+
+            # Evaluate the vertices which are not on the grid (e.g. generated by trimming)
+            for vert in tsl_comp.vertices:
+                ugrid = vert.uv[0] * (size_u - 1)
+                vgrid = vert.uv[1] * (size_v - 1)
+                if abs(ugrid - round(ugrid)) < 10e-8 and abs(vgrid - round(vgrid)) < 10e-8:
+                    continue
+                if self._kv_normalize and not utilities.check_params(vert.uv):
+                    continue
+                vert.data = self.evaluate_single(vert.uv)
+
+            levels.append(dict(
+                vertices=tsl_comp.vertices,
+                faces=tsl_comp.faces,
+                sample_size=(size_u, size_v),
+                error=tsl.grid_deviation(evalpts, sample_size[0], sample_size[1], lstep)
+            ))
+        return levels
+
     def reset(self, **kwargs):
         """ Resets control points and/or evaluated points.
 
@@ -2035,6 +2260,10 @@ class Surface(SplineGeometry):
         if reset_evalpts:
             self._eval_points = self._init_array()
 
+        # Delete the hodographs
+        if reset_ctrlpts or reset_evalpts:
+            self._cache.pop('hodographs', None)
+
         # Reset vertices and triangles
         self._tsl_component.reset()
 
@@ -2129,6 +2358,40 @@ class Surface(SplineGeometry):
             if not utilities.check_params([u, v]):
                 raise GeomdlException("Parameters should be between 0 and 1")
 
+    def project(self, points, **kwargs):
+        """ Finds the parameters of the closest points on the surface to the input points (point inversion).
+
+        The surface is evaluated on a coarse grid of parameters and the evaluated points are indexed in a uniform grid.
+        For each input point, the parameters of the nearest evaluated point are used as the initial guess and they are
+        refined using Newton iteration on the surface derivatives. Please refer to the Section 6.1 of The NURBS Book
+        (2nd Edition), pp.232-234 for details.
+
+        .. code-block:: python
+            :linenos:
+
+            # Find the parameters and the closest points on the surface
+            params = surf.project(points)
+            closest_points = surf.evaluate_list(params)
+
+        Keyword Arguments:
+            * ``sample_size``: number of the initial guesses on the u- and v-directions. *Default: 5 times the
+              number of control points*
+            * ``tol``: tolerance for the distance and the zero cosine checks. *Default: 10e-8*
+            * ``max_iter``: maximum number of Newton iterations. *Default: 20*
+
+        :param points: a single point or a list of points
+        :type points: list, tuple
+        :return: (u, v) parameters or a list of (u, v) parameters
+        :rtype: list
+        """
+        # Check all variables are set before the evaluation
+        self._check_variables()
+
+        # Single point input
+        if isinstance(points[0], (int, float)):
+            return ops.project_surface(self, [points], **kwargs)[0]
+        return ops.project_surface(self, points, **kwargs)
+
 
 @utl.add_metaclass(abc.ABCMeta)
 class Volume(SplineGeometry):
@@ -2189,6 +2452,12 @@ class Volume(SplineGeometry):
         super(Volume, self).__init__(**kwargs)
         self._trims = self._init_array()  # trimming surfaces
 
+    def __copy__(self):
+        # Call parent method
+        result = super(Volume, self).__copy__()
+        result._trims = list(self._trims)
+        return result
+
     @property
     def order_u(self):
         """ Order for the u-direction.
@@ -2341,6 +2610,7 @@ class Volume(SplineGeometry):
         :setter: Sets the knot vector
         :type: list
         """
+        self._cow_materialize('_knot_vector')
         return self._knot_vector
 
     @knotvector.setter
@@ -2365,6 +2635,7 @@ class Volume(SplineGeometry):
         :setter: Sets knot vector for the u-direction
         :type: list
         """
+        self._cow_materialize('_knot_vector')
         return self._knot_vector[0]
 
     @knotvector_u.setter
@@ -2380,6 +2651,7 @@ class Volume(SplineGeometry):
         self.reset(evalpts=True)
 
         # Set knot vector
+        self._cow_materialize('_knot_vector', expose=False)
         self._knot_vector[0] = knotvector.normalize(value, decimals=self._precision) if self._kv_normalize else value
 
     @property
@@ -2396,6 +2668,7 @@ class Volume(SplineGeometry):
         :setter: Sets knot vector for the v-direction
         :type: list
         """
+        self._cow_materialize('_knot_vector')
         return self._knot_vector[1]
 
     @knotvector_v.setter
@@ -2411,6 +2684,7 @@ class Volume(SplineGeometry):
         self.reset(evalpts=True)
 
         # Set knot vector
+        self._cow_materialize('_knot_vector', expose=False)
         self._knot_vector[1] = knotvector.normalize(value, decimals=self._precision) if self._kv_normalize else value
 
     @property
@@ -2427,6 +2701,7 @@ class Volume(SplineGeometry):
         :setter: Sets knot vector for the w-direction
         :type: list
         """
+        self._cow_materialize('_knot_vector')
         return self._knot_vector[2]
 
     @knotvector_w.setter
@@ -2442,6 +2717,7 @@ class Volume(SplineGeometry):
         self.reset(evalpts=True)
 
         # Set knot vector
+        self._cow_materialize('_knot_vector', expose=False)
         self._knot_vector[2] = knotvector.normalize(value, decimals=self._precision) if self._kv_normalize else value
 
     @property
@@ -2455,6 +2731,7 @@ class Volume(SplineGeometry):
         :setter: Sets the control points
         :type: list
         """
+        self._cow_materialize('_control_points')
         return self._control_points
 
     @ctrlpts.setter
@@ -3020,9 +3297,9 @@ class Volume(SplineGeometry):
 
         # Add evaluated points as voxels
         if self._vis_component.mconf['evalpts'] == 'voxels':
-            grid, filled = voxelize.voxelize(self, **kwargs)
-            faces = voxelize.convert_bb_to_faces(grid)
-            self._vis_component.add(ptsarr=[grid, faces, filled], name=self.name, color=evalcolor, plot_type='evalpts')
+            kwargs['compact'] = True
+            vgrid = voxelize.voxelize(self, **kwargs)[0]
+            self._vis_component.add(ptsarr=vgrid, name=self.name, color=evalcolor, plot_type='evalpts')
 
         # Bounding box
         self._vis_component.add(ptsarr=self.bbox, name="Bounding Box", color=bboxcolor, plot_type='bbox')
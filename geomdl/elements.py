@@ -13,15 +13,26 @@ from .exceptions import GeomdlException
 from . import _utilities as utl
 
 
+# Boolean flags stored in the "opt" property are kept in a bitfield. Each flag uses 2 bits, i.e. the first bit shows
+# that the flag is set and the second bit stores the flag value.
+_FLAG_BITS = dict(inside=0, trim=2, no_trim=4)
+
+
 @utl.add_metaclass(abc.ABCMeta)
 class AbstractEntity(object):
-    """ Abstract base class for all geometric entities. """
+    """ Abstract base class for all geometric entities.
+
+    The entities use ``__slots__`` to reduce the per-instance memory footprint. The trimming flags (``inside``,
+    ``trim`` and ``no_trim``) are stored in a bitfield and the dict for the custom data is only allocated on demand.
+    """
+    __slots__ = ('_name', '_id', '_flags', '_opt_data', '_data', '_iter_index')
+
     def __init__(self, *args, **kwargs):
         self._name = "entity"  # object name
         self._id = int(kwargs.get('id', 0))  # object ID
-        self._opt_data = dict()  # custom data dict
-        self._cache = {}  # cache dict
-        self._data = []  # data storage array
+        self._flags = 0  # bitfield for the boolean flags
+        self._opt_data = None  # custom data dict (initialized on demand)
+        self._data = ()  # data storage array
 
     def __cmp__(self, other):
         return (self.id > other.id) - (self.id < other.id)
@@ -70,7 +81,9 @@ class AbstractEntity(object):
     def __copy__(self):
         cls = self.__class__
         result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
+        for attr in _slot_names(cls):
+            if hasattr(self, attr):
+                setattr(result, attr, getattr(self, attr))
         return result
 
     def __deepcopy__(self, memo):
@@ -78,13 +91,20 @@ class AbstractEntity(object):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        # Don't copy the cache
-        memo[id(self._cache)] = self._cache.__new__(dict)
         # Copy all other attributes
-        for k, v in self.__dict__.items():
-            setattr(result, k, copy.deepcopy(v, memo))
+        for attr in _slot_names(cls):
+            if hasattr(self, attr):
+                setattr(result, attr, copy.deepcopy(getattr(self, attr), memo))
         return result
 
+    def __getstate__(self):
+        # Slotted classes have no __dict__ to pickle
+        return dict((attr, getattr(self, attr)) for attr in _slot_names(self.__class__) if hasattr(self, attr))
+
+    def __setstate__(self, state):
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
     def __str__(self):
         return self.name + " " + str(self.id) + " " + str(self.data)
 
@@ -155,11 +175,17 @@ class AbstractEntity(object):
             geom.opt = ["body_id", None]  # deletes "body_id"
             print(geom.opt)  # will print: {}
 
-        :getter: Gets the dict
+        The values of the trimming flags, ``inside``, ``trim`` and ``no_trim``, are stored as booleans.
+
+        :getter: Gets a copy of the dict
         :setter: Adds key and value pair to the dict
         :deleter: Deletes the contents of the dict
         """
-        return self._opt_data
+        opt_data = dict(self._opt_data) if self._opt_data else dict()
+        for key, bit in _FLAG_BITS.items():
+            if self._flags & (1 << bit):
+                opt_data[key] = bool(self._flags & (2 << bit))
+        return opt_data
 
     @opt.setter
     def opt(self, key_value):
@@ -170,14 +196,27 @@ class AbstractEntity(object):
         if not isinstance(key_value[0], str):
             raise GeomdlException("key must be string")
 
+        # Update the flags
+        if key_value[0] in _FLAG_BITS:
+            bit = _FLAG_BITS[key_value[0]]
+            self._flags &= ~(3 << bit)
+            if key_value[1] is not None:
+                self._flags |= (3 << bit) if key_value[1] else (1 << bit)
+            return
+
+        # Update the custom data
         if key_value[1] is None:
-            self._opt_data.pop(*key_value)
+            if self._opt_data:
+                self._opt_data.pop(*key_value)
         else:
+            if self._opt_data is None:
+                self._opt_data = dict()
             self._opt_data[key_value[0]] = key_value[1]
 
     @opt.deleter
     def opt(self):
-        self._opt_data = dict()
+        self._flags = 0
+        self._opt_data = None
 
     def opt_get(self, value):
         """ Safely query for the value from the :py:attr:`opt` property.
@@ -186,21 +225,40 @@ class AbstractEntity(object):
         :type value: str
         :return: the corresponding value, if the key exists. ``None``, otherwise.
         """
+        if value in _FLAG_BITS:
+            bit = _FLAG_BITS[value]
+            if self._flags & (1 << bit):
+                return bool(self._flags & (2 << bit))
+            return None
         try:
             return self._opt_data[value]
-        except KeyError:
+        except (KeyError, TypeError):
             return None
 
 
+def _slot_names(cls):
+    """ Returns the names of the slots defined in the class hierarchy.
+
+    :param cls: class
+    :return: list of slot names
+    :rtype: list
+    """
+    return [attr for c in cls.__mro__ for attr in getattr(c, '__slots__', ())]
+
+
 @utl.export
 class Vertex(AbstractEntity):
     """ 3-dimensional Vertex entity with spatial and parametric position. """
+    __slots__ = ('_uv',)
+
     def __init__(self, *args, **kwargs):
         super(Vertex, self).__init__(*args, **kwargs)
         self._name = "vertex"
-        self.data = [float(arg) for arg in args] if args else [0.0, 0.0, 0.0]  # spatial coordinates
-        self._uv = [0.0, 0.0]  # parametric coordinates
-        self._opt_data['inside'] = False  # flag for trimming
+        self._data = (0.0, 0.0, 0.0)  # spatial coordinates
+        if args:
+            self.data = args
+        self._uv = (0.0, 0.0)  # parametric coordinates
+        self._flags = 1 << _FLAG_BITS['inside']  # flag for trimming (set to False)
 
     def __nonzero__(self):
         # For Python 2 compatibility
@@ -267,7 +325,7 @@ class Vertex(AbstractEntity):
 
     @x.setter
     def x(self, value):
-        self._data[0] = float(value)
+        self._data = (float(value), self._data[1], self._data[2])
 
     @property
     def y(self):
@@ -281,7 +339,7 @@ class Vertex(AbstractEntity):
 
     @y.setter
     def y(self, value):
-        self._data[1] = float(value)
+        self._data = (self._data[0], float(value), self._data[2])
 
     @property
     def z(self):
@@ -295,7 +353,7 @@ class Vertex(AbstractEntity):
 
     @z.setter
     def z(self, value):
-        self._data[2] = float(value)
+        self._data = (self._data[0], self._data[1], float(value))
 
     @property
     def u(self):
@@ -309,7 +367,7 @@ class Vertex(AbstractEntity):
 
     @u.setter
     def u(self, value):
-        self._uv[0] = float(value)
+        self._uv = (float(value), self._uv[1])
 
     @property
     def v(self):
@@ -323,7 +381,7 @@ class Vertex(AbstractEntity):
 
     @v.setter
     def v(self, value):
-        self._uv[1] = float(value)
+        self._uv = (self._uv[0], float(value))
 
     @property
     def uv(self):
@@ -333,7 +391,7 @@ class Vertex(AbstractEntity):
         :setter: Sets the uv-component of the vertex
         :type: list, tuple
         """
-        return tuple(self._uv)
+        return self._uv
 
     @uv.setter
     def uv(self, value):
@@ -341,7 +399,7 @@ class Vertex(AbstractEntity):
             raise GeomdlException("UV data input must be a list or tuple")
         if len(value) != 2:
             raise GeomdlException("UV must have 2 components")
-        self._uv = list(value)
+        self._uv = (float(value[0]), float(value[1]))
 
     @property
     def inside(self):
@@ -364,7 +422,7 @@ class Vertex(AbstractEntity):
         :getter: Gets the 3-dimensional components
         :setter: Sets the 3-dimensional components
         """
-        return tuple(self._data)
+        return self._data
 
     @data.setter
     def data(self, value):
@@ -373,7 +431,7 @@ class Vertex(AbstractEntity):
         if len(value) != 3:
             raise GeomdlException("Vertex can only store 3 components")
         # Convert to float
-        self._data = [float(val) for val in value]
+        self._data = (float(value[0]), float(value[1]), float(value[2]))
 
 
 @utl.export
@@ -383,10 +441,12 @@ class Triangle(AbstractEntity):
     A Triangle entity stores the vertices in its data structure. :attr:`data` returns the vertex IDs and :attr:`vertices`
     return the :class:`Vertex` instances that compose the triangular structure.
     """
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Triangle, self).__init__(*args, **kwargs)
         self._name = "triangle"
-        self._opt_data['inside'] = False  # flag for trimming
+        self._flags = 1 << _FLAG_BITS['inside']  # flag for trimming (set to False)
         if args:
             self.add_vertex(*args)
 
@@ -405,7 +465,7 @@ class Triangle(AbstractEntity):
         :getter: Gets the list of vertices
         :type: tuple
         """
-        return tuple(self._data)
+        return self._data
 
     @property
     def vertices_closed(self):
@@ -492,7 +552,7 @@ class Triangle(AbstractEntity):
                 res.append(arg)
             else:
                 raise GeomdlException("Input must be a Vertex object")
-        self._data = res
+        self._data = tuple(res)
 
 
 @utl.export
@@ -502,6 +562,7 @@ class Quad(AbstractEntity):
     A Quad entity stores the vertices in its data structure. :attr:`data` returns the vertex IDs and :attr:`vertices`
     return the :class:`Vertex` instances that compose the quadrilateral structure.
     """
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         super(Quad, self).__init__(*args, **kwargs)
@@ -515,7 +576,7 @@ class Quad(AbstractEntity):
 
         :getter: Gets the vertices
         """
-        return tuple(self._data)
+        return self._data
 
     @property
     def data(self):
@@ -547,12 +608,14 @@ class Quad(AbstractEntity):
                 res.append(arg)
             else:
                 raise GeomdlException("Input must be a Vertex object")
-        self._data = res
+        self._data = tuple(res)
 
 
 @utl.export
 class Face(AbstractEntity):
     """ Representation of Face entity which is composed of triangles or quads. """
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Face, self).__init__(*args, **kwargs)
         self._name = "face"
@@ -569,7 +632,7 @@ class Face(AbstractEntity):
         :getter: Gets the list of triangles
         :type: tuple
         """
-        return tuple(self._data)
+        return self._data
 
     def add_triangle(self, *args):
         """ Adds triangles to the Face object.
@@ -582,12 +645,14 @@ class Face(AbstractEntity):
                 res.append(arg)
             else:
                 raise GeomdlException("Input must be a Triangle object")
-        self._data = res
+        self._data = tuple(res)
 
 
 @utl.export
 class Body(AbstractEntity):
     """ Representation of Body entity which is composed of faces. """
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Body, self).__init__(*args, **kwargs)
         self._name = "body"
@@ -604,7 +669,7 @@ class Body(AbstractEntity):
         :getter: Gets the list of faces
         :type: tuple
         """
-        return tuple(self._data)
+        return self._data
 
     def add_face(self, *args):
         """ Adds faces to the Body object.
@@ -617,4 +682,399 @@ class Body(AbstractEntity):
                 res.append(arg)
             else:
                 raise GeomdlException("Input must be a Face object")
-        self._data = res
+        self._data = tuple(res)
+
+
+@utl.export
+class Mesh(object):
+    """ Representation of a polygonal mesh as a structure of arrays.
+
+    Mesh stores the mesh data in flat arrays instead of a collection of :class:`Vertex`, :class:`Triangle` and
+    :class:`Quad` instances:
+
+    * :attr:`positions`: spatial coordinates of the vertices, i.e. ``[(x, y, z), ...]``
+    * :attr:`uvs`: parametric coordinates of the vertices, i.e. ``[(u, v), ...]`` (optional)
+    * :attr:`normals`: vertex normals, i.e. ``[(nx, ny, nz), ...]`` (optional)
+    * :attr:`faces`: vertex indices of the faces, i.e. ``[(i0, i1, i2), ...]`` for a triangle mesh
+    * :attr:`surface_ids`: index of the surface that generated the face, for each face
+
+    The operations, such as :py:meth:`merge`, :py:meth:`transform` and :py:meth:`compute_normals`, work on the arrays
+    directly. The following code snippet illustrates generating a mesh from a surface and exporting it:
+
+    .. code-block:: python
+        :linenos:
+
+        from geomdl import exchange
+
+        # Get the tessellated surface as a mesh
+        mesh = surf.mesh
+
+        # Compute vertex normals
+        mesh.compute_normals()
+
+        # Export the mesh
+        exchange.export_obj(mesh, "surface.obj", vertex_normals=True)
+    """
+    __slots__ = ('_name', '_positions', '_uvs', '_normals', '_faces', '_surface_ids')
+
+    def __init__(self, positions=None, faces=None, **kwargs):
+        self._name = "mesh"  # object name
+        self._positions = []  # vertex positions
+        self._uvs = None  # vertex parametric positions
+        self._normals = None  # vertex normals
+        self._faces = []  # face vertex indices
+        self._surface_ids = []  # surface index for each face
+        if positions is not None:
+            self.positions = positions
+        if faces is not None:
+            self.faces = faces
+        if kwargs.get('uvs', None) is not None:
+            self.uvs = kwargs['uvs']
+        if kwargs.get('normals', None) is not None:
+            self.normals = kwargs['normals']
+        if kwargs.get('surface_ids', None) is not None:
+            self.surface_ids = kwargs['surface_ids']
+
+    def __getstate__(self):
+        # Slotted classes have no __dict__ to pickle
+        return dict((attr, getattr(self, attr)) for attr in _slot_names(self.__class__) if hasattr(self, attr))
+
+    def __setstate__(self, state):
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    def __str__(self):
+        return self.name + " " + str(self.num_vertices) + " " + str(self.num_faces)
+
+    __repr__ = __str__
+
+    @property
+    def name(self):
+        """ Object name (as a string)
+
+        :getter: Gets the object name
+        :setter: Sets the object name
+        :type: str
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = str(value)
+
+    @property
+    def num_vertices(self):
+        """ Number of vertices
+
+        :getter: Gets the number of vertices
+        :type: int
+        """
+        return len(self._positions)
+
+    @property
+    def num_faces(self):
+        """ Number of faces
+
+        :getter: Gets the number of faces
+        :type: int
+        """
+        return len(self._faces)
+
+    @property
+    def positions(self):
+        """ Spatial coordinates of the vertices
+
+        :getter: Gets the vertex positions
+        :setter: Sets the vertex positions
+        :type: list
+        """
+        return self._positions
+
+    @positions.setter
+    def positions(self, value):
+        self._positions = [(float(pt[0]), float(pt[1]), float(pt[2])) for pt in value]
+
+    @property
+    def uvs(self):
+        """ Parametric coordinates of the vertices
+
+        :getter: Gets the parametric positions of the vertices, ``None`` if not set
+        :setter: Sets the parametric positions of the vertices
+        :type: list
+        """
+        return self._uvs
+
+    @uvs.setter
+    def uvs(self, value):
+        if value is None:
+            self._uvs = None
+            return
+        if len(value) != len(self._positions):
+            raise GeomdlException("The number of uvs must be equal to the number of vertices")
+        self._uvs = [(float(uv[0]), float(uv[1])) for uv in value]
+
+    @property
+    def normals(self):
+        """ Vertex normals
+
+        Please use :py:meth:`compute_normals` to compute the vertex normals from the faces.
+
+        :getter: Gets the vertex normals, ``None`` if not set
+        :setter: Sets the vertex normals
+        :type: list
+        """
+        return self._normals
+
+    @normals.setter
+    def normals(self, value):
+        if value is None:
+            self._normals = None
+            return
+        if len(value) != len(self._positions):
+            raise GeomdlException("The number of normals must be equal to the number of vertices")
+        self._normals = [(float(nv[0]), float(nv[1]), float(nv[2])) for nv in value]
+
+    @property
+    def faces(self):
+        """ Vertex indices of the faces
+
+        Setting the faces resets the surface indices of the faces to zero.
+
+        :getter: Gets the face vertex indices
+        :setter: Sets the face vertex indices
+        :type: list
+        """
+        return self._faces
+
+    @faces.setter
+    def faces(self, value):
+        nv = len(self._positions)
+        faces = [tuple(int(idx) for idx in face) for face in value]
+        for face in faces:
+            if len(face) < 3:
+                raise GeomdlException("A face must have at least 3 vertices", data=dict(face=face))
+            if min(face) < 0 or max(face) >= nv:
+                raise GeomdlException("Vertex index out of range", data=dict(face=face))
+        self._faces = faces
+        self._surface_ids = [0 for _ in range(len(faces))]
+
+    @property
+    def surface_ids(self):
+        """ Index of the surface that generated the face, for each face
+
+        :getter: Gets the surface indices of the faces
+        :setter: Sets the surface indices of the faces
+        :type: list
+        """
+        return self._surface_ids
+
+    @surface_ids.setter
+    def surface_ids(self, value):
+        if len(value) != len(self._faces):
+            raise GeomdlException("The number of surface indices must be equal to the number of faces")
+        self._surface_ids = [int(sid) for sid in value]
+
+    @property
+    def bbox(self):
+        """ Bounding box of the mesh
+
+        :getter: Gets the minimum and the maximum points of the bounding box
+        :type: tuple
+        """
+        if not self._positions:
+            return ()
+        coords = list(zip(*self._positions))
+        return tuple(min(c) for c in coords), tuple(max(c) for c in coords)
+
+    @classmethod
+    def from_elements(cls, vertices, faces, surface_id=0):
+        """ Generates a mesh from the vertices and the faces generated by the tessellation operation.
+
+        :param vertices: list of vertices
+        :type vertices: list, tuple
+        :param faces: list of faces, i.e. triangles or quads, composed of the input vertices
+        :type faces: list, tuple
+        :param surface_id: surface index to be assigned to the faces
+        :type surface_id: int
+        :return: mesh
+        :rtype: Mesh
+        """
+        mesh = cls()
+        mesh._positions = [vert.data for vert in vertices]
+        mesh._uvs = [vert.uv for vert in vertices]
+        # Map vertex IDs to array indices
+        vmap = {vert.id: idx for idx, vert in enumerate(vertices)}
+        try:
+            mesh._faces = [tuple(vmap[vid] for vid in face.data) for face in faces]
+        except KeyError as e:
+            raise GeomdlException("Face contains a vertex which is not in the vertex list", data=dict(id=e.args[0]))
+        mesh._surface_ids = [int(surface_id) for _ in range(len(faces))]
+        return mesh
+
+    def to_elements(self):
+        """ Generates :class:`Vertex` and face (:class:`Triangle` or :class:`Quad`) instances from the mesh.
+
+        :return: a tuple containing lists of vertices and faces
+        :rtype: tuple
+        """
+        vertices = []
+        for idx, pt in enumerate(self._positions):
+            vert = Vertex(id=idx)
+            vert._data = pt
+            if self._uvs is not None:
+                vert._uv = self._uvs[idx]
+            vertices.append(vert)
+        faces = []
+        for idx, face in enumerate(self._faces):
+            if len(face) == 3:
+                faces.append(Triangle(*[vertices[vidx] for vidx in face], id=idx))
+            elif len(face) == 4:
+                faces.append(Quad(*[vertices[vidx] for vidx in face], id=idx))
+            else:
+                raise GeomdlException("Can only convert triangles and quads", data=dict(face=face))
+        return vertices, faces
+
+    @classmethod
+    def merge(cls, *args):
+        """ Merges the input meshes into a single mesh.
+
+        The vertex indices of the faces are offset by the number of vertices of the preceding meshes and the surface
+        indices of the faces are preserved. The parametric coordinates and the vertex normals are only kept if all
+        input meshes have them.
+
+        :return: merged mesh
+        :rtype: Mesh
+        """
+        mesh = cls()
+        has_uvs = all(m.uvs is not None for m in args)
+        has_normals = all(m.normals is not None for m in args)
+        mesh._uvs = [] if has_uvs else None
+        mesh._normals = [] if has_normals else None
+        for m in args:
+            v_offset = len(mesh._positions)
+            mesh._positions += m.positions
+            if has_uvs:
+                mesh._uvs += m.uvs
+            if has_normals:
+                mesh._normals += m.normals
+            mesh._faces += [tuple(idx + v_offset for idx in face) for face in m.faces]
+            mesh._surface_ids += m.surface_ids
+        return mesh
+
+    def transform(self, matrix):
+        """ Applies the input transformation matrix to the mesh in-place.
+
+        The transformation matrix can be a 3x3 matrix (linear transformation), a 3x4 or a 4x4 matrix (affine or
+        projective transformation in homogeneous coordinates). The vertex normals, if set, are transformed using the
+        inverse transpose of the linear part of the matrix and normalized.
+
+        :param matrix: transformation matrix
+        :type matrix: list, tuple
+        :return: the transformed mesh, i.e. self
+        :rtype: Mesh
+        """
+        if len(matrix) not in (3, 4) or any(len(row) != len(matrix[0]) for row in matrix) or \
+                len(matrix[0]) not in (3, 4):
+            raise GeomdlException("Transformation matrix must be 3x3, 3x4 or 4x4", data=dict(matrix=matrix))
+        m = [[float(c) for c in row] + [0.0] * (4 - len(row)) for row in matrix]
+        if len(m) == 3:
+            m.append([0.0, 0.0, 0.0, 1.0])
+        (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23), (m30, m31, m32, m33) = m
+
+        # Transform the positions
+        if (m30, m31, m32, m33) == (0.0, 0.0, 0.0, 1.0):
+            self._positions = [(m00 * x + m01 * y + m02 * z + m03,
+                                m10 * x + m11 * y + m12 * z + m13,
+                                m20 * x + m21 * y + m22 * z + m23) for x, y, z in self._positions]
+        else:
+            res = []
+            for x, y, z in self._positions:
+                w = m30 * x + m31 * y + m32 * z + m33
+                res.append(((m00 * x + m01 * y + m02 * z + m03) / w,
+                            (m10 * x + m11 * y + m12 * z + m13) / w,
+                            (m20 * x + m21 * y + m22 * z + m23) / w))
+            self._positions = res
+
+        # Transform the normals using the cofactor matrix, i.e. the scaled inverse transpose
+        if self._normals is not None:
+            c00, c01, c02 = m11 * m22 - m12 * m21, m12 * m20 - m10 * m22, m10 * m21 - m11 * m20
+            c10, c11, c12 = m02 * m21 - m01 * m22, m00 * m22 - m02 * m20, m01 * m20 - m00 * m21
+            c20, c21, c22 = m01 * m12 - m02 * m11, m02 * m10 - m00 * m12, m00 * m11 - m01 * m10
+            sign = -1.0 if (m00 * c00 + m01 * c01 + m02 * c02) < 0 else 1.0
+            self._normals = _normalize_vectors([(c00 * x + c01 * y + c02 * z,
+                                                 c10 * x + c11 * y + c12 * z,
+                                                 c20 * x + c21 * y + c22 * z) for x, y, z in self._normals], sign)
+        return self
+
+    def face_normals(self, normalize=True):
+        """ Computes the face normals.
+
+        The face normals are computed using Newell's method, which also works for non-planar polygons. The magnitude
+        of the non-normalized face normal is twice the area of the face.
+
+        :param normalize: if True, returns the unit normal vectors
+        :type normalize: bool
+        :return: list of face normals
+        :rtype: list
+        """
+        pos = self._positions
+        res = []
+        for face in self._faces:
+            if len(face) == 3:
+                ax, ay, az = pos[face[0]]
+                bx, by, bz = pos[face[1]]
+                cx, cy, cz = pos[face[2]]
+                ux, uy, uz = bx - ax, by - ay, bz - az
+                vx, vy, vz = cx - ax, cy - ay, cz - az
+                res.append((uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx))
+            else:
+                nx = ny = nz = 0.0
+                for i in range(len(face)):
+                    x0, y0, z0 = pos[face[i - 1]]
+                    x1, y1, z1 = pos[face[i]]
+                    nx += (y0 - y1) * (z0 + z1)
+                    ny += (z0 - z1) * (x0 + x1)
+                    nz += (x0 - x1) * (y0 + y1)
+                res.append((nx, ny, nz))
+        return _normalize_vectors(res) if normalize else res
+
+    def compute_normals(self):
+        """ Computes the vertex normals from the faces and updates :attr:`normals`.
+
+        The vertex normal is the normalized sum of the normals of the faces sharing the vertex, weighted by the face
+        areas.
+
+        :return: list of vertex normals
+        :rtype: list
+        """
+        nx = [0.0 for _ in range(len(self._positions))]
+        ny = [0.0 for _ in range(len(self._positions))]
+        nz = [0.0 for _ in range(len(self._positions))]
+        for face, fn in zip(self._faces, self.face_normals(normalize=False)):
+            for idx in face:
+                nx[idx] += fn[0]
+                ny[idx] += fn[1]
+                nz[idx] += fn[2]
+        self._normals = _normalize_vectors(list(zip(nx, ny, nz)))
+        return self._normals
+
+
+def _normalize_vectors(vectors, scale=1.0):
+    """ Normalizes the input 3-dimensional vectors. Zero vectors are kept as they are.
+
+    :param vectors: list of vectors
+    :type vectors: list
+    :param scale: scaling factor to be applied after normalization
+    :type scale: float
+    :return: list of normalized vectors
+    :rtype: list
+    """
+    res = []
+    for x, y, z in vectors:
+        mag = (x * x + y * y + z * z) ** 0.5
+        if mag > 0:
+            mag = scale / mag
+            res.append((x * mag, y * mag, z * mag))
+        else:
+            res.append((0.0, 0.0, 0.0))
+    return res
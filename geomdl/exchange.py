@@ -462,7 +462,7 @@ def import_obj(file_name, **kwargs):
 
 @export
 def export_obj(surface, file_name, **kwargs):
-    """ Exports surface(s) as a .obj file.
+    """ Exports surface(s) or a mesh as a .obj file.
 
     Keyword Arguments:
         * ``vertex_spacing``: size of the triangle edge in terms of surface points sampled. *Default: 2*
@@ -471,7 +471,7 @@ def export_obj(surface, file_name, **kwargs):
         * ``update_delta``: use multi-surface evaluation delta for all surfaces. *Default: True*
 
     :param surface: surface or surfaces to be saved
-    :type surface: abstract.Surface or multi.SurfaceContainer
+    :type surface: abstract.Surface, multi.SurfaceContainer or elements.Mesh
     :param file_name: name of the output file
     :type file_name: str
     :raises GeomdlException: an error occurred writing the file
@@ -481,7 +481,7 @@ def export_obj(surface, file_name, **kwargs):
 
 
 def export_obj_str(surface, **kwargs):
-    """ Exports surface(s) as a .obj file (string).
+    """ Exports surface(s) or a mesh as a .obj file (string).
 
     Keyword Arguments:
         * ``vertex_spacing``: size of the triangle edge in terms of surface points sampled. *Default: 2*
@@ -489,91 +489,53 @@ def export_obj_str(surface, **kwargs):
         * ``parametric_vertices``: if True, then adds parameter space vertices. *Default: False*
         * ``update_delta``: use multi-surface evaluation delta for all surfaces. *Default: True*
 
+    If the input is a :py:class:`.elements.Mesh` instance, the tessellation arguments are ignored and the vertex normals
+    are computed from the faces, if the mesh does not have them.
+
     :param surface: surface or surfaces to be saved
-    :type surface: abstract.Surface or multi.SurfaceContainer
+    :type surface: abstract.Surface, multi.SurfaceContainer or elements.Mesh
     :return: contents of the .obj file generated
     :rtype: str
     """
     # Get keyword arguments
-    vertex_spacing = int(kwargs.get('vertex_spacing', 1))
     include_vertex_normal = kwargs.get('vertex_normals', False)
     include_param_vertex = kwargs.get('parametric_vertices', False)
-    update_delta = kwargs.get('update_delta', True)
 
-    # Input validity checking
-    if surface.pdimension != 2:
-        raise exch.GeomdlException("Can only export surfaces")
-    if vertex_spacing < 1:
-        raise exch.GeomdlException("Vertex spacing should be bigger than zero")
+    # Get the mesh
+    mesh = _tessellate_surfaces(surface, **kwargs)
+    if include_vertex_normal and mesh.normals is None:
+        mesh.compute_normals()
+    if include_param_vertex and mesh.uvs is None:
+        raise exch.GeomdlException("The mesh does not contain parameter space vertices")
 
     # Create the string and start adding triangulated surface points
     line = "# Generated by geomdl\n"
-    vertex_offset = 0  # count the vertices to update the face numbers correctly
 
     # Initialize lists for geometry data
-    str_v = []  # vertices
+    str_v = ["v " + str(pt[0]) + " " + str(pt[1]) + " " + str(pt[2]) + "\n" for pt in mesh.positions]  # vertices
     str_vn = []  # vertex normals
     str_vp = []  # parameter space vertices
-    str_f = []  # faces
-
-    # Loop through SurfaceContainer object
-    for srf in surface:
-        # Set surface evaluation delta
-        if update_delta:
-            srf.sample_size_u = surface.sample_size_u
-            srf.sample_size_v = surface.sample_size_v
 
-        # Tessellate surface
-        srf.tessellate(vertex_spacing=vertex_spacing)
-        vertices = srf.tessellator.vertices
-        triangles = srf.tessellator.faces
+    # Collect parameter space vertices
+    if include_param_vertex:
+        str_vp = ["vp " + str(uv[0]) + " " + str(uv[1]) + "\n" for uv in mesh.uvs]
 
-        # Collect vertices
-        for vert in vertices:
-            temp = "v " + str(vert.x) + " " + str(vert.y) + " " + str(vert.z) + "\n"
-            str_v.append(temp)
+    # Collect vertex normals
+    if include_vertex_normal:
+        str_vn = ["vn " + str(nv[0]) + " " + str(nv[1]) + " " + str(nv[2]) + "\n" for nv in mesh.normals]
 
-        # Collect parameter space vertices
-        if include_param_vertex:
-            for vert in vertices:
-                temp = "vp " + str(vert.uv[0]) + " " + str(vert.uv[1]) + "\n"
-                str_vp.append(temp)
-
-        # Compute vertex normals
-        if include_vertex_normal:
-            for vert in vertices:
-                sn = operations.normal(srf, vert.uv)
-                temp = "vn " + str(sn[1][0]) + " " + str(sn[1][1]) + " " + str(sn[1][2]) + "\n"
-                str_vn.append(temp)
-
-        # Collect faces (1-indexed)
-        for t in triangles:
-            vl = t.data
-            temp = "f " + \
-                   str(vl[0] + 1 + vertex_offset) + " " + \
-                   str(vl[1] + 1 + vertex_offset) + " " + \
-                   str(vl[2] + 1 + vertex_offset) + "\n"
-            str_f.append(temp)
-
-        # Update vertex offset
-        vertex_offset = len(str_v)
+    # Collect faces (1-indexed)
+    str_f = ["f " + " ".join(str(vidx + 1) for vidx in face) + "\n" for face in mesh.faces]
 
     # Write all collected data to the return string
-    for lv in str_v:
-        line += lv
-    for lvn in str_vn:
-        line += lvn
-    for lvp in str_vp:
-        line += lvp
-    for lf in str_f:
-        line += lf
+    line += "".join(str_v) + "".join(str_vn) + "".join(str_vp) + "".join(str_f)
 
     return line
 
 
 @export
 def export_stl(surface, file_name, **kwargs):
-    """ Exports surface(s) as a .stl file in plain text or binary format.
+    """ Exports surface(s) or a mesh as a .stl file in plain text or binary format.
 
     Keyword Arguments:
         * ``binary``: flag to generate a binary STL file. *Default: True*
@@ -581,7 +543,7 @@ def export_stl(surface, file_name, **kwargs):
         * ``update_delta``: use multi-surface evaluation delta for all surfaces. *Default: True*
 
     :param surface: surface or surfaces to be saved
-    :type surface: abstract.Surface or multi.SurfaceContainer
+    :type surface: abstract.Surface, multi.SurfaceContainer or elements.Mesh
     :param file_name: name of the output file
     :type file_name: str
     :raises GeomdlException: an error occurred writing the file
@@ -594,58 +556,53 @@ def export_stl(surface, file_name, **kwargs):
 
 
 def export_stl_str(surface, **kwargs):
-    """ Exports surface(s) as a .stl file in plain text or binary format (string).
+    """ Exports surface(s) or a mesh as a .stl file in plain text or binary format (string).
 
     Keyword Arguments:
         * ``binary``: flag to generate a binary STL file. *Default: False*
         * ``vertex_spacing``: size of the triangle edge in terms of points sampled on the surface. *Default: 1*
         * ``update_delta``: use multi-surface evaluation delta for all surfaces. *Default: False*
 
+    The polygonal faces of the mesh are split into triangles.
+
     :param surface: surface or surfaces to be saved
-    :type surface: abstract.Surface or multi.SurfaceContainer
+    :type surface: abstract.Surface, multi.SurfaceContainer or elements.Mesh
     :return: contents of the .stl file generated
     :rtype: str
     """
     binary = kwargs.get('binary', False)
-    vertex_spacing = int(kwargs.get('vertex_spacing', 1))
-    update_delta = kwargs.get('update_delta', True)
 
-    # Input validity checking
-    if surface.pdimension != 2:
-        raise exch.GeomdlException("Can only export surfaces")
-    if vertex_spacing < 1:
-        raise exch.GeomdlException("Vertex spacing should be bigger than zero")
+    # Get the mesh
+    mesh = _tessellate_surfaces(surface, **kwargs)
 
+    # Generate the triangles (as vertex positions) and their normals
+    pos = mesh.positions
     triangles_list = []
-    for srf in surface:
-        # Set surface evaluation delta
-        if update_delta:
-            srf.sample_size_u = surface.sample_size_u
-            srf.sample_size_v = surface.sample_size_v
-
-        # Tessellate surface
-        srf.tessellate(vertex_spacing=vertex_spacing)
-        triangles = srf.tessellator.faces
-
-        triangles_list += triangles
+    normals_list = []
+    for face in mesh.faces:
+        for idx in range(1, len(face) - 1):
+            tri = (pos[face[0]], pos[face[idx]], pos[face[idx + 1]])
+            vec1 = linalg.vector_generate(tri[0], tri[1])
+            vec2 = linalg.vector_generate(tri[1], tri[2])
+            triangles_list.append(tri)
+            normals_list.append(linalg.vector_cross(vec1, vec2))
 
     # Write triangle list to ASCII or  binary STL file
     if binary:
         line = b'\0' * 80  # header
         line += struct.pack('<i', len(triangles_list))  # number of triangles
-        for t in triangles_list:
-            line += struct.pack('<3f', *linalg.triangle_normal(t))  # normal
-            for v in t.vertices:
-                line += struct.pack('<3f', *v.data)  # vertices
+        for t, nvec in zip(triangles_list, normals_list):
+            line += struct.pack('<3f', *nvec)  # normal
+            for v in t:
+                line += struct.pack('<3f', *v)  # vertices
             line += b'\0\0'  # attribute byte count
     else:
         line = "solid Surface\n"
-        for t in triangles_list:
-            nvec = linalg.triangle_normal(t)
+        for t, nvec in zip(triangles_list, normals_list):
             line += "\tfacet normal " + str(nvec[0]) + " " + str(nvec[1]) + " " + str(nvec[2]) + "\n"
             line += "\t\touter loop\n"
-            for v in t.vertices:
-                line += "\t\t\tvertex " + str(v.x) + " " + str(v.y) + " " + str(v.z) + "\n"
+            for v in t:
+                line += "\t\t\tvertex " + str(v[0]) + " " + str(v[1]) + " " + str(v[2]) + "\n"
             line += "\t\tendloop\n"
             line += "\tendfacet\n"
         line += "endsolid Surface\n"
@@ -655,14 +612,14 @@ def export_stl_str(surface, **kwargs):
 
 @export
 def export_off(surface, file_name, **kwargs):
-    """ Exports surface(s) as a .off file.
+    """ Exports surface(s) or a mesh as a .off file.
 
     Keyword Arguments:
         * ``vertex_spacing``: size of the triangle edge in terms of points sampled on the surface. *Default: 1*
         * ``update_delta``: use multi-surface evaluation delta for all surfaces. *Default: True*
 
     :param surface: surface or surfaces to be saved
-    :type surface: abstract.Surface or multi.SurfaceContainer
+    :type surface: abstract.Surface, multi.SurfaceContainer or elements.Mesh
     :param file_name: name of the output file
     :type file_name: str
     :raises GeomdlException: an error occurred writing the file
@@ -672,19 +629,52 @@ def export_off(surface, file_name, **kwargs):
 
 
 def export_off_str(surface, **kwargs):
-    """ Exports surface(s) as a .off file (string).
+    """ Exports surface(s) or a mesh as a .off file (string).
 
     Keyword Arguments:
         * ``vertex_spacing``: size of the triangle edge in terms of points sampled on the surface. *Default: 1*
         * ``update_delta``: use multi-surface evaluation delta for all surfaces. *Default: True*
 
     :param surface: surface or surfaces to be saved
-    :type surface: abstract.Surface or multi.SurfaceContainer
+    :type surface: abstract.Surface, multi.SurfaceContainer or elements.Mesh
     :return: contents of the .off file generated
     :rtype: str
     """
+    # Get the mesh
+    mesh = _tessellate_surfaces(surface, **kwargs)
+
+    # Write file header
+    line = "OFF\n"
+    line += str(mesh.num_vertices) + " " + str(mesh.num_faces) + " 0\n"
+
+    # Write vertices and faces (zero-indexed)
+    line += "".join([str(pt[0]) + " " + str(pt[1]) + " " + str(pt[2]) + "\n" for pt in mesh.positions])
+    line += "".join([str(len(face)) + " " + " ".join(str(vidx) for vidx in face) + "\n" for face in mesh.faces])
+
+    return line
+
+
+def _tessellate_surfaces(surface, **kwargs):
+    """ Tessellates the surface(s) and merges the results into a single mesh.
+
+    If the input is a :py:class:`.elements.Mesh` instance, it is returned without any modification.
+
+    Keyword Arguments:
+        * ``vertex_spacing``: size of the triangle edge in terms of points sampled on the surface. *Default: 1*
+        * ``vertex_normals``: if True, then computes vertex normals on the surfaces. *Default: False*
+        * ``update_delta``: use multi-surface evaluation delta for all surfaces. *Default: True*
+
+    :param surface: surface or surfaces to be tessellated
+    :type surface: abstract.Surface, multi.SurfaceContainer or elements.Mesh
+    :return: mesh
+    :rtype: elements.Mesh
+    """
+    if isinstance(surface, elements.Mesh):
+        return surface
+
     # Get keyword arguments
     vertex_spacing = int(kwargs.get('vertex_spacing', 1))
+    include_vertex_normal = kwargs.get('vertex_normals', False)
     update_delta = kwargs.get('update_delta', True)
 
     # Input validity checking
@@ -693,14 +683,9 @@ def export_off_str(surface, **kwargs):
     if vertex_spacing < 1:
         raise exch.GeomdlException("Vertex spacing should be bigger than zero")
 
-    # Count the vertices to update the face numbers correctly
-    vertex_offset = 0
-
-    # Initialize lists for vertices, vertex normals and faces
-    str_v = []
-    str_f = []
-
-    for srf in surface:
+    # Loop through SurfaceContainer object
+    meshes = []
+    for idx, srf in enumerate(surface):
         # Set surface evaluation delta
         if update_delta:
             srf.sample_size_u = surface.sample_size_u
@@ -708,37 +693,15 @@ def export_off_str(surface, **kwargs):
 
         # Tessellate surface
         srf.tessellate(vertex_spacing=vertex_spacing)
-        vertices = srf.tessellator.vertices
-        triangles = srf.tessellator.faces
-
-        # Collect vertices
-        for vert in vertices:
-            line = str(vert.x) + " " + str(vert.y) + " " + str(vert.z) + "\n"
-            str_v.append(line)
-
-        # Collect faces (zero-indexed)
-        for t in triangles:
-            vl = t.data
-            line = "3 " + \
-                   str(vl[0] + vertex_offset) + " " + \
-                   str(vl[1] + vertex_offset) + " " + \
-                   str(vl[2] + vertex_offset) + "\n"
-            str_f.append(line)
-
-        # Update vertex offset
-        vertex_offset = len(str_v)
+        mesh = elements.Mesh.from_elements(srf.tessellator.vertices, srf.tessellator.faces, surface_id=idx)
 
-    # Write file header
-    line = "OFF\n"
-    line += str(len(str_v)) + " " + str(len(str_f)) + " 0\n"
+        # Compute vertex normals on the surface
+        if include_vertex_normal:
+            mesh.normals = [operations.normal(srf, uv)[1] for uv in mesh.uvs]
 
-    # Write all collected data to the file
-    for lv in str_v:
-        line += lv
-    for lf in str_f:
-        line += lf
+        meshes.append(mesh)
 
-    return line
+    return elements.Mesh.merge(*meshes)
 
 
 @export
@@ -9,6 +9,7 @@
 
 import warnings
 from . import abstract
+from . import elements
 from . import _exchange as exch
 from ._utilities import export
 
@@ -22,8 +23,11 @@ def export_polydata_str(obj, **kwargs):
         * ``point_type``: **ctrlpts** for control points or **evalpts** for evaluated points
         * ``tessellate``: tessellates the points (works only for surfaces)
 
+    If the input is a :py:class:`.elements.Mesh` instance, ``point_type`` and ``tessellate`` are ignored and the mesh is
+    exported as polygons.
+
     :param obj: geometry object
-    :type obj: abstract.SplineGeometry, multi.AbstractContainer
+    :type obj: abstract.SplineGeometry, multi.AbstractContainer or elements.Mesh
     :return: contents of the VTK file
     :rtype: str
     :raises GeomdlException: point type is not supported
@@ -45,22 +49,23 @@ def export_polydata_str(obj, **kwargs):
         file_title = file_title[0:255]  # slice the array into 255 characters, we will add new line character later
         warnings.warn("VTK standard restricts the file title with 256 characters. New file title is:", file_title)
 
-    # Find number of edges in a single tessellated structure
-    tsl_dim = 4 if point_type == "ctrlpts" else 3
-
     # Initialize lists
     str_p = ""
     str_v = ""
     str_f = ""
 
-    # Count number of vertices and faces
+    # Count number of vertices, faces and face indices
     v_offset = 0
     f_offset = 0
+    f_size = 0
 
     # Loop through all geometry objects
-    for o in obj:
+    for o in ([obj] if isinstance(obj, elements.Mesh) else obj):
         # Prepare data array
-        if point_type == "ctrlpts":
+        if isinstance(o, elements.Mesh):
+            tessellate = True
+            data_array = (o.positions, o.faces)
+        elif point_type == "ctrlpts":
             if tessellate and o.pdimension == 2:
                 tsl = abstract.tessellate.QuadTessellate()
                 tsl.tessellate(o.ctrlpts, size_u=o.ctrlpts_size_u, size_v=o.ctrlpts_size_v)
@@ -84,7 +89,8 @@ def export_polydata_str(obj, **kwargs):
         # Prepare polygon data
         if data_array[1]:
             for pt in data_array[1]:
-                str_f += str(tsl_dim) + " " + " ".join(str(c + v_offset) for c in pt) + "\n"
+                str_f += str(len(pt)) + " " + " ".join(str(c + v_offset) for c in pt) + "\n"
+                f_size += len(pt) + 1
             # Update face offset
             f_offset += len(data_array[1])
 
@@ -109,7 +115,7 @@ def export_polydata_str(obj, **kwargs):
 
     # Add polygon data to the file
     if tessellate:
-        line += "POLYGONS " + str(f_offset) + " " + str((tsl_dim + 1) * f_offset) + "\n"
+        line += "POLYGONS " + str(f_offset) + " " + str(f_size) + "\n"
         line += str_f
 
     # Add dataset attributes to the file
@@ -131,8 +137,11 @@ def export_polydata(obj, file_name, **kwargs):
         * ``point_type``: **ctrlpts** for control points or **evalpts** for evaluated points
         * ``tessellate``: tessellates the points (works only for surfaces)
 
+    If the input is a :py:class:`.elements.Mesh` instance, ``point_type`` and ``tessellate`` are ignored and the mesh is
+    exported as polygons.
+
     :param obj: geometry object
-    :type obj: abstract.SplineGeometry, multi.AbstractContainer
+    :type obj: abstract.SplineGeometry, multi.AbstractContainer or elements.Mesh
     :param file_name: output file name
     :type file_name: str
     :raises GeomdlException: an error occurred writing the file
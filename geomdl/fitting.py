@@ -8,8 +8,12 @@
 """
 
 import math
-from . import BSpline, helpers, linalg
-from ._utilities import export
+from bisect import bisect_right
+from functools import partial
+from itertools import islice
+from . import BSpline, helpers, linalg, knotvector, multi
+from ._utilities import export, pool_context
+from .exceptions import GeomdlException
 
 
 @export
@@ -18,6 +22,9 @@ def interpolate_curve(points, degree, **kwargs):
 
     Please refer to Algorithm A9.1 on The NURBS Book (2nd Edition), pp.369-370 for details.
 
+    The coefficient matrix is banded, so it is generated and factorized in band storage using
+    :func:`.linalg.lu_solve_banded`. The memory requirement is linear in the number of data points.
+
     Keyword Arguments:
         * ``centripetal``: activates centripetal parametrization method. *Default: False*
 
@@ -41,8 +48,8 @@ def interpolate_curve(points, degree, **kwargs):
     kv = compute_knot_vector(degree, num_points, uk)
 
     # Do global interpolation
-    matrix_a = _build_coeff_matrix(degree, kv, uk, points)
-    ctrlpts = linalg.lu_solve(matrix_a, points)
+    matrix_a, num_lower, num_upper = _build_coeff_matrix_banded(degree, kv, uk, points)
+    ctrlpts = linalg.lu_solve_banded(matrix_a, num_lower, num_upper, points)
 
     # Generate B-spline curve
     curve = BSpline.Curve()
@@ -86,18 +93,16 @@ def interpolate_surface(points, size_u, size_v, degree_u, degree_v, **kwargs):
     kv_v = compute_knot_vector(degree_v, size_v, vl)
 
     # Do global interpolation on the u-direction
+    rows = [[points[v + (size_v * u)] for u in range(size_u)] for v in range(size_v)]
     ctrlpts_r = []
-    for v in range(size_v):
-        pts = [points[v + (size_v * u)] for u in range(size_u)]
-        matrix_a = _build_coeff_matrix(degree_u, kv_u, uk, pts)
-        ctrlpts_r += linalg.lu_solve(matrix_a, pts)
+    for row in _interpolate_rows(rows, degree_u, kv_u, uk):
+        ctrlpts_r += row
 
     # Do global interpolation on the v-direction
+    rows = [[ctrlpts_r[u + (size_u * v)] for v in range(size_v)] for u in range(size_u)]
     ctrlpts = []
-    for u in range(size_u):
-        pts = [ctrlpts_r[u + (size_u * v)] for v in range(size_v)]
-        matrix_a = _build_coeff_matrix(degree_v, kv_v, vl, pts)
-        ctrlpts += linalg.lu_solve(matrix_a, pts)
+    for row in _interpolate_rows(rows, degree_v, kv_v, vl):
+        ctrlpts += row
 
     # Generate B-spline surface
     surf = BSpline.Surface()
@@ -118,9 +123,15 @@ def approximate_curve(points, degree, **kwargs):
 
     Please refer to The NURBS Book (2nd Edition), pp.410-413 for details.
 
+    The normal equations are assembled in band storage and solved using banded Cholesky factorization, which requires
+    :math:`O(r \\times p^2)` operations for :math:`r` data points. The data points can be weighted to control their
+    effect on the least squares solution, e.g. to reduce the effect of the noisy data points. The weights of the first and
+    the last data points are ignored since these points are interpolated.
+
     Keyword Arguments:
         * ``centripetal``: activates centripetal parametrization method. *Default: False*
         * ``ctrlpts_size``: number of control points. *Default: len(points) - 1*
+        * ``weights``: weights of the data points. *Default: None*
 
     :param points: data points
     :type points: list, tuple
@@ -135,9 +146,10 @@ def approximate_curve(points, degree, **kwargs):
     # Get keyword arguments
     use_centripetal = kwargs.get('centripetal', False)
     num_cpts = kwargs.get('ctrlpts_size', num_dpts - 1)
+    weights = kwargs.get('weights', None)
 
-    # Dimension
-    dim = len(points[0])
+    # Check weights
+    _check_weights(weights, num_dpts)
 
     # Get uk
     uk = compute_params_curve(points, use_centripetal)
@@ -145,59 +157,8 @@ def approximate_curve(points, degree, **kwargs):
     # Compute knot vector
     kv = compute_knot_vector2(degree, num_dpts, num_cpts, uk)
 
-    # Compute matrix N
-    matrix_n = []
-    for i in range(1, num_dpts - 1):
-        m_temp = []
-        for j in range(1, num_cpts - 1):
-            m_temp.append(helpers.basis_function_one(degree, kv, j, uk[i]))
-        matrix_n.append(m_temp)
-
-    # Compute NT
-    matrix_nt = linalg.matrix_transpose(matrix_n)
-
-    # Compute NTN matrix
-    matrix_ntn = linalg.matrix_multiply(matrix_nt, matrix_n)
-
-    # LU-factorization
-    matrix_l, matrix_u = linalg.lu_decomposition(matrix_ntn)
-
-    # Initialize control points array
-    ctrlpts = [[0.0 for _ in range(dim)] for _ in range(num_cpts)]
-
-    # Fix start and end points
-    ctrlpts[0] = list(points[0])
-    ctrlpts[-1] = list(points[-1])
-
-    # Compute Rk - Eqn 9.63
-    pt0 = points[0]  # Qzero
-    ptm = points[-1]  # Qm
-    rk = []
-    for i in range(1, num_dpts - 1):
-        ptk = points[i]
-        n0p = helpers.basis_function_one(degree, kv, 0, uk[i])
-        nnp = helpers.basis_function_one(degree, kv, num_cpts - 1, uk[i])
-        elem2 = [c * n0p for c in pt0]
-        elem3 = [c * nnp for c in ptm]
-        rk.append([a - b - c for a, b, c in zip(ptk, elem2, elem3)])
-
-    # Compute R - Eqn. 9.67
-    vector_r = [[0.0 for _ in range(dim)] for _ in range(num_cpts - 2)]
-    for i in range(1, num_cpts - 1):
-        ru_tmp = []
-        for idx, pt in enumerate(rk):
-            ru_tmp.append([p * helpers.basis_function_one(degree, kv, i, uk[idx + 1]) for p in pt])
-        for d in range(dim):
-            for idx in range(len(ru_tmp)):
-                vector_r[i - 1][d] += ru_tmp[idx][d]
-
     # Compute control points
-    for i in range(dim):
-        b = [pt[i] for pt in vector_r]
-        y = linalg.forward_substitution(matrix_l, b)
-        x = linalg.backward_substitution(matrix_u, y)
-        for j in range(1, num_cpts - 1):
-            ctrlpts[j][i] = x[j - 1]
+    ctrlpts = _approximate_rows([points], degree, kv, uk, num_cpts, weights)[0]
 
     # Generate B-spline curve
     curve = BSpline.Curve()
@@ -215,10 +176,16 @@ def approximate_surface(points, size_u, size_v, degree_u, degree_v, **kwargs):
     This algorithm interpolates the corner control points and approximates the remaining control points. Please refer to
     Algorithm A9.7 of The NURBS Book (2nd Edition), pp.422-423 for details.
 
+    The surface is fitted in u- and v-directions separately, therefore the data points can be weighted row-wise and
+    column-wise using ``weights_u`` and ``weights_v``, respectively. The weight of the data point :math:`(k, l)` is the
+    product of the k-th u-weight and the l-th v-weight.
+
     Keyword Arguments:
         * ``centripetal``: activates centripetal parametrization method. *Default: False*
         * ``ctrlpts_size_u``: number of control points on the u-direction. *Default: size_u - 1*
         * ``ctrlpts_size_v``: number of control points on the v-direction. *Default: size_v - 1*
+        * ``weights_u``: weights of the data points on the u-direction. *Default: None*
+        * ``weights_v``: weights of the data points on the v-direction. *Default: None*
 
     :param points: data points
     :type points: list, tuple
@@ -237,9 +204,12 @@ def approximate_surface(points, size_u, size_v, degree_u, degree_v, **kwargs):
     use_centripetal = kwargs.get('centripetal', False)
     num_cpts_u = kwargs.get('ctrlpts_size_u', size_u - 1)  # number of datapts, r + 1 > number of ctrlpts, n + 1
     num_cpts_v = kwargs.get('ctrlpts_size_v', size_v - 1)  # number of datapts, s + 1 > number of ctrlpts, m + 1
+    weights_u = kwargs.get('weights_u', None)
+    weights_v = kwargs.get('weights_v', None)
 
-    # Dimension
-    dim = len(points[0])
+    # Check weights
+    _check_weights(weights_u, size_u)
+    _check_weights(weights_v, size_v)
 
     # Get uk and vl
     uk, vl = compute_params_surface(points, size_u, size_v, use_centripetal)
@@ -248,99 +218,15 @@ def approximate_surface(points, size_u, size_v, degree_u, degree_v, **kwargs):
     kv_u = compute_knot_vector2(degree_u, size_u, num_cpts_u, uk)
     kv_v = compute_knot_vector2(degree_v, size_v, num_cpts_v, vl)
 
-    # Construct matrix Nu
-    matrix_nu = []
-    for i in range(1, size_u - 1):
-        m_temp = []
-        for j in range(1, num_cpts_u - 1):
-            m_temp.append(helpers.basis_function_one(degree_u, kv_u, j, uk[i]))
-        matrix_nu.append(m_temp)
-    # Compute Nu transpose
-    matrix_ntu = linalg.matrix_transpose(matrix_nu)
-    # Compute NTNu matrix
-    matrix_ntnu = linalg.matrix_multiply(matrix_ntu, matrix_nu)
-    # Compute LU-decomposition of NTNu matrix
-    matrix_ntnul, matrix_ntnuu = linalg.lu_decomposition(matrix_ntnu)
-
     # Fit u-direction
-    ctrlpts_tmp = [[0.0 for _ in range(dim)] for _ in range(num_cpts_u * size_v)]
-    for j in range(size_v):
-        ctrlpts_tmp[j + (size_v * 0)] = list(points[j + (size_v * 0)])
-        ctrlpts_tmp[j + (size_v * (num_cpts_u - 1))] = list(points[j + (size_v * (size_u - 1))])
-        # Compute Rku - Eqn. 9.63
-        pt0 = points[j + (size_v * 0)]  # Qzero
-        ptm = points[j + (size_v * (size_u - 1))]  # Qm
-        rku = []
-        for i in range(1, size_u - 1):
-            ptk = points[j + (size_v * i)]
-            n0p = helpers.basis_function_one(degree_u, kv_u, 0, uk[i])
-            nnp = helpers.basis_function_one(degree_u, kv_u, num_cpts_u - 1, uk[i])
-            elem2 = [c * n0p for c in pt0]
-            elem3 = [c * nnp for c in ptm]
-            rku.append([a - b - c for a, b, c in zip(ptk, elem2, elem3)])
-        # Compute Ru - Eqn. 9.67
-        ru = [[0.0 for _ in range(dim)] for _ in range(num_cpts_u - 2)]
-        for i in range(1, num_cpts_u - 1):
-            ru_tmp = []
-            for idx, pt in enumerate(rku):
-                ru_tmp.append([p * helpers.basis_function_one(degree_u, kv_u, i, uk[idx + 1]) for p in pt])
-            for d in range(dim):
-                for idx in range(len(ru_tmp)):
-                    ru[i - 1][d] += ru_tmp[idx][d]
-        # Get intermediate control points
-        for d in range(dim):
-            b = [pt[d] for pt in ru]
-            y = linalg.forward_substitution(matrix_ntnul, b)
-            x = linalg.backward_substitution(matrix_ntnuu, y)
-            for i in range(1, num_cpts_u - 1):
-                ctrlpts_tmp[j + (size_v * i)][d] = x[i - 1]
-
-    # Construct matrix Nv
-    matrix_nv = []
-    for i in range(1, size_v - 1):
-        m_temp = []
-        for j in range(1, num_cpts_v - 1):
-            m_temp.append(helpers.basis_function_one(degree_v, kv_v, j, vl[i]))
-        matrix_nv.append(m_temp)
-    # Compute Nv transpose
-    matrix_ntv = linalg.matrix_transpose(matrix_nv)
-    # Compute NTNv matrix
-    matrix_ntnv = linalg.matrix_multiply(matrix_ntv, matrix_nv)
-    # Compute LU-decomposition of NTNv matrix
-    matrix_ntnvl, matrix_ntnvu = linalg.lu_decomposition(matrix_ntnv)
+    rows = [[points[j + (size_v * i)] for i in range(size_u)] for j in range(size_v)]
+    ctrlpts_tmp = _approximate_rows(rows, degree_u, kv_u, uk, num_cpts_u, weights_u)
 
     # Fit v-direction
-    ctrlpts = [[0.0 for _ in range(dim)] for _ in range(num_cpts_u * num_cpts_v)]
-    for i in range(num_cpts_u):
-        ctrlpts[0 + (num_cpts_v * i)] = list(ctrlpts_tmp[0 + (size_v * i)])
-        ctrlpts[num_cpts_v - 1 + (num_cpts_v * i)] = list(ctrlpts_tmp[size_v - 1 + (size_v * i)])
-        # Compute Rkv - Eqs. 9.63
-        pt0 = ctrlpts_tmp[0 + (size_v * i)]  # Qzero
-        ptm = ctrlpts_tmp[size_v - 1 + (size_v * i)]  # Qm
-        rkv = []
-        for j in range(1, size_v - 1):
-            ptk = ctrlpts_tmp[j + (size_v * i)]
-            n0p = helpers.basis_function_one(degree_v, kv_v, 0, vl[j])
-            nnp = helpers.basis_function_one(degree_v, kv_v, num_cpts_v - 1, vl[j])
-            elem2 = [c * n0p for c in pt0]
-            elem3 = [c * nnp for c in ptm]
-            rkv.append([a - b - c for a, b, c in zip(ptk, elem2, elem3)])
-        # Compute Rv - Eqn. 9.67
-        rv = [[0.0 for _ in range(dim)] for _ in range(num_cpts_v - 2)]
-        for j in range(1, num_cpts_v - 1):
-            rv_tmp = []
-            for idx, pt in enumerate(rkv):
-                rv_tmp.append([p * helpers.basis_function_one(degree_v, kv_v, j, vl[idx + 1]) for p in pt])
-            for d in range(dim):
-                for idx in range(len(rv_tmp)):
-                    rv[j - 1][d] += rv_tmp[idx][d]
-        # Get intermediate control points
-        for d in range(dim):
-            b = [pt[d] for pt in rv]
-            y = linalg.forward_substitution(matrix_ntnvl, b)
-            x = linalg.backward_substitution(matrix_ntnvu, y)
-            for j in range(1, num_cpts_v - 1):
-                ctrlpts[j + (num_cpts_v * i)][d] = x[j - 1]
+    rows = [[ctrlpts_tmp[j][i] for j in range(size_v)] for i in range(num_cpts_u)]
+    ctrlpts = []
+    for row in _approximate_rows(rows, degree_v, kv_v, vl, num_cpts_v, weights_v):
+        ctrlpts += row
 
     # Generate B-spline surface
     surf = BSpline.Surface()
@@ -355,6 +241,593 @@ def approximate_surface(points, size_u, size_v, degree_u, degree_v, **kwargs):
     return surf
 
 
+@export
+def interpolate_curves(points_list, degree, **kwargs):
+    """ Curve interpolation through multiple sets of data points.
+
+    This function is the batch version of :py:func:`.interpolate_curve`. The data point sets with the same parameters,
+    e.g. the point sets sharing a parametrization, generate the same coefficient matrix, therefore they are grouped
+    and each group is solved using a single factorization. The groups are distributed to multiple processes, if
+    ``num_procs`` is bigger than 1.
+
+    The parameters are computed for each data point set separately, unless a shared parametrization is provided via
+    ``params`` keyword argument. In the latter case, all data point sets should have the same number of points and
+    all curves are solved using a single factorization.
+
+    .. code-block:: python
+        :linenos:
+
+        from geomdl import fitting
+
+        # Interpolate each scan line with a cubic curve using the same parameters
+        params = fitting.compute_params_curve(scan_lines[0])
+        crvs = fitting.interpolate_curves(scan_lines, 3, params=params, num_procs=4)
+
+    Keyword Arguments:
+        * ``centripetal``: activates centripetal parametrization method. *Default: False*
+        * ``params``: shared parameters for all data point sets. *Default: None*
+        * ``num_procs``: number of concurrent processes for fitting the groups. *Default: 1*
+
+    :param points_list: list of data point sets
+    :type points_list: list, tuple
+    :param degree: degree of the output parametric curves
+    :type degree: int
+    :return: interpolated B-Spline curves
+    :rtype: multi.CurveContainer
+    """
+    return _fit_curves(points_list, degree, _interpolate_group, **kwargs)
+
+
+@export
+def approximate_curves(points_list, degree, **kwargs):
+    """ Curve approximation using least squares method for multiple sets of data points.
+
+    This function is the batch version of :py:func:`.approximate_curve`. Please see :py:func:`.interpolate_curves`
+    for details on grouping and parallel processing.
+
+    Keyword Arguments:
+        * ``centripetal``: activates centripetal parametrization method. *Default: False*
+        * ``ctrlpts_size``: number of control points. *Default: number of data points - 1*
+        * ``params``: shared parameters for all data point sets. *Default: None*
+        * ``num_procs``: number of concurrent processes for fitting the groups. *Default: 1*
+
+    :param points_list: list of data point sets
+    :type points_list: list, tuple
+    :param degree: degree of the output parametric curves
+    :type degree: int
+    :return: approximated B-Spline curves
+    :rtype: multi.CurveContainer
+    """
+    return _fit_curves(points_list, degree, _approximate_group, **kwargs)
+
+
+@export
+def approximate_curve_adaptive(points, degree, **kwargs):
+    """ Curve approximation using least squares method with adaptive knot insertion.
+
+    The approximation starts with a coarse knot vector and the following steps are repeated until the maximum distance
+    between the data points and the curve is less than the tolerance:
+
+    #. The control points are computed using the least squares method, similar to :py:func:`.approximate_curve`
+    #. The residuals, i.e. the distances between the data points and the curve, are computed
+    #. A knot is inserted into each knot span containing a data point with a residual larger than the tolerance
+
+    The new knot is placed between the two middle data points of the span, therefore both new spans contain data
+    points. The knot insertion only changes the basis functions in the neighborhood of the inserted knots, therefore
+    the basis functions are only recomputed for the data points close to the inserted knots. The banded normal
+    equations are assembled and solved from scratch on each iteration.
+
+    The final errors and the iteration history are stored in the :py:attr:`opt` property of the output curve with the
+    following keys:
+
+    * ``max_error``: maximum distance between the data points and the curve
+    * ``rms_error``: root mean square of the distances
+    * ``iterations``: list of dicts containing ``ctrlpts_size``, ``max_error``, ``rms_error`` and ``num_inserted``
+      values of each iteration
+
+    Keyword Arguments:
+        * ``centripetal``: activates centripetal parametrization method. *Default: False*
+        * ``tol``: maximum allowed distance between the data points and the curve. *Default: 10e-4*
+        * ``ctrlpts_size``: initial number of control points. *Default: degree + 1*
+        * ``max_ctrlpts``: maximum number of control points. *Default: len(points) - 1*
+        * ``max_iter``: maximum number of iterations. *Default: 100*
+        * ``weights``: weights of the data points. *Default: None*
+
+    :param points: data points
+    :type points: list, tuple
+    :param degree: degree of the output parametric curve
+    :type degree: int
+    :return: approximated B-Spline curve
+    :rtype: BSpline.Curve
+    """
+    # Number of data points
+    num_dpts = len(points)
+
+    # Get keyword arguments
+    use_centripetal = kwargs.get('centripetal', False)
+    tol = kwargs.get('tol', 10e-4)
+    num_cpts = kwargs.get('ctrlpts_size', degree + 1)
+    max_cpts = kwargs.get('max_ctrlpts', num_dpts - 1)
+    max_iter = kwargs.get('max_iter', 100)
+    weights = kwargs.get('weights', None)
+
+    # Check inputs
+    _check_weights(weights, num_dpts)
+    if not degree + 1 <= num_cpts <= max_cpts < num_dpts:
+        raise GeomdlException("Number of control points must be between degree + 1 and the number of data points",
+                              data=dict(ctrlpts_size=num_cpts, max_ctrlpts=max_cpts))
+
+    # Get uk
+    uk = compute_params_curve(points, use_centripetal)
+
+    # Compute initial knot vector
+    kv = compute_knot_vector2(degree, num_dpts, num_cpts, uk)
+    basis = _compute_basis(degree, kv, uk, num_cpts)
+
+    iterations = []
+    while True:
+        # Compute control points
+        ctrlpts = _approximate_rows([points], degree, kv, uk, num_cpts, weights, basis)[0]
+
+        # Compute residuals
+        errors = []
+        for (span, bfuncs), pt in zip(basis, points):
+            cpts = ctrlpts[span - degree:span + 1]
+            cpt = [sum(bf * c[d] for bf, c in zip(bfuncs, cpts)) for d in range(len(pt))]
+            errors.append(linalg.point_distance(cpt, pt))
+        max_error = max(errors)
+        rms_error = math.sqrt(sum(e * e for e in errors) / num_dpts)
+        iterations.append(dict(ctrlpts_size=num_cpts, max_error=max_error, rms_error=rms_error, num_inserted=0))
+        if max_error <= tol or len(iterations) >= max_iter or num_cpts >= max_cpts:
+            break
+
+        # Find the knot spans containing the data points with large residuals
+        span_points = {}
+        for idx, (span, _) in enumerate(basis):
+            span_points.setdefault(span, []).append(idx)
+        candidates = []
+        for span, idxs in span_points.items():
+            span_error = max(errors[idx] for idx in idxs)
+            if span_error <= tol or len(idxs) < 2:
+                continue
+            # Place the new knot between the middle data points, so that both new spans contain data points
+            mid = len(idxs) // 2
+            knot = (uk[idxs[mid - 1]] + uk[idxs[mid]]) / 2.0
+            if kv[span] < knot < kv[span + 1]:
+                candidates.append((span_error, knot))
+        if not candidates:
+            break
+
+        # Insert the knots starting from the spans with the largest residuals
+        candidates.sort(reverse=True)
+        new_knots = [knot for _, knot in candidates[:max_cpts - num_cpts]]
+        iterations[-1]['num_inserted'] = len(new_knots)
+        kv_new = sorted(kv + new_knots)
+        num_cpts += len(new_knots)
+        basis = _update_basis(basis, degree, kv, kv_new, uk, num_cpts)
+        kv = kv_new
+
+    # Generate B-spline curve
+    curve = BSpline.Curve()
+    curve.degree = degree
+    curve.ctrlpts = ctrlpts
+    curve.knotvector = kv
+    curve.opt = ['max_error', max_error]
+    curve.opt = ['rms_error', rms_error]
+    curve.opt = ['iterations', iterations]
+
+    return curve
+
+
+@export
+def approximate_curve_stream(chunks, degree, ctrlpts_size, **kwargs):
+    """ Curve approximation using least squares method for the data points given in chunks.
+
+    This function is designed for the large data sets which don't fit in memory, e.g. the chunks can be generated by
+    reading a file line by line. The chunks are consumed one by one using :py:class:`.StreamingCurveFit` and only the
+    normal equations are kept in memory. Each chunk is a list of data points or a dict with the following keys:
+
+    * ``points``: data points
+    * ``params``: parameters of the data points (optional)
+    * ``weights``: weights of the data points (optional)
+
+    If the parameters are not provided, they are computed on the fly using chord length parametrization which requires
+    the total chord length of the data points, i.e. ``chord_length`` keyword argument.
+
+    If ``num_procs`` is bigger than 1, the normal equations of the chunks are computed in parallel and then summed up.
+    Only ``num_procs`` chunks are read in advance, therefore the memory usage is bounded.
+
+    .. code-block:: python
+        :linenos:
+
+        from geomdl import fitting
+
+        def read_chunks(file_name, chunk_size=10000):
+            with open(file_name, 'r') as fp:
+                chunk = []
+                for line in fp:
+                    chunk.append([float(c) for c in line.split(',')])
+                    if len(chunk) == chunk_size:
+                        yield chunk
+                        chunk = []
+                if chunk:
+                    yield chunk
+
+        curve = fitting.approximate_curve_stream(read_chunks("scan.csv"), 3, 500, chord_length=1250.0, num_procs=4)
+
+    Keyword Arguments:
+        * ``knotvector``: knot vector of the output curve. *Default: uniform knot vector*
+        * ``chord_length``: total chord length for on the fly parametrization. *Default: None*
+        * ``centripetal``: activates centripetal parametrization method. *Default: False*
+        * ``num_procs``: number of concurrent processes for computing the normal equations. *Default: 1*
+
+    :param chunks: chunks of data points
+    :type chunks: iterable
+    :param degree: degree of the output parametric curve
+    :type degree: int
+    :param ctrlpts_size: number of control points
+    :type ctrlpts_size: int
+    :return: approximated B-Spline curve
+    :rtype: BSpline.Curve
+    """
+    num_procs = kwargs.pop('num_procs', 1)
+
+    # Initialize the fitter
+    fitter = StreamingCurveFit(degree, ctrlpts_size, **kwargs)
+
+    if num_procs > 1:
+        chunk_iter = iter(chunks)
+        with pool_context(processes=num_procs) as pool:
+            mp_func = partial(_normal_equations_chunk, degree=fitter.degree, knotvector=fitter.knotvector,
+                              num_cpts=fitter.ctrlpts_size)
+            while True:
+                # Parameters are computed in order, then the chunks are processed in parallel
+                batch = [fitter._prepare_chunk(*_unpack_chunk(chunk)) for chunk in islice(chunk_iter, num_procs)]
+                if not batch:
+                    break
+                for res in pool.map(mp_func, batch):
+                    fitter._add_normal_equations(*res)
+    else:
+        for chunk in chunks:
+            fitter.add(*_unpack_chunk(chunk))
+
+    return fitter.solve()
+
+
+@export
+class StreamingCurveFit(object):
+    """ Incremental curve approximation using least squares method.
+
+    The data points are added in chunks using :py:meth:`add` and the normal equations :math:`N^{T}WNP = N^{T}WQ` are
+    accumulated in band storage. Therefore, the memory usage depends on the number of control points, not on the number
+    of data points. :py:meth:`solve` computes the control points using banded Cholesky factorization and returns the
+    approximated curve. The accumulated normal equations of multiple instances, e.g. the ones computed in different
+    processes, can be summed up using :py:meth:`merge`.
+
+    Since all data points may not be available at the same time, the knot vector should be known in advance and all
+    control points are approximated, i.e. the first and the last data points are not interpolated as opposed to
+    :py:func:`.approximate_curve`. Every knot span should contain data points to get a unique solution.
+
+    The parameters of the data points can be provided with the chunks. Otherwise, they are computed on the fly using
+    chord length (or centripetal) parametrization, continuing from the last point of the previous chunk. In this case,
+    the total chord length, i.e. the sum of the distances (or their square roots for the centripetal method) between the
+    consecutive data points, should be provided via ``chord_length`` keyword argument.
+
+    Keyword Arguments:
+        * ``knotvector``: knot vector of the output curve. *Default: uniform knot vector*
+        * ``chord_length``: total chord length for on the fly parametrization. *Default: None*
+        * ``centripetal``: activates centripetal parametrization method. *Default: False*
+
+    :param degree: degree of the output parametric curve
+    :type degree: int
+    :param ctrlpts_size: number of control points
+    :type ctrlpts_size: int
+    """
+    def __init__(self, degree, ctrlpts_size, **kwargs):
+        kv = kwargs.get('knotvector', None)
+        if kv is None:
+            kv = knotvector.generate(degree, ctrlpts_size)
+        if not knotvector.check(degree, kv, ctrlpts_size):
+            raise GeomdlException("Input is not a valid knot vector for the given degree and number of control points")
+        self._degree = degree
+        self._ctrlpts_size = ctrlpts_size
+        self._knotvector = tuple(float(k) for k in kv)
+        self._chord_length = kwargs.get('chord_length', None)
+        self._centripetal = kwargs.get('centripetal', False)
+        self._ntn = [[0.0 for _ in range(degree + 1)] for _ in range(ctrlpts_size)]
+        self._rhs = None
+        self._num_points = 0
+        self._last_point = None
+        self._last_length = 0.0
+
+    @property
+    def degree(self):
+        """ Degree of the output curve.
+
+        :getter: Gets the degree
+        :type: int
+        """
+        return self._degree
+
+    @property
+    def ctrlpts_size(self):
+        """ Number of control points of the output curve.
+
+        :getter: Gets the number of control points
+        :type: int
+        """
+        return self._ctrlpts_size
+
+    @property
+    def knotvector(self):
+        """ Knot vector of the output curve.
+
+        :getter: Gets the knot vector
+        :type: tuple
+        """
+        return self._knotvector
+
+    @property
+    def num_points(self):
+        """ Number of the data points added.
+
+        :getter: Gets the number of data points
+        :type: int
+        """
+        return self._num_points
+
+    def add(self, points, params=None, weights=None):
+        """ Adds a chunk of data points.
+
+        :param points: data points
+        :type points: list, tuple
+        :param params: parameters of the data points
+        :type params: list, tuple
+        :param weights: weights of the data points
+        :type weights: list, tuple
+        """
+        points, params, weights = self._prepare_chunk(points, params, weights)
+        if not points:
+            return
+        if self._rhs is None:
+            self._rhs = [[0.0 for _ in range(len(points[0]))] for _ in range(self._ctrlpts_size)]
+        _accumulate_normal_equations(self._ntn, self._rhs, self._degree, self._knotvector, self._ctrlpts_size,
+                                     points, params, weights)
+        self._num_points += len(points)
+
+    def merge(self, other):
+        """ Adds the normal equations accumulated by the other instance.
+
+        :param other: other fitter with the same degree and knot vector
+        :type other: StreamingCurveFit
+        """
+        if not isinstance(other, self.__class__):
+            raise GeomdlException("Can only merge with a " + self.__class__.__name__ + " instance")
+        if other._degree != self._degree or other._knotvector != self._knotvector:
+            raise GeomdlException("Cannot merge fitters with different degrees or knot vectors")
+        if other._rhs is not None:
+            self._add_normal_equations(other._ntn, other._rhs, other._num_points)
+
+    def solve(self):
+        """ Solves the normal equations and generates the approximated curve.
+
+        :return: approximated B-Spline curve
+        :rtype: BSpline.Curve
+        """
+        if self._rhs is None:
+            raise GeomdlException("No data points have been added")
+        ctrlpts = linalg.cholesky_solve_banded(self._ntn, self._degree, self._rhs)
+
+        # Generate B-spline curve
+        curve = BSpline.Curve()
+        curve.degree = self._degree
+        curve.ctrlpts = ctrlpts
+        curve.knotvector = list(self._knotvector)
+
+        return curve
+
+    def _prepare_chunk(self, points, params=None, weights=None):
+        """ Validates the chunk and computes the parameters, if necessary. """
+        if params is None:
+            params = self._compute_params(points)
+        if len(params) != len(points):
+            raise GeomdlException("The number of parameters must be equal to the number of data points")
+        _check_weights(weights, len(points))
+        return points, params, weights
+
+    def _compute_params(self, points):
+        """ Computes the parameters on the fly using chord length or centripetal method. """
+        if self._chord_length is None:
+            raise GeomdlException("The total chord length is required to compute the parameters on the fly")
+        kv_start = self._knotvector[self._degree]
+        kv_range = self._knotvector[-(self._degree + 1)] - kv_start
+        params = []
+        for pt in points:
+            if self._last_point is not None:
+                distance = linalg.point_distance(pt, self._last_point)
+                self._last_length += math.sqrt(distance) if self._centripetal else distance
+            params.append(kv_start + kv_range * min(self._last_length / self._chord_length, 1.0))
+            self._last_point = pt
+        return params
+
+    def _add_normal_equations(self, matrix_ntn, matrix_r, num_points):
+        """ Adds the normal equations computed for a chunk. """
+        if not num_points:
+            return
+        if self._rhs is None:
+            self._rhs = [[0.0 for _ in range(len(matrix_r[0]))] for _ in range(self._ctrlpts_size)]
+        for row, row_add in zip(self._ntn, matrix_ntn):
+            for idx, val in enumerate(row_add):
+                row[idx] += val
+        for row, row_add in zip(self._rhs, matrix_r):
+            for idx, val in enumerate(row_add):
+                row[idx] += val
+        self._num_points += num_points
+
+
+def _fit_curves(points_list, degree, func, **kwargs):
+    """ Groups the data point sets by their parameters and fits curves to each group.
+
+    :param points_list: list of data point sets
+    :type points_list: list, tuple
+    :param degree: degree of the output parametric curves
+    :type degree: int
+    :param func: function fitting a group
+    :return: fitted B-Spline curves
+    :rtype: multi.CurveContainer
+    """
+    # Keyword arguments
+    use_centripetal = kwargs.get('centripetal', False)
+    params = kwargs.get('params', None)
+    num_cpts = kwargs.get('ctrlpts_size', None)
+    num_procs = kwargs.get('num_procs', 1)
+
+    # Group the data point sets which share the same parameters
+    groups = {}
+    group_keys = []
+    for idx, points in enumerate(points_list):
+        uk = params if params is not None else compute_params_curve(points, use_centripetal)
+        if len(uk) != len(points):
+            raise GeomdlException("The number of parameters must be equal to the number of data points",
+                                  data=dict(index=idx))
+        key = tuple(uk)
+        if key not in groups:
+            groups[key] = []
+            group_keys.append(key)
+        groups[key].append(idx)
+    tasks = [(key, [points_list[idx] for idx in groups[key]]) for key in group_keys]
+
+    # Fit the groups
+    mp_func = partial(func, degree=degree, num_cpts=num_cpts)
+    if num_procs > 1:
+        with pool_context(processes=num_procs) as pool:
+            results = pool.map(mp_func, tasks, chunksize=max(1, len(tasks) // (num_procs * 4)))
+    else:
+        results = [mp_func(task) for task in tasks]
+
+    # Generate B-spline curves
+    curves = [None for _ in range(len(points_list))]
+    for key, (kv, ctrlpts) in zip(group_keys, results):
+        for idx, cpts in zip(groups[key], ctrlpts):
+            curve = BSpline.Curve()
+            curve.degree = degree
+            curve.ctrlpts = cpts
+            curve.knotvector = kv
+            curves[idx] = curve
+
+    return multi.CurveContainer(curves)
+
+
+def _interpolate_group(group, degree, num_cpts=None):
+    """ Applies global interpolation to a group of data point sets sharing the same parameters.
+
+    .. note:: Helper function required for ``multiprocessing``
+
+    :param group: parameters and data point sets as a tuple
+    :type group: tuple
+    :param degree: degree
+    :type degree: int
+    :param num_cpts: not used
+    :return: knot vector and control points of each data point set as a tuple
+    :rtype: tuple
+    """
+    uk, rows = group
+    kv = compute_knot_vector(degree, len(uk), uk)
+    return kv, _interpolate_rows(rows, degree, kv, uk)
+
+
+def _approximate_group(group, degree, num_cpts=None):
+    """ Applies least squares approximation to a group of data point sets sharing the same parameters.
+
+    .. note:: Helper function required for ``multiprocessing``
+
+    :param group: parameters and data point sets as a tuple
+    :type group: tuple
+    :param degree: degree
+    :type degree: int
+    :param num_cpts: number of control points
+    :type num_cpts: int
+    :return: knot vector and control points of each data point set as a tuple
+    :rtype: tuple
+    """
+    uk, rows = group
+    num_cpts = len(uk) - 1 if num_cpts is None else num_cpts
+    kv = compute_knot_vector2(degree, len(uk), num_cpts, uk)
+    return kv, _approximate_rows(rows, degree, kv, uk, num_cpts)
+
+
+def _unpack_chunk(chunk):
+    """ Unpacks the chunk into data points, parameters and weights. """
+    if isinstance(chunk, dict):
+        return chunk['points'], chunk.get('params', None), chunk.get('weights', None)
+    return chunk, None, None
+
+
+def _accumulate_normal_equations(matrix_ntn, matrix_r, degree, knotvector, num_cpts, points, params, weights=None):
+    """ Adds the contributions of the data points to the normal equations.
+
+    The lower triangle of :math:`N^{T}WN` is stored in band storage. Please see
+    :func:`.linalg.cholesky_decomposition_banded` for the storage format.
+
+    :param matrix_ntn: lower triangle of NTN matrix in band storage (updated in place)
+    :type matrix_ntn: list
+    :param matrix_r: right-hand side of the normal equations (updated in place)
+    :type matrix_r: list
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param num_cpts: number of control points
+    :type num_cpts: int
+    :param points: data points
+    :type points: list, tuple
+    :param params: parameters of the data points
+    :type params: list, tuple
+    :param weights: weights of the data points
+    :type weights: list, tuple
+    """
+    for k, (pt, u) in enumerate(zip(points, params)):
+        # Find span, same as helpers.find_span_linear
+        span = bisect_right(knotvector, u, degree + 1, num_cpts) - 1
+        bfuncs = helpers.basis_function(degree, knotvector, span, u)
+        wk = 1.0 if weights is None else weights[k]
+        for a in range(degree + 1):
+            wna = wk * bfuncs[a]
+            if wna == 0.0:
+                continue
+            row_ntn = matrix_ntn[span - degree + a]
+            for b in range(a + 1):
+                row_ntn[b - a + degree] += wna * bfuncs[b]
+            row_r = matrix_r[span - degree + a]
+            for d, c in enumerate(pt):
+                row_r[d] += wna * c
+
+
+def _normal_equations_chunk(chunk, degree, knotvector, num_cpts):
+    """ Computes the normal equations for a chunk of data points.
+
+    .. note:: Helper function required for ``multiprocessing``
+
+    :param chunk: data points, parameters and weights as a tuple
+    :type chunk: tuple
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param num_cpts: number of control points
+    :type num_cpts: int
+    :return: lower triangle of NTN matrix in band storage, right-hand side and number of data points as a tuple
+    :rtype: tuple
+    """
+    points, params, weights = chunk
+    if not points:
+        return [], [], 0
+    matrix_ntn = [[0.0 for _ in range(degree + 1)] for _ in range(num_cpts)]
+    matrix_r = [[0.0 for _ in range(len(points[0]))] for _ in range(num_cpts)]
+    _accumulate_normal_equations(matrix_ntn, matrix_r, degree, knotvector, num_cpts, points, params, weights)
+    return matrix_ntn, matrix_r, len(points)
+
+
 def compute_knot_vector(degree, num_points, params):
     """ Computes a knot vector from the parameter list using averaging method.
 
@@ -448,8 +921,10 @@ def compute_params_curve(points, centripetal=False):
 
     # Divide individual chord lengths by the total chord length
     uk = [0.0 for _ in range(num_points)]
+    cds_sum = 0.0
     for i in range(num_points):
-        uk[i] = sum(cds[0:i + 1]) / d
+        cds_sum += cds[i]
+        uk[i] = cds_sum / d
 
     return uk
 
@@ -506,6 +981,186 @@ def compute_params_surface(points, size_u, size_v, centripetal=False):
     return uk, vl
 
 
+def _check_weights(weights, num_dpts):
+    """ Checks the weights of the data points.
+
+    :param weights: weights of the data points
+    :type weights: list, tuple
+    :param num_dpts: number of data points
+    :type num_dpts: int
+    """
+    if weights is None:
+        return
+    if len(weights) != num_dpts:
+        raise GeomdlException("The number of weights must be equal to the number of data points",
+                              data=dict(num_weights=len(weights), num_dpts=num_dpts))
+    if any(w <= 0 for w in weights):
+        raise GeomdlException("The weights must be positive")
+
+
+def _interpolate_rows(rows, degree, knotvector, params):
+    """ Applies global interpolation to multiple rows of data points sharing the same parametrization.
+
+    The coefficient matrix is built and factorized once and all rows are solved together as the columns of a single
+    right-hand side matrix.
+
+    :param rows: rows of data points
+    :type rows: list, tuple
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param params: list of parameters
+    :type params: list, tuple
+    :return: control points of each row
+    :rtype: list
+    """
+    dim = len(rows[0][0])
+
+    # Factorize the coefficient matrix
+    matrix_a, num_lower, num_upper = _build_coeff_matrix_banded(degree, knotvector, params, rows[0])
+    matrix_lu = linalg.lu_decomposition_banded(matrix_a, num_lower, num_upper)
+
+    # Stack the rows as the columns of the right-hand side
+    matrix_b = [[c for row in rows for c in row[k]] for k in range(len(params))]
+    matrix_x = linalg.lu_substitution_banded(matrix_lu, num_lower, num_upper, matrix_b)
+
+    # Split the solution into the rows
+    return [[x[r * dim:(r + 1) * dim] for x in matrix_x] for r in range(len(rows))]
+
+
+def _approximate_rows(rows, degree, knotvector, params, num_cpts, weights=None, basis=None):
+    """ Applies least squares approximation to multiple rows of data points sharing the same parametrization.
+
+    The first and the last data points of each row are interpolated. Please refer to The NURBS Book (2nd Edition),
+    pp.410-413 for details.
+
+    Each data point contributes to at most :math:`p + 1` basis functions, therefore matrix :math:`N^{T}WN` is banded
+    with bandwidth :math:`p`. It is assembled directly in band storage from the spans and the non-vanishing basis
+    functions of the parameters, and solved using banded Cholesky factorization. All rows are solved together as the
+    columns of a single right-hand side matrix.
+
+    :param rows: rows of data points
+    :type rows: list, tuple
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param params: list of parameters
+    :type params: list, tuple
+    :param num_cpts: number of control points
+    :type num_cpts: int
+    :param weights: weights of the data points
+    :type weights: list, tuple
+    :param basis: precomputed spans and basis functions of the parameters generated by :func:`_compute_basis`
+    :type basis: list, tuple
+    :return: control points of each row
+    :rtype: list
+    """
+    # Compute spans and basis functions
+    if basis is None:
+        basis = _compute_basis(degree, knotvector, params, num_cpts)
+
+    # Number of data points, corresponds to variable "r" in the algorithm
+    num_dpts = len(params)
+
+    # Number of unknown control points
+    num_unknowns = num_cpts - 2
+
+    # Dimension
+    dim = len(rows[0][0])
+    num_cols = len(rows) * dim
+
+    # Assemble NTN - lower triangle in band storage, and R - Eqn. 9.67
+    matrix_ntn = [[0.0 for _ in range(degree + 1)] for _ in range(num_unknowns)]
+    matrix_r = [[0.0 for _ in range(num_cols)] for _ in range(num_unknowns)]
+    for i in range(1, num_dpts - 1):
+        span, bfuncs = basis[i]
+        wk = 1.0 if weights is None else weights[i]
+
+        # Compute Rk - Eqn 9.63
+        n0p = bfuncs[0] if span == degree else 0.0
+        nnp = bfuncs[-1] if span == num_cpts - 1 else 0.0
+        rk = [pk - (p0 * n0p) - (pm * nnp) for row in rows for pk, p0, pm in zip(row[i], row[0], row[-1])]
+
+        # Add contributions of the non-vanishing basis functions of the unknown control points
+        for a in range(degree + 1):
+            idx_a = span - degree + a - 1
+            if not 0 <= idx_a < num_unknowns:
+                continue
+            wna = wk * bfuncs[a]
+            row_ntn = matrix_ntn[idx_a]
+            for b in range(a + 1):
+                idx_b = span - degree + b - 1
+                if idx_b >= 0:
+                    row_ntn[idx_b - idx_a + degree] += wna * bfuncs[b]
+            row_r = matrix_r[idx_a]
+            for c in range(num_cols):
+                row_r[c] += wna * rk[c]
+
+    # Solve for the unknown control points
+    matrix_x = linalg.cholesky_solve_banded(matrix_ntn, degree, matrix_r)
+
+    # Generate control points arrays, fixing start and end points
+    ctrlpts = []
+    for r_idx, row in enumerate(rows):
+        ctrlpts.append([list(row[0])] + [x[r_idx * dim:(r_idx + 1) * dim] for x in matrix_x] + [list(row[-1])])
+
+    return ctrlpts
+
+
+def _compute_basis(degree, knotvector, params, num_cpts):
+    """ Computes the spans and the non-vanishing basis functions of the parameters.
+
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param params: list of parameters
+    :type params: list, tuple
+    :param num_cpts: number of control points
+    :type num_cpts: int
+    :return: span and basis functions of each parameter
+    :rtype: list
+    """
+    basis = []
+    for u in params:
+        # Find span, same as helpers.find_span_linear
+        span = bisect_right(knotvector, u, degree + 1, num_cpts) - 1
+        basis.append((span, helpers.basis_function(degree, knotvector, span, u)))
+    return basis
+
+
+def _update_basis(basis, degree, knotvector_old, knotvector, params, num_cpts):
+    """ Updates the spans and the basis functions of the parameters after knot insertion.
+
+    The basis functions of a span only depend on the knots :math:`u_{i-p+1}, ..., u_{i+p}`. Therefore, the basis
+    functions are only recomputed for the parameters whose neighboring knots are changed.
+
+    :param basis: spans and basis functions computed using the old knot vector
+    :type basis: list
+    :param degree: degree
+    :type degree: int
+    :param knotvector_old: old knot vector
+    :type knotvector_old: list, tuple
+    :param knotvector: new knot vector
+    :type knotvector: list, tuple
+    :param params: list of parameters
+    :type params: list, tuple
+    :param num_cpts: number of control points of the new knot vector
+    :type num_cpts: int
+    :return: span and basis functions of each parameter
+    :rtype: list
+    """
+    basis_new = []
+    for (span_old, bfuncs), u in zip(basis, params):
+        span = bisect_right(knotvector, u, degree + 1, num_cpts) - 1
+        if knotvector[span - degree + 1:span + degree + 1] != knotvector_old[span_old - degree + 1:span_old + degree + 1]:
+            bfuncs = helpers.basis_function(degree, knotvector, span, u)
+        basis_new.append((span, bfuncs))
+    return basis_new
+
+
 def _build_coeff_matrix(degree, knotvector, params, points):
     """ Builds the coefficient matrix for global interpolation.
 
@@ -536,6 +1191,45 @@ def _build_coeff_matrix(degree, knotvector, params, points):
     return matrix_a
 
 
+def _build_coeff_matrix_banded(degree, knotvector, params, points):
+    """ Builds the coefficient matrix for global interpolation in band storage.
+
+    Each row of the coefficient matrix contains at most :math:`p + 1` nonzero basis functions, therefore the matrix is
+    stored row-wise in band storage. Please see :func:`.linalg.lu_decomposition_banded` for the storage format.
+
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param params: list of parameters
+    :type params: list, tuple
+    :param points: data points
+    :type points: list, tuple
+    :return: coefficient matrix in band storage, number of sub-diagonals and number of super-diagonals as a tuple
+    :rtype: tuple
+    """
+    # Number of data points
+    num_points = len(points)
+
+    # Find spans, same as helpers.find_span_linear
+    spans = [bisect_right(knotvector, u, degree + 1, num_points) - 1 for u in params]
+
+    # Find the bandwidth
+    num_lower = max([0] + [i - (span - degree) for i, span in enumerate(spans)])
+    num_upper = max([0] + [span - i for i, span in enumerate(spans)])
+
+    # Set up coefficient matrix
+    matrix_a = []
+    for i, span in enumerate(spans):
+        row = [0.0 for _ in range(num_lower + num_upper + 1)]
+        start = span - degree - i + num_lower
+        row[start:start + degree + 1] = helpers.basis_function(degree, knotvector, span, params[i])
+        matrix_a.append(row)
+
+    # Return coefficient matrix and the bandwidth
+    return matrix_a, num_lower, num_upper
+
+
 def _build_coeff_matrix_ders(degree, knotvector, params, points):
     """ Builds the coefficient matrix for global interpolation.
 
@@ -8,8 +8,9 @@
 """
 
 import os
-from copy import deepcopy
+from bisect import bisect_left, bisect_right
 from . import linalg
+from ._utilities import copy_array
 from .exceptions import GeomdlException
 try:
     from functools import lru_cache
@@ -537,7 +538,7 @@ def knot_insertion(degree, knotvector, ctrlpts, u, **kwargs):
 
     # Start filling the temporary local array which will be used to update control points during knot insertion
     for i in range(0, degree - s + 1):
-        temp[i] = deepcopy(ctrlpts[k - degree + i])
+        temp[i] = copy_array(ctrlpts[k - degree + i])
 
     # Insert knot "num" times
     for j in range(1, num + 1):
@@ -550,13 +551,13 @@ def knot_insertion(degree, knotvector, ctrlpts, u, **kwargs):
                 for idx in range(len(temp[i])):
                     temp[i][idx][:] = [alpha * elem2 + (1.0 - alpha) * elem1 for elem1, elem2 in
                                        zip(temp[i][idx], temp[i + 1][idx])]
-        ctrlpts_new[L] = deepcopy(temp[0])
-        ctrlpts_new[k + num - j - s] = deepcopy(temp[degree - j - s])
+        ctrlpts_new[L] = copy_array(temp[0])
+        ctrlpts_new[k + num - j - s] = copy_array(temp[degree - j - s])
 
     # Load remaining control points
     L = k - degree + num
     for i in range(L + 1, k - s):
-        ctrlpts_new[i] = deepcopy(temp[i - L])
+        ctrlpts_new[i] = copy_array(temp[i - L])
 
     # Return control points after knot insertion
     return ctrlpts_new
@@ -647,7 +648,7 @@ def knot_removal(degree, knotvector, ctrlpts, u, **kwargs):
     last = r - s
 
     # Don't change input variables, prepare new ones for updating
-    ctrlpts_new = deepcopy(ctrlpts)
+    ctrlpts_new = list(ctrlpts)
 
     is_volume = True
     if isinstance(ctrlpts_new[0][0], float):
@@ -801,8 +802,8 @@ def knot_removal_kv(knotvector, span, r):
     if r < 1:
         return knotvector
 
-    # Create a deep copy of the input knot  vector
-    kv_updated = deepcopy(knotvector)
+    # Create a copy of the input knot vector
+    kv_updated = list(knotvector)
 
     # Shift knots
     for k in range(span + 1, len(knotvector)):
@@ -815,6 +816,105 @@ def knot_removal_kv(knotvector, span, r):
     return kv_updated
 
 
+def knot_removal_spline(degree, knotvector, ctrlpts, **kwargs):
+    """ Removes as many internal knots as possible from the rational/non-rational spline within the error tolerance.
+
+    Implementation based on Algorithm A5.8 and the error bounded knot removal strategy of Section 9.4.5 of The NURBS
+    Book by Piegl & Tiller, 2nd Edition.
+
+    The internal knots are visited in a single sweep and each knot is removed as many times as possible. The removal
+    error of each step (Eq. 5.30) is accumulated on the knot spans of the input knot vector which are affected by the
+    removal and a removal step is only accepted if the accumulated error of all affected spans stays within the
+    tolerance. Therefore, the distance between the input and the output splines is bounded by the tolerance.
+
+    Please note that the distances are computed using the input control points, i.e. the weighted control points for
+    rational splines.
+
+    Keyword Arguments:
+        * ``tol``: maximum error tolerance. *Default: 10e-4*
+        * ``dimension``: spatial dimension of the points, which is used to compute the distances when the control
+          points are rows of a control points grid. *Default: length of the first control point*
+
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param ctrlpts: control points
+    :type ctrlpts: list, tuple
+    :return: control points and knot vector after knot removal and the maximum error bound
+    :rtype: tuple
+    """
+    # Get keyword arguments
+    tol = kwargs.get('tol', 10e-4)  # maximum error tolerance
+    dim = kwargs.get('dimension', len(ctrlpts[0]))  # spatial dimension
+
+    def lincomb(a1, pt1, a2, pt2):
+        return [a1 * c1 + a2 * c2 for c1, c2 in zip(pt1, pt2)]
+
+    def distance(pt1, pt2):
+        return max(linalg.point_distance(pt1[i:i + dim], pt2[i:i + dim]) for i in range(0, len(pt1), dim))
+
+    # Initialize variables
+    p = degree
+    kv = list(knotvector)
+    pts = list(ctrlpts)
+    breaks = sorted(set(kv))  # knot spans of the input knot vector, used for error accumulation
+    err_vec = [0.0 for _ in range(len(breaks) - 1)]
+
+    # Loop through the internal knots
+    for u in breaks[1:-1]:
+        while True:
+            r = bisect_right(kv, u) - 1  # index of the last occurrence of the knot
+            s = r - bisect_left(kv, u) + 1  # multiplicity
+            first = r - p
+            last = r - s
+
+            # Compute the new control points from both ends (Eqs. 5.28 & 5.29)
+            temp = [[] for _ in range(last - first + 3)]
+            temp[0] = pts[first - 1]
+            temp[-1] = pts[last + 1]
+            i = first
+            j = last
+            ii = 1
+            jj = last - first + 1
+            while j - i > 0:
+                alpha_i = (u - kv[i]) / (kv[i + p + 1] - kv[i])
+                alpha_j = (u - kv[j]) / (kv[j + p + 1] - kv[j])
+                temp[ii] = lincomb(1.0 / alpha_i, pts[i], -(1.0 - alpha_i) / alpha_i, temp[ii - 1])
+                temp[jj] = lincomb(1.0 / (1.0 - alpha_j), pts[j], -alpha_j / (1.0 - alpha_j), temp[jj + 1])
+                i += 1
+                j -= 1
+                ii += 1
+                jj -= 1
+
+            # Compute the removal error (Eq. 5.30)
+            if j - i < 0:
+                err = distance(temp[ii - 1], temp[jj + 1])
+                ii -= 1  # the middle control point is computed from both ends, keep the right one
+            else:
+                alpha_i = (u - kv[i]) / (kv[i + p + 1] - kv[i])
+                err = distance(pts[i], lincomb(alpha_i, temp[ii + 1], 1.0 - alpha_i, temp[ii - 1]))
+
+            # Check the accumulated error on the affected knot spans
+            span_start = bisect_left(breaks, kv[first])
+            span_end = bisect_left(breaks, kv[last + p + 1])
+            if any(e + err > tol for e in err_vec[span_start:span_end]):
+                break
+
+            # Remove the knot
+            for k in range(span_start, span_end):
+                err_vec[k] += err
+            pts = pts[:first] + temp[1:ii] + temp[jj + 1:-1] + pts[last + 1:]
+            del kv[r]
+
+            # Stop if the knot is completely removed
+            if s == 1:
+                break
+
+    # Return control points and knot vector after knot removal
+    return pts, kv, max(err_vec) if err_vec else 0.0
+
+
 def knot_refinement(degree, knotvector, ctrlpts, **kwargs):
     """ Computes the knot vector and the control points of the rational/non-rational spline after knot refinement.
 
@@ -931,12 +1031,12 @@ def knot_refinement(degree, knotvector, ctrlpts, **kwargs):
             new_kv[k] = knotvector[i]
             k -= 1
             i -= 1
-        new_ctrlpts[k - degree - 1] = deepcopy(new_ctrlpts[k - degree])
+        new_ctrlpts[k - degree - 1] = list(new_ctrlpts[k - degree])
         for l in range(1, degree + 1):
             idx = k - degree + l
             alpha = new_kv[k + l] - X[j]
             if abs(alpha) < tol:
-                new_ctrlpts[idx - 1] = deepcopy(new_ctrlpts[idx])
+                new_ctrlpts[idx - 1] = list(new_ctrlpts[idx])
             else:
                 alpha = alpha / (new_kv[k + l] - knotvector[i - degree + l])
                 if isinstance(ctrlpts[0][0], float):
@@ -954,6 +1054,162 @@ def knot_refinement(degree, knotvector, ctrlpts, **kwargs):
     return new_ctrlpts, new_kv
 
 
+def knot_refinement_oslo(degree, knotvector, knotvector_new):
+    """ Computes the nonzero entries of the knot refinement matrix using the Oslo algorithm.
+
+    Implementation of Oslo Algorithm 1 by Cohen, Lyche and Riesenfeld. Please refer to Section 4.3 of Spline Methods
+    by Lyche & Morken for details.
+
+    The refined control points are computed as :math:`Q_{j} = \\sum_{i} \\alpha_{i}(j) P_{i}`, where the
+    coefficients :math:`\\alpha_{i}(j)` are the discrete B-splines of the knot vector on the refined knot vector.
+    Only :math:`degree + 1` coefficients are nonzero for each refined control point, therefore each row of the matrix
+    is returned as the index of its first nonzero entry and the list of the nonzero entries.
+
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param knotvector_new: refined knot vector, which contains all knots of the input knot vector
+    :type knotvector_new: list, tuple
+    :return: a list of (index, coefficients) pairs for each refined control point
+    :rtype: list
+    """
+    num_ctrlpts = len(knotvector) - degree - 1
+    num_ctrlpts_new = len(knotvector_new) - degree - 1
+
+    matrix = []
+    for j in range(num_ctrlpts_new):
+        # Find the knot span of the old knot vector containing the j-th knot of the refined knot vector
+        mu = min(max(bisect_right(knotvector, knotvector_new[j]) - 1, degree), num_ctrlpts - 1)
+
+        # Evaluate the discrete B-splines alpha(mu - degree + m, j) via the triangular scheme
+        coeffs = [1.0]
+        for k in range(1, degree + 1):
+            x = knotvector_new[j + k]
+            coeffs_next = [0.0 for _ in range(k + 1)]
+            for m, c in enumerate(coeffs):
+                i = mu - k + 1 + m
+                denom = knotvector[i + k] - knotvector[i]
+                w = (x - knotvector[i]) / denom if denom != 0.0 else 0.0
+                coeffs_next[m] += (1.0 - w) * c
+                coeffs_next[m + 1] += w * c
+            coeffs = coeffs_next
+        matrix.append((mu - degree, coeffs))
+
+    return matrix
+
+
+def knot_refinement_matrix(degree, knotvector, knotvector_new):
+    """ Computes the knot refinement matrix.
+
+    The refinement matrix :math:`T` maps the control points of the spline to the control points of the spline on
+    the refined knot vector, i.e. :math:`Q = T P`. Please see :func:`.knot_refinement_oslo` for details.
+
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param knotvector_new: refined knot vector, which contains all knots of the input knot vector
+    :type knotvector_new: list, tuple
+    :return: refinement matrix
+    :rtype: list
+    """
+    num_ctrlpts = len(knotvector) - degree - 1
+    matrix = []
+    for start, coeffs in knot_refinement_oslo(degree, knotvector, knotvector_new):
+        row = [0.0 for _ in range(num_ctrlpts)]
+        row[start:start + len(coeffs)] = coeffs
+        matrix.append(row)
+    return matrix
+
+
+def knot_refinement_apply(matrix, ctrlpts):
+    """ Computes the refined control points from the output of :func:`.knot_refinement_oslo`.
+
+    :param matrix: a list of (index, coefficients) pairs for each refined control point
+    :type matrix: list, tuple
+    :param ctrlpts: control points
+    :type ctrlpts: list, tuple
+    :return: refined control points
+    :rtype: list
+    """
+    ctrlpts_new = []
+    for start, coeffs in matrix:
+        pt = None
+        for idx, c in enumerate(coeffs):
+            if c == 0.0:
+                continue
+            if pt is None:
+                pt = list(ctrlpts[start + idx]) if c == 1.0 else [c * p for p in ctrlpts[start + idx]]
+            else:
+                pt = [p1 + c * p2 for p1, p2 in zip(pt, ctrlpts[start + idx])]
+        ctrlpts_new.append(pt)
+    return ctrlpts_new
+
+
+def bezier_decomposition(degree, knotvector, ctrlpts):
+    """ Computes the control points of the Bezier segments of the rational/non-rational spline.
+
+    Implementation of Algorithm A5.6 of The NURBS Book by Piegl & Tiller, 2nd Edition.
+
+    All segments are extracted in a single pass over the knot vector, i.e. each internal knot is inserted until its
+    multiplicity is equal to the degree and the insertion coefficients of a knot span are computed only once. The
+    control points are expected to be flat lists of floats, therefore a grid of control points can be decomposed by
+    concatenating the points of each row of the grid.
+
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param ctrlpts: control points
+    :type ctrlpts: list, tuple
+    :return: control points of the Bezier segments and the knots separating the segments
+    :rtype: tuple
+    """
+    # Initialize variables
+    m = len(ctrlpts) + degree  # index of the last knot
+    a = degree
+    b = degree + 1
+
+    # Initialize the first segment and the list of break points
+    segments = [list(ctrlpts[0:degree + 1])]
+    knots = [knotvector[a]]
+
+    # Loop through the knot vector
+    while b < m:
+        i = b
+        while b < m and knotvector[b + 1] == knotvector[b]:
+            b += 1
+        mult = b - i + 1
+        segment = segments[-1]
+        segment_next = [[] for _ in range(degree + 1)]
+
+        # Insert the knot until its multiplicity is equal to the degree
+        if mult < degree:
+            numer = knotvector[b] - knotvector[a]
+            alphas = [numer / (knotvector[a + j] - knotvector[a]) for j in range(mult + 1, degree + 1)]
+            r = degree - mult
+            for j in range(1, r + 1):
+                s = mult + j
+                for k in range(degree, s - 1, -1):
+                    alpha = alphas[k - s]
+                    segment[k] = [alpha * p1 + (1.0 - alpha) * p2 for p1, p2 in zip(segment[k], segment[k - 1])]
+                # Control point shared by the current and the next segments
+                segment_next[r - j] = segment[degree]
+        knots.append(knotvector[b])
+
+        # Initialize the next segment
+        if b < m:
+            for i in range(max(degree - mult, 0), degree + 1):
+                segment_next[i] = ctrlpts[b - degree + i]
+            segments.append(segment_next)
+            a = b
+            b += 1
+
+    # Return control points of the segments and the break points
+    return segments, knots
+
+
 def degree_elevation(degree, ctrlpts, **kwargs):
     """ Computes the control points of the rational/non-rational spline after degree elevation.
 
@@ -986,13 +1242,12 @@ def degree_elevation(degree, ctrlpts, **kwargs):
     pts_elev = [[0.0 for _ in range(len(ctrlpts[0]))] for _ in range(num_pts_elev)]
 
     # Compute control points of degree-elevated 1-dimensional shape
+    coeffs = degree_elevation_coefficients(degree, num)
     for i in range(0, num_pts_elev):
         start = max(0, (i - num))
         end = min(degree, i)
         for j in range(start, end + 1):
-            coeff = linalg.binomial_coefficient(degree, j) * linalg.binomial_coefficient(num, (i - j))
-            coeff /= linalg.binomial_coefficient((degree + num), i)
-            pts_elev[i] = [p1 + (coeff * p2) for p1, p2 in zip(pts_elev[i], ctrlpts[j])]
+            pts_elev[i] = [p1 + (coeffs[i][j] * p2) for p1, p2 in zip(pts_elev[i], ctrlpts[j])]
 
     # Return computed control points after degree elevation
     return pts_elev
@@ -1035,16 +1290,12 @@ def degree_reduction(degree, ctrlpts, **kwargs):
 
     # Compute control points of degree-reduced 1-dimensional shape
     r = int((degree - 1) / 2)
-    # Handle a special case when degree = 2
-    if degree == 2:
-        r1 = r - 2
-    else:
-        # Determine r1 w.r.t. degree evenness
-        r1 = r - 1 if p_is_odd else r
+    # Determine r1 w.r.t. degree evenness
+    r1 = r - 1 if p_is_odd else r
     for i in range(1, r1 + 1):
         alpha = float(i) / float(degree)
         pts_red[i] = [(c1 - (alpha * c2)) / (1 - alpha) for c1, c2 in zip(ctrlpts[i], pts_red[i - 1])]
-    for i in range(degree - 2, r1 + 2):
+    for i in range(degree - 2, r, -1):
         alpha = float(i + 1) / float(degree)
         pts_red[i] = [(c1 - ((1 - alpha) * c2)) / alpha for c1, c2 in zip(ctrlpts[i + 1], pts_red[i + 1])]
 
@@ -1059,6 +1310,308 @@ def degree_reduction(degree, ctrlpts, **kwargs):
     return pts_red
 
 
+@lru_cache(maxsize=os.environ['GEOMDL_CACHE_SIZE'] if "GEOMDL_CACHE_SIZE" in os.environ else 128)
+def degree_elevation_coefficients(degree, num):
+    """ Computes the coefficients of the Bezier degree elevation.
+
+    Implementation of Eq. 5.36 of The NURBS Book by Piegl & Tiller, 2nd Edition, p.205
+
+    The coefficient table is computed once for each (degree, num) pair and cached.
+
+    :param degree: degree
+    :type degree: int
+    :param num: number of degree elevations
+    :type num: int
+    :return: coefficient table in [i][j] format, i.e. the coefficient of the j-th control point for the i-th
+        control point of the degree-elevated shape
+    :rtype: tuple
+    """
+    degree_elev = degree + num
+    coeffs = []
+    for i in range(degree_elev + 1):
+        inv = 1.0 / linalg.binomial_coefficient(degree_elev, i)
+        coeffs.append(tuple(inv * linalg.binomial_coefficient(degree, j) * linalg.binomial_coefficient(num, i - j)
+                            if max(0, i - num) <= j <= min(degree, i) else 0.0 for j in range(degree + 1)))
+    return tuple(coeffs)
+
+
+def degree_elevation_spline(degree, knotvector, ctrlpts, **kwargs):
+    """ Computes the knot vector and the control points of the rational/non-rational spline after degree elevation.
+
+    Implementation of Algorithm A5.9 of The NURBS Book by Piegl & Tiller, 2nd Edition.
+
+    The algorithm extracts the Bezier segments of the spline on the fly, degree elevates them and removes the
+    unnecessary knots in a single pass over the knot vector. The multiplicity of each knot is increased by ``num``,
+    therefore the shape and the continuity of the spline are preserved.
+
+    Keyword Arguments:
+        * ``num``: number of degree elevations. *Default: 1*
+
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param ctrlpts: control points
+    :type ctrlpts: list, tuple
+    :return: control points and knot vector of the degree-elevated spline
+    :rtype: tuple
+    """
+    # Get keyword arguments
+    t = kwargs.get('num', 1)  # number of degree elevations
+
+    if t <= 0:
+        raise GeomdlException("Cannot degree elevate " + str(t) + " times")
+
+    # Initialize variables
+    p = degree
+    u = knotvector
+    m = len(ctrlpts) + p  # index of the last knot
+    ph = p + t
+    bezalfs = degree_elevation_coefficients(p, t)
+
+    def lincomb(a1, pt1, a2, pt2):
+        return [a1 * c1 + a2 * c2 for c1, c2 in zip(pt1, pt2)]
+
+    mh = ph
+    kind = ph + 1
+    r = -1
+    a = p
+    b = p + 1
+    cind = 1
+    ua = u[0]
+    ctrlpts_new = [ctrlpts[0]]
+    kv_new = [ua for _ in range(ph + 1)]
+    bpts = list(ctrlpts[0:p + 1])
+    next_bpts = [[] for _ in range(p)]
+    ebpts = [[] for _ in range(ph + 1)]
+
+    # Loop through the knot vector
+    while b < m:
+        i = b
+        while b < m and u[b] == u[b + 1]:
+            b += 1
+        mul = b - i + 1
+        mh += mul + t
+        ub = u[b]
+        oldr = r
+        r = p - mul
+        lbz = (oldr + 2) // 2 if oldr > 0 else 1
+        rbz = ph - (r + 1) // 2 if r > 0 else ph
+
+        # Insert knot u[b] r times to extract the Bezier segment
+        if r > 0:
+            numer = ub - ua
+            alfs = [numer / (u[a + k] - ua) for k in range(mul + 1, p + 1)]
+            for j in range(1, r + 1):
+                save = r - j
+                s = mul + j
+                for k in range(p, s - 1, -1):
+                    bpts[k] = lincomb(alfs[k - s], bpts[k], 1.0 - alfs[k - s], bpts[k - 1])
+                next_bpts[save] = bpts[p]
+
+        # Degree elevate the Bezier segment
+        for i in range(lbz, ph + 1):
+            pt = [0.0 for _ in range(len(ctrlpts[0]))]
+            for j in range(max(0, i - t), min(p, i) + 1):
+                pt = [c1 + bezalfs[i][j] * c2 for c1, c2 in zip(pt, bpts[j])]
+            ebpts[i] = pt
+
+        # Remove knot u = ua oldr times
+        if oldr > 1:
+            first = kind - 2
+            last = kind
+            den = ub - ua
+            bet = (ub - kv_new[kind - 1]) / den
+            for tr in range(1, oldr):
+                i = first
+                j = last
+                kj = j - kind + 1
+                while j - i > tr:
+                    if i < cind:
+                        alf = (ub - kv_new[i]) / (ua - kv_new[i])
+                        ctrlpts_new[i] = lincomb(alf, ctrlpts_new[i], 1.0 - alf, ctrlpts_new[i - 1])
+                    if j >= lbz:
+                        if j - tr <= kind - ph + oldr:
+                            gam = (ub - kv_new[j - tr]) / den
+                            ebpts[kj] = lincomb(gam, ebpts[kj], 1.0 - gam, ebpts[kj + 1])
+                        else:
+                            ebpts[kj] = lincomb(bet, ebpts[kj], 1.0 - bet, ebpts[kj + 1])
+                    i += 1
+                    j -= 1
+                    kj -= 1
+                first -= 1
+                last += 1
+
+        # Load the knot ua
+        if a != p:
+            kv_new += [ua for _ in range(ph - oldr)]
+            kind += ph - oldr
+
+        # Load the control points
+        del ctrlpts_new[cind:]
+        ctrlpts_new += ebpts[lbz:rbz + 1]
+        cind += rbz - lbz + 1
+
+        # Set up for the next pass through the loop
+        if b < m:
+            bpts[0:r] = next_bpts[0:r]
+            bpts[r:p + 1] = ctrlpts[b - p + r:b + 1]
+            a = b
+            b += 1
+            ua = ub
+        else:
+            kv_new += [ub for _ in range(ph + 1)]
+
+    # Return control points and knot vector after degree elevation
+    return ctrlpts_new[0:mh - ph], kv_new
+
+
+def degree_reduction_spline(degree, knotvector, ctrlpts, **kwargs):
+    """ Computes the knot vector and the control points of the rational/non-rational spline after degree reduction.
+
+    Implementation of Algorithm A5.11 of The NURBS Book by Piegl & Tiller, 2nd Edition.
+
+    The algorithm extracts the Bezier segments of the spline on the fly, degree reduces them and removes the
+    unnecessary knots in a single pass over the knot vector while accumulating the error bounds of the Bezier degree
+    reduction and the knot removal steps. The error bound of a Bezier segment is computed as the maximum distance
+    between the control points of the segment and the degree-elevated control points of the reduced segment, which
+    is an upper bound of the distance between the curves due to the convex hull property.
+
+    Keyword Arguments:
+        * ``tol``: maximum error tolerance. If None, the error is not checked. *Default: None*
+        * ``dimension``: spatial dimension of the points, which is used to compute the distances when the control
+          points are rows of a control points grid. *Default: length of the first control point*
+
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param ctrlpts: control points
+    :type ctrlpts: list, tuple
+    :return: control points and knot vector of the degree-reduced spline and the maximum error bound
+    :rtype: tuple
+    """
+    # Get keyword arguments
+    tol = kwargs.get('tol', None)  # maximum error tolerance
+    dim = kwargs.get('dimension', len(ctrlpts[0]))  # spatial dimension
+
+    if degree < 2:
+        raise GeomdlException("Input spline geometry must have degree > 1")
+
+    def lincomb(a1, pt1, a2, pt2):
+        return [a1 * c1 + a2 * c2 for c1, c2 in zip(pt1, pt2)]
+
+    def distance(pt1, pt2):
+        return max(linalg.point_distance(pt1[i:i + dim], pt2[i:i + dim]) for i in range(0, len(pt1), dim))
+
+    def check_error(err):
+        if tol is not None and err > tol:
+            raise GeomdlException("Spline geometry is not degree reducible within the tolerance",
+                                  data=dict(error=err, tol=tol))
+
+    # Initialize variables
+    p = degree
+    u = knotvector
+    m = len(ctrlpts) + p  # index of the last knot
+    ph = p - 1
+    mh = ph
+    kind = ph + 1
+    r = -1
+    a = p
+    b = p + 1
+    cind = 1
+    ctrlpts_new = [ctrlpts[0] for _ in range(len(ctrlpts))]
+    kv_new = [u[0] for _ in range(ph + 1)]
+    bpts = list(ctrlpts[0:p + 1])
+    next_bpts = [[] for _ in range(p)]
+    err_vec = [0.0 for _ in range(m + 1)]
+
+    # Loop through the knot vector
+    while b < m:
+        i = b
+        while b < m and u[b] == u[b + 1]:
+            b += 1
+        mult = b - i + 1
+        mh += mult - 1
+        oldr = r
+        r = p - mult
+        lbz = (oldr + 2) // 2 if oldr > 0 else 1
+
+        # Insert knot u[b] r times to extract the Bezier segment
+        if r > 0:
+            numer = u[b] - u[a]
+            alphas = [numer / (u[a + k] - u[a]) for k in range(mult + 1, p + 1)]
+            for j in range(1, r + 1):
+                save = r - j
+                s = mult + j
+                for k in range(p, s - 1, -1):
+                    bpts[k] = lincomb(alphas[k - s], bpts[k], 1.0 - alphas[k - s], bpts[k - 1])
+                next_bpts[save] = bpts[p]
+
+        # Degree reduce the Bezier segment and compute its error bound
+        rbpts = degree_reduction(p, bpts, check_num=False)
+        ebpts = degree_elevation(ph, rbpts, num=1, check_num=False)
+        err_vec[a] += max(distance(pt1, pt2) for pt1, pt2 in zip(bpts, ebpts))
+        check_error(err_vec[a])
+
+        # Remove knot u[a] oldr times
+        if oldr > 0:
+            first = kind
+            last = kind
+            for k in range(oldr):
+                i = first
+                j = last
+                kj = j - kind
+                while j - i > k:
+                    alfa = (u[a] - kv_new[i - 1]) / (u[b] - kv_new[i - 1])
+                    beta = (u[a] - kv_new[j - k - 1]) / (u[b] - kv_new[j - k - 1])
+                    ctrlpts_new[i - 1] = lincomb(1.0 / alfa, ctrlpts_new[i - 1], -(1.0 - alfa) / alfa,
+                                                 ctrlpts_new[i - 2])
+                    rbpts[kj] = lincomb(1.0 / (1.0 - beta), rbpts[kj], -beta / (1.0 - beta), rbpts[kj + 1])
+                    i += 1
+                    j -= 1
+                    kj -= 1
+
+                # Compute the knot removal error bound
+                if j - i < k:
+                    err_rem = distance(ctrlpts_new[i - 2], rbpts[kj + 1])
+                else:
+                    delta = (u[a] - kv_new[i - 1]) / (u[b] - kv_new[i - 1])
+                    err_rem = distance(ctrlpts_new[i - 1], lincomb(delta, rbpts[kj + 1], 1.0 - delta,
+                                                                   ctrlpts_new[i - 2]))
+
+                # Update the error vector
+                q = (2 * p - k + 1) // 2
+                for ii in range(a + oldr - k - q, a + 1):
+                    err_vec[ii] += err_rem
+                    check_error(err_vec[ii])
+                first -= 1
+                last += 1
+            cind = i - 1
+
+        # Load the knot u[a]
+        if a != p:
+            kv_new += [u[a] for _ in range(ph - oldr)]
+            kind += ph - oldr
+
+        # Load the control points
+        for i in range(lbz, ph + 1):
+            ctrlpts_new[cind] = rbpts[i]
+            cind += 1
+
+        # Set up for the next pass through the loop
+        if b < m:
+            bpts[0:r] = next_bpts[0:r]
+            bpts[r:p + 1] = ctrlpts[b - p + r:b + 1]
+            a = b
+            b += 1
+        else:
+            kv_new += [u[b] for _ in range(ph + 1)]
+
+    # Return control points and knot vector after degree reduction
+    return ctrlpts_new[0:mh - ph], kv_new, max(err_vec)
+
+
 def curve_deriv_cpts(dim, degree, kv, cpts, rs, deriv_order=0):
     """ Compute control points of curve derivatives.
 
@@ -9,7 +9,6 @@
 
 import os
 import math
-from copy import deepcopy
 from functools import reduce
 from .exceptions import GeomdlException
 from . import _linalg
@@ -367,7 +366,7 @@ def matrix_pivot(m, sign=False):
     :return: a tuple containing the matrix product of M x P, P and det(P)
     :rtype: tuple
     """
-    mp = deepcopy(m)
+    mp = [list(row) for row in m]
     n = len(mp)
     p = matrix_identity(n)  # permutation matrix
     num_rowswap = 0
@@ -552,6 +551,42 @@ def binomial_coefficient(k, i):
     return float(k_fact / (k_i_fact * i_fact))
 
 
+@lru_cache(maxsize=os.environ['GEOMDL_CACHE_SIZE'] if "GEOMDL_CACHE_SIZE" in os.environ else 16)
+def gauss_legendre(num):
+    """ Computes the nodes and the weights of the Gauss-Legendre quadrature rule on the [-1, 1] interval.
+
+    The nodes are the roots of the Legendre polynomial of degree ``num``, which are computed using Newton iteration.
+    The quadrature rule integrates the polynomials up to degree ``2 * num - 1`` exactly.
+
+    :param num: number of quadrature points
+    :type num: int
+    :return: a tuple containing the nodes and the weights
+    :rtype: tuple
+    """
+    if num < 1:
+        raise GeomdlException("Number of quadrature points must be a positive integer", data=dict(num=num))
+
+    nodes = [0.0 for _ in range(num)]
+    weights = [0.0 for _ in range(num)]
+    for i in range((num + 1) // 2):
+        # Initial guess for the i-th root
+        x = math.cos(math.pi * (i + 0.75) / (num + 0.5))
+        for _ in range(100):
+            # Evaluate the Legendre polynomial and its derivative using the recurrence relation
+            p0, p1 = 1.0, x
+            for k in range(2, num + 1):
+                p0, p1 = p1, ((2 * k - 1) * x * p1 - (k - 1) * p0) / k
+            dp = num * (x * p1 - p0) / (x * x - 1.0)
+            dx = p1 / dp
+            x -= dx
+            if abs(dx) <= 10e-16:
+                break
+        nodes[i] = -x
+        nodes[num - 1 - i] = x
+        weights[i] = weights[num - 1 - i] = 2.0 / ((1.0 - x * x) * dp * dp)
+    return tuple(nodes), tuple(weights)
+
+
 def lu_decomposition(matrix_a):
     """ LU-Factorization method using Doolittle's Method for solution of linear systems.
 
@@ -691,6 +726,150 @@ def lu_factor(matrix_a, b):
     return x
 
 
+def lu_decomposition_banded(matrix_ab, num_lower, num_upper):
+    """ LU-Factorization of a banded matrix using Doolittle's Method without pivoting.
+
+    The input matrix is stored row-wise in band storage, i.e. each row contains ``num_lower + num_upper + 1`` elements
+    and the element :math:`a_{ij}` of the full matrix is stored in ``matrix_ab[i][j - i + num_lower]``. The elements
+    which lie outside of the full matrix are ignored. The factorization requires :math:`O(n \\times l \\times u)`
+    operations and :math:`O(n \\times (l + u + 1))` memory, compared to :math:`O(n^3)` operations and :math:`O(n^2)`
+    memory required by :func:`lu_decomposition`.
+
+    Since no pivoting is applied, the input matrix should not require pivoting, e.g. the collocation matrices of the
+    B-spline basis functions (please refer to The NURBS Book (2nd Edition), p.370).
+
+    :param matrix_ab: input matrix in band storage
+    :type matrix_ab: list, tuple
+    :param num_lower: number of sub-diagonals, :math:`l`
+    :type num_lower: int
+    :param num_upper: number of super-diagonals, :math:`u`
+    :type num_upper: int
+    :return: L and U factors in band storage (unit diagonal of L is not stored)
+    :rtype: list
+    """
+    # Check the band storage
+    q = num_lower + num_upper + 1
+    for idx, m_a in enumerate(matrix_ab):
+        if len(m_a) != q:
+            raise ValueError("The input must be a banded matrix with " + str(q) + " elements in each row. " +
+                             "Row " + str(idx + 1) + " has a size of " + str(len(m_a)) + ".")
+
+    # Return combined L and U matrices
+    return _linalg.doolittle_banded(matrix_ab, num_lower, num_upper)
+
+
+def lu_substitution_banded(matrix_lu, num_lower, num_upper, b):
+    """ Computes the solution to a system of linear equations using the factors of a banded matrix.
+
+    This function solves :math:`LUx = b` where the L and U factors are computed by :func:`lu_decomposition_banded`.
+    :math:`b` is :math:`N \\times M` matrix of :math:`M` column vectors. Each column of :math:`x` is a solution for
+    corresponding column of :math:`b`. Please use this function to solve for multiple right-hand sides using the same
+    factorization.
+
+    :param matrix_lu: L and U factors in band storage
+    :type matrix_lu: list, tuple
+    :param num_lower: number of sub-diagonals
+    :type num_lower: int
+    :param num_upper: number of super-diagonals
+    :type num_upper: int
+    :param b: matrix of M column vectors
+    :type b: list, tuple
+    :return: x, the solution matrix
+    :rtype: list
+    """
+    if len(b) != len(matrix_lu):
+        raise ValueError("The number of rows of b must be equal to the size of the matrix")
+    return _linalg.lu_substitution_banded(matrix_lu, num_lower, num_upper, b)
+
+
+def lu_solve_banded(matrix_ab, num_lower, num_upper, b):
+    """ Computes the solution to a system of linear equations with a banded coefficient matrix.
+
+    This function solves :math:`Ax = b` using LU decomposition in band storage. Please see
+    :func:`lu_decomposition_banded` for the band storage format. :math:`b` is :math:`N \\times M` matrix of :math:`M`
+    column vectors. Each column of :math:`x` is a solution for corresponding column of :math:`b`.
+
+    :param matrix_ab: matrix A in band storage
+    :type matrix_ab: list, tuple
+    :param num_lower: number of sub-diagonals
+    :type num_lower: int
+    :param num_upper: number of super-diagonals
+    :type num_upper: int
+    :param b: matrix of M column vectors
+    :type b: list, tuple
+    :return: x, the solution matrix
+    :rtype: list
+    """
+    matrix_lu = lu_decomposition_banded(matrix_ab, num_lower, num_upper)
+    return lu_substitution_banded(matrix_lu, num_lower, num_upper, b)
+
+
+def cholesky_decomposition_banded(matrix_ab, bandwidth):
+    """ Cholesky factorization of a symmetric positive-definite banded matrix.
+
+    Decomposes the matrix :math:`A` such that :math:`A = LL^{T}`. Only the lower triangle of the input matrix is used
+    and it is stored row-wise in band storage, i.e. each row contains ``bandwidth + 1`` elements and the element
+    :math:`a_{ij}`, :math:`j \\leq i`, of the full matrix is stored in ``matrix_ab[i][j - i + bandwidth]``. The elements
+    which lie outside of the full matrix are ignored.
+
+    :param matrix_ab: lower triangle of the input matrix in band storage
+    :type matrix_ab: list, tuple
+    :param bandwidth: number of sub-diagonals
+    :type bandwidth: int
+    :return: L factor in band storage
+    :rtype: list
+    """
+    # Check the band storage
+    for idx, m_a in enumerate(matrix_ab):
+        if len(m_a) != bandwidth + 1:
+            raise ValueError("The input must be a banded matrix with " + str(bandwidth + 1) + " elements in each row. " +
+                             "Row " + str(idx + 1) + " has a size of " + str(len(m_a)) + ".")
+
+    # Return L matrix
+    return _linalg.cholesky_banded(matrix_ab, bandwidth)
+
+
+def cholesky_substitution_banded(matrix_l, bandwidth, b):
+    """ Computes the solution to a system of linear equations using the Cholesky factor of a banded matrix.
+
+    This function solves :math:`LL^{T}x = b` where the factor L is computed by :func:`cholesky_decomposition_banded`.
+    :math:`b` is :math:`N \\times M` matrix of :math:`M` column vectors. Each column of :math:`x` is a solution for
+    corresponding column of :math:`b`.
+
+    :param matrix_l: L factor in band storage
+    :type matrix_l: list, tuple
+    :param bandwidth: number of sub-diagonals
+    :type bandwidth: int
+    :param b: matrix of M column vectors
+    :type b: list, tuple
+    :return: x, the solution matrix
+    :rtype: list
+    """
+    if len(b) != len(matrix_l):
+        raise ValueError("The number of rows of b must be equal to the size of the matrix")
+    return _linalg.cholesky_substitution_banded(matrix_l, bandwidth, b)
+
+
+def cholesky_solve_banded(matrix_ab, bandwidth, b):
+    """ Computes the solution to a system of linear equations with a symmetric positive-definite banded matrix.
+
+    This function solves :math:`Ax = b` using Cholesky factorization in band storage. Please see
+    :func:`cholesky_decomposition_banded` for the band storage format. :math:`b` is :math:`N \\times M` matrix of
+    :math:`M` column vectors. Each column of :math:`x` is a solution for corresponding column of :math:`b`.
+
+    :param matrix_ab: lower triangle of matrix A in band storage
+    :type matrix_ab: list, tuple
+    :param bandwidth: number of sub-diagonals
+    :type bandwidth: int
+    :param b: matrix of M column vectors
+    :type b: list, tuple
+    :return: x, the solution matrix
+    :rtype: list
+    """
+    matrix_l = cholesky_decomposition_banded(matrix_ab, bandwidth)
+    return cholesky_substitution_banded(matrix_l, bandwidth, b)
+
+
 def linspace(start, stop, num, decimals=18):
     """ Returns a list of evenly spaced numbers over a specified interval.
 
@@ -8,6 +8,7 @@
 """
 
 import abc
+import copy
 import warnings
 from functools import partial
 from multiprocessing import Value, Lock
@@ -16,6 +17,9 @@ from . import vis
 from . import voxelize
 from . import utilities
 from . import tessellate
+from . import elements
+from . import _operations as ops
+from . import _tessellate as tsl
 from . import _utilities as utl
 from .exceptions import GeomdlException
 
@@ -45,6 +49,7 @@ class AbstractContainer(abstract.GeomdlBase):
     def __init__(self, *args, **kwargs):
         self._pdim = 0 if not hasattr(self, '_pdim') else self._pdim  # number of parametric dimensions
         self._dinit = 0.01 if not hasattr(self, '_dinit') else self._dinit  # delta initialization value
+        self._transform = None  # pending transformation matrix
         super(AbstractContainer, self).__init__(**kwargs)
         self._geometry_type = "container"
         self._name = self._geometry_type
@@ -53,6 +58,34 @@ class AbstractContainer(abstract.GeomdlBase):
         self._vis_component = None  # visualization component
         self._cache['evalpts'] = []
 
+    def __copy__(self):
+        # Generate copy-on-write copies of the geometries
+        result = super(AbstractContainer, self).__copy__()
+        result._elements = [copy.copy(elem) for elem in self._element_list]
+        result._delta = list(self._delta)
+        result._opt_data = dict(self._opt_data)
+        result._vis_component = copy.deepcopy(self._vis_component)
+        # Reset the cached evaluation and tessellation results
+        result._cache = dict((k, None if v is None else []) for k, v in self._cache.items())
+        return result
+
+    @property
+    def _elements(self):
+        # Apply the pending transformation before the contained geometries are accessed
+        self._apply_transform()
+        return self._element_list
+
+    @_elements.setter
+    def _elements(self, value):
+        self._element_list = value
+
+    def _apply_transform(self):
+        """ Applies the pending transformation matrix to all contained geometries. """
+        if self._transform is not None:
+            matrix, self._transform = self._transform, None
+            for elem in self._element_list:
+                ops.transform_geometry(elem, matrix)
+
     def __iter__(self):
         self._iter_index = 0
         return self
@@ -493,6 +526,7 @@ class SurfaceContainer(AbstractContainer):
         super(SurfaceContainer, self).__init__(*args, **kwargs)
         self._cache['vertices'] = []
         self._cache['faces'] = []
+        self._cache['mesh'] = None
         for arg in args:
             self.add(arg)
 
@@ -636,6 +670,26 @@ class SurfaceContainer(AbstractContainer):
             self.tessellate()
         return self._cache['faces']
 
+    @property
+    def mesh(self):
+        """ Vertices and faces generated by the tessellation operation as a structure of arrays.
+
+        The mesh contains the vertices and the faces of all surfaces inside the container and
+        :py:attr:`.elements.Mesh.surface_ids` stores the index of the surface that generated the face. Please see
+        :py:class:`.elements.Mesh` for details.
+
+        :getter: Gets the mesh
+        :type: elements.Mesh
+        """
+        if not self._cache['vertices']:
+            self.tessellate()
+        if self._cache['mesh'] is None:
+            self._cache['mesh'] = elements.Mesh.merge(
+                *[elements.Mesh.from_elements(elem.vertices, elem.faces, surface_id=idx)
+                  for idx, elem in enumerate(self._elements)]
+            )
+        return self._cache['mesh']
+
     def tessellate(self, **kwargs):
         """ Tessellates the surfaces inside the container.
 
@@ -663,10 +717,32 @@ class SurfaceContainer(AbstractContainer):
             * ``num_procs``: number of concurrent processes for tessellating the surfaces. *Default: 1*
             * ``delta``: if True, the evaluation delta of the container object will be used. *Default: True*
             * ``force``: flag to force tessellation. *Default: False*
+            * ``watertight``: if True, generates a single welded mesh from all surfaces. *Default: False*
+            * ``tol``: tolerance for finding shared boundaries and welding vertices. *Default: 10e-8*
+
+        By default, the container vertices and faces are the concatenation of the tessellation results of the
+        surfaces. Therefore, the boundaries shared by the surfaces generate duplicate vertices. ``watertight`` option
+        finds the boundaries shared by the surfaces, evaluates the vertices on each shared boundary once and welds the
+        coincident vertices. If the surfaces are sampled differently, both sides of a shared boundary are refined to
+        a common set of boundary parameters to avoid T-junctions. The resultant vertices and faces are new instances
+        composing a single indexed mesh, i.e. the tessellation results stored in the surfaces are not affected by the
+        welding operation.
+
+        .. code-block:: python
+            :linenos:
+
+            # Generate a single welded mesh
+            surf_container.tessellate(watertight=True, force=True)
+
+            # Vertices and faces of the welded mesh
+            vertices = surf_container.vertices
+            faces = surf_container.faces
         """
         # Keyword arguments
         force_tsl = kwargs.get('force', False)
         update_delta = kwargs.pop('delta', True)
+        watertight = kwargs.pop('watertight', False)
+        tol = kwargs.pop('tol', 10e-8)
 
         # Don't re-tessellate if everything is in place
         if all((self._cache['vertices'], self._cache['faces'])) and not force_tsl:
@@ -685,6 +761,17 @@ class SurfaceContainer(AbstractContainer):
                 tmp_elem = process_tessellate(self._elements[idx], delta=self.delta, update_delta=update_delta, **kwargs)
                 new_elems.append(tmp_elem)
         self._elements = new_elems
+        self._cache['mesh'] = None
+
+        # Generate a single mesh by welding the vertices
+        if watertight:
+            meshes = [elements.Mesh.from_elements(elem.vertices, elem.faces, surface_id=idx)
+                      for idx, elem in enumerate(self._elements)]
+            tsl.sample_shared_boundaries(self._elements, meshes, tsl.find_shared_boundaries(self._elements, tol), tol)
+            mesh = elements.Mesh.merge(*meshes)
+            self._cache['mesh'] = tsl.weld_mesh(mesh, tol)
+            self._cache['vertices'], self._cache['faces'] = self._cache['mesh'].to_elements()
+            return
 
         # Update caches
         verts = []
@@ -707,11 +794,70 @@ class SurfaceContainer(AbstractContainer):
         self._cache['vertices'] = verts
         self._cache['faces'] = faces
 
+    def tessellate_lod(self, **kwargs):
+        """ Generates a level-of-detail (LOD) pyramid of the surfaces inside the container.
+
+        Please see :py:meth:`.abstract.Surface.tessellate_lod` for details. The levels of the surfaces are merged
+        into a single list of levels ordered from the finest to the coarsest level. Each level is a dict with the
+        following keys:
+
+        * ``vertices``: vertices of all surfaces (numbered continuously)
+        * ``faces``: faces of all surfaces (numbered continuously)
+        * ``sample_size``: list of the sample sizes of the surfaces
+        * ``error``: maximum error of all surfaces
+
+        Keyword Arguments:
+            * ``num_levels``: number of levels in the pyramid. *Default: 4*
+            * ``num_procs``: number of concurrent processes for generating the pyramids of the surfaces. *Default: 1*
+            * ``delta``: if True, the evaluation delta of the container object will be used. *Default: True*
+
+        Remaining keyword arguments are directly passed to the tessellation components.
+
+        :return: list of levels
+        :rtype: list
+        """
+        # Keyword arguments
+        update_delta = kwargs.pop('delta', True)
+        num_procs = kwargs.pop('num_procs', 1)
+
+        # Update evaluation delta of the surfaces
+        if update_delta:
+            for elem in self._elements:
+                elem.delta = self.delta
+
+        # Generate the pyramids of the surfaces
+        if num_procs > 1:
+            with utl.pool_context(processes=num_procs) as pool:
+                elem_levels = pool.map(partial(process_tessellate_lod, **kwargs), self._elements)
+        else:
+            elem_levels = [process_tessellate_lod(elem, **kwargs) for elem in self._elements]
+
+        # Merge the levels
+        levels = []
+        for lvl in zip(*elem_levels):
+            verts = []
+            faces = []
+            for elvl in lvl:
+                for v in elvl['vertices']:
+                    v.id += len(verts)
+                for f in elvl['faces']:
+                    f.id += len(faces)
+                verts += elvl['vertices']
+                faces += elvl['faces']
+            levels.append(dict(
+                vertices=verts,
+                faces=faces,
+                sample_size=[elvl['sample_size'] for elvl in lvl],
+                error=max([elvl['error'] for elvl in lvl])
+            ))
+        return levels
+
     def reset(self):
         """ Resets the cache. """
         super(SurfaceContainer, self).reset()
         self._cache['vertices'][:] = []
         self._cache['faces'][:] = []
+        self._cache['mesh'] = None
 
     def render(self, **kwargs):
         """ Renders the surfaces.
@@ -1074,9 +1220,9 @@ class VolumeContainer(AbstractContainer):
 
             # Add evaluated points as voxels
             if self._vis_component.mconf['evalpts'] == 'voxels':
-                grid, filled = voxelize.voxelize(elem, **kwargs)
-                polygrid = voxelize.convert_bb_to_faces(grid)
-                self._vis_component.add(ptsarr=[polygrid, filled], name=elem.name,
+                kwargs['compact'] = True
+                vgrid = voxelize.voxelize(elem, **kwargs)[0]
+                self._vis_component.add(ptsarr=vgrid, name=elem.name,
                                         color=color[1], plot_type='evalpts', idx=idx)
 
         # Display the figures
@@ -1141,6 +1287,19 @@ def process_tessellate(elem, update_delta, delta, **kwargs):
     return elem
 
 
+def process_tessellate_lod(elem, **kwargs):
+    """ Generates level-of-detail pyramids of the surfaces.
+
+    .. note:: Helper function required for ``multiprocessing``
+
+    :param elem: surface
+    :type elem: abstract.Surface
+    :return: list of levels
+    :rtype: list
+    """
+    return elem.tessellate_lod(**kwargs)
+
+
 def process_elements_surface(elem, mconf, colorval, idx, force_tsl, update_delta, delta, reset_names):
     """ Processes visualization elements for surfaces.
 
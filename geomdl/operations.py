@@ -93,199 +93,152 @@ def insert_knot(obj, param, num, **kwargs):
             obj.set_ctrlpts(cpts_tmp)
             obj.knotvector = kv_new
 
-    # Start surface knot insertion
-    if isinstance(obj, abstract.Surface):
-        # u-direction
-        if param[0] is not None and num[0] > 0:
-            # Find knot multiplicity
-            s_u = helpers.find_multiplicity(param[0], obj.knotvector_u)
-
-            # Check if it is possible add that many number of knots
-            if check_num and num[0] > obj.degree_u - s_u:
-                raise GeomdlException("Knot " + str(param[0]) + " cannot be inserted " + str(num[0]) + " times (u-dir)",
-                                      data=dict(knot=param[0], num=num[0], multiplicity=s_u))
-
-            # Find knot span
-            span_u = helpers.find_span_linear(obj.degree_u, obj.knotvector_u, obj.ctrlpts_size_u, param[0])
-
-            # Compute new knot vector
-            kv_u = helpers.knot_insertion_kv(obj.knotvector_u, param[0], span_u, num[0])
-
-            # Get curves
-            cpts_tmp = []
-            cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
-            for v in range(obj.ctrlpts_size_v):
-                ccu = [cpts[v + (obj.ctrlpts_size_v * u)] for u in range(obj.ctrlpts_size_u)]
-                ctrlpts_tmp = helpers.knot_insertion(obj.degree_u, obj.knotvector_u, ccu, param[0],
-                                                     num=num[0], s=s_u, span=span_u)
-                cpts_tmp += ctrlpts_tmp
-
-            # Update the surface after knot insertion
-            obj.set_ctrlpts(compatibility.flip_ctrlpts_u(cpts_tmp, obj.ctrlpts_size_u + num[0], obj.ctrlpts_size_v),
-                            obj.ctrlpts_size_u + num[0], obj.ctrlpts_size_v)
-            obj.knotvector_u = kv_u
-
-        # v-direction
-        if param[1] is not None and num[1] > 0:
-            # Find knot multiplicity
-            s_v = helpers.find_multiplicity(param[1], obj.knotvector_v)
-
-            # Check if it is possible add that many number of knots
-            if check_num and num[1] > obj.degree_v - s_v:
-                raise GeomdlException("Knot " + str(param[1]) + " cannot be inserted " + str(num[1]) + " times (v-dir)",
-                                      data=dict(knot=param[1], num=num[1], multiplicity=s_v))
-
-            # Find knot span
-            span_v = helpers.find_span_linear(obj.degree_v, obj.knotvector_v, obj.ctrlpts_size_v, param[1])
-
-            # Compute new knot vector
-            kv_v = helpers.knot_insertion_kv(obj.knotvector_v, param[1], span_v, num[1])
-
-            # Get curves
-            cpts_tmp = []
-            cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
-            for u in range(obj.ctrlpts_size_u):
-                ccv = [cpts[v + (obj.ctrlpts_size_v * u)] for v in range(obj.ctrlpts_size_v)]
-                ctrlpts_tmp = helpers.knot_insertion(obj.degree_v, obj.knotvector_v, ccv, param[1],
-                                                     num=num[1], s=s_v, span=span_v)
-                cpts_tmp += ctrlpts_tmp
-
-            # Update the surface after knot insertion
-            obj.set_ctrlpts(cpts_tmp, obj.ctrlpts_size_u, obj.ctrlpts_size_v + num[1])
-            obj.knotvector_v = kv_v
-
-    # Start volume knot insertion
-    if isinstance(obj, abstract.Volume):
-        # u-direction
-        if param[0] is not None and num[0] > 0:
-            # Find knot multiplicity
-            s_u = helpers.find_multiplicity(param[0], obj.knotvector_u)
-
-            # Check if it is possible add that many number of knots
-            if check_num and num[0] > obj.degree_u - s_u:
-                raise GeomdlException("Knot " + str(param[0]) + " cannot be inserted " + str(num[0]) + " times (u-dir)",
-                                      data=dict(knot=param[0], num=num[0], multiplicity=s_u))
-
-            # Find knot span
-            span_u = helpers.find_span_linear(obj.degree_u, obj.knotvector_u, obj.ctrlpts_size_u, param[0])
-
-            # Compute new knot vector
-            kv_u = helpers.knot_insertion_kv(obj.knotvector_u, param[0], span_u, num[0])
-
-            # Use Pw if rational
-            cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
-
-            # Construct 2-dimensional structure
-            cpt2d = []
-            for u in range(obj.ctrlpts_size_u):
-                temp_surf = []
-                for w in range(obj.ctrlpts_size_w):
-                    for v in range(obj.ctrlpts_size_v):
-                        temp_pt = cpts[v + (u * obj.ctrlpts_size_v) + (w * obj.ctrlpts_size_u * obj.ctrlpts_size_v)]
-                        temp_surf.append(temp_pt)
-                cpt2d.append(temp_surf)
-
-            # Compute new control points
-            ctrlpts_tmp = helpers.knot_insertion(obj.degree_u, obj.knotvector_u, cpt2d, param[0],
-                                                 num=num[0], s=s_u, span=span_u)
-
-            # Flatten to 1-dimensional structure
-            ctrlpts_new = []
-            for w in range(obj.ctrlpts_size_w):
-                for u in range(obj.ctrlpts_size_u + num[0]):
-                    for v in range(obj.ctrlpts_size_v):
-                        temp_pt = ctrlpts_tmp[u][v + (w * obj.ctrlpts_size_v)]
-                        ctrlpts_new.append(temp_pt)
-
-            # Update the volume after knot insertion
-            obj.set_ctrlpts(ctrlpts_new, obj.ctrlpts_size_u + num[0], obj.ctrlpts_size_v, obj.ctrlpts_size_w)
-            obj.knotvector_u = kv_u
-
-        # v-direction
-        if param[1] is not None and num[1] > 0:
-            # Find knot multiplicity
-            s_v = helpers.find_multiplicity(param[1], obj.knotvector_v)
-
-            # Check if it is possible add that many number of knots
-            if check_num and num[1] > obj.degree_v - s_v:
-                raise GeomdlException("Knot " + str(param[1]) + " cannot be inserted " + str(num[1]) + " times (v-dir)",
-                                      data=dict(knot=param[1], num=num[1], multiplicity=s_v))
-
-            # Find knot span
-            span_v = helpers.find_span_linear(obj.degree_v, obj.knotvector_v, obj.ctrlpts_size_v, param[1])
+    # Start surface and volume knot insertion
+    if isinstance(obj, (abstract.Surface, abstract.Volume)):
+        # Use Pw if rational
+        cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
+        cpsize = list(obj.cpsize)
+        kv_new = list(obj.knotvector)
+
+        for idx, pdir in enumerate(["u", "v", "w"][:obj.pdimension]):
+            if param[idx] is not None and num[idx] > 0:
+                degree = obj.degree[idx]
+                kv = kv_new[idx]
+
+                # Find knot multiplicity
+                s = helpers.find_multiplicity(param[idx], kv)
+
+                # Check if it is possible add that many number of knots
+                if check_num and num[idx] > degree - s:
+                    raise GeomdlException("Knot " + str(param[idx]) + " cannot be inserted " + str(num[idx]) +
+                                          " times (" + pdir + "-dir)",
+                                          data=dict(knot=param[idx], num=num[idx], multiplicity=s))
+
+                # Find knot span
+                span = helpers.find_span_linear(degree, kv, cpsize[idx], param[idx])
+
+                # Compute new knot vector
+                kv_new[idx] = helpers.knot_insertion_kv(kv, param[idx], span, num[idx])
+
+                # Compute new control points for all rows of the control points grid at once
+                rows = ops.ctrlpts_to_rows(cpts, cpsize, idx)
+                rows_new = helpers.knot_insertion(degree, kv, rows, param[idx], num=num[idx], s=s, span=span)
+                cpsize[idx] += num[idx]
+                cpts = ops.rows_to_ctrlpts(rows_new, cpsize, idx, len(cpts[0]))
+
+        # Update the spline geometry after knot insertion
+        if cpsize != obj.cpsize:
+            obj.set_ctrlpts(cpts, *cpsize)
+            obj.knotvector = kv_new
 
-            # Compute new knot vector
-            kv_v = helpers.knot_insertion_kv(obj.knotvector_v, param[1], span_v, num[1])
+    # Return updated spline geometry
+    return obj
 
-            # Use Pw if rational
-            cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
 
-            # Construct 2-dimensional structure
-            cpt2d = []
-            for v in range(obj.ctrlpts_size_v):
-                temp_surf = []
-                for w in range(obj.ctrlpts_size_w):
-                    for u in range(obj.ctrlpts_size_u):
-                        temp_pt = cpts[v + (u * obj.ctrlpts_size_v) + (w * obj.ctrlpts_size_u * obj.ctrlpts_size_v)]
-                        temp_surf.append(temp_pt)
-                cpt2d.append(temp_surf)
-
-            # Compute new control points
-            ctrlpts_tmp = helpers.knot_insertion(obj.degree_v, obj.knotvector_v, cpt2d, param[1],
-                                                 num=num[1], s=s_v, span=span_v)
+@export
+def insert_knots(obj, knots, **kwargs):
+    """ Inserts multiple knots to a spline geometry in a single pass.
 
-            # Flatten to 1-dimensional structure
-            ctrlpts_new = []
-            for w in range(obj.ctrlpts_size_w):
-                for u in range(obj.ctrlpts_size_u):
-                    for v in range(obj.ctrlpts_size_v + num[1]):
-                        temp_pt = ctrlpts_tmp[v][u + (w * obj.ctrlpts_size_u)]
-                        ctrlpts_new.append(temp_pt)
+    The following code snippet illustrates the usage of this function:
 
-            # Update the volume after knot insertion
-            obj.set_ctrlpts(ctrlpts_new, obj.ctrlpts_size_u, obj.ctrlpts_size_v + num[1], obj.ctrlpts_size_w)
-            obj.knotvector_v = kv_v
+    .. code-block:: python
 
-        # w-direction
-        if param[2] is not None and num[2] > 0:
-            # Find knot multiplicity
-            s_w = helpers.find_multiplicity(param[2], obj.knotvector_w)
+        # Insert knots u=0.2 and u=0.6 to a curve, u=0.6 is inserted 2 times
+        operations.insert_knots(curve, [[0.2, 0.6, 0.6]])
 
-            # Check if it is possible add that many number of knots
-            if check_num and num[2] > obj.degree_w - s_w:
-                raise GeomdlException("Knot " + str(param[2]) + " cannot be inserted " + str(num[2]) + " times (w-dir)",
-                                      data=dict(knot=param[2], num=num[2], multiplicity=s_w))
+        # Insert knot u=0.2 2 times and v=0.3, v=0.7 1 time each to a surface
+        operations.insert_knots(surface, [[0.2], [0.3, 0.7]], num=[[2], [1, 1]])
 
-            # Find knot span
-            span_w = helpers.find_span_linear(obj.degree_w, obj.knotvector_w, obj.ctrlpts_size_w, param[2])
+        # Insert knots w=0.25 and w=0.75 to a volume and get the refinement matrices
+        vol, matrices = operations.insert_knots(volume, [None, None, [0.25, 0.75]], refinement_matrix=True)
 
-            # Compute new knot vector
-            kv_w = helpers.knot_insertion_kv(obj.knotvector_w, param[2], span_w, num[2])
+    All knots of a parametric direction are inserted at once using the Oslo algorithm (please see
+    :func:`.helpers.knot_refinement_oslo`). The refinement matrix :math:`T` satisfies :math:`Q = T P`, where
+    :math:`P` and :math:`Q` are the control points of a single row on the parametric direction before and after the
+    knot insertion, respectively. It can be reused to transfer any data defined on the control points, e.g. the
+    degrees of freedom of an isogeometric analysis.
 
-            # Use Pw if rational
-            cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
+    Please note that input spline geometry object will always be updated if the knot insertion operation is successful.
 
-            # Construct 2-dimensional structure
-            cpt2d = []
-            for w in range(obj.ctrlpts_size_w):
-                temp_surf = [cpts[uv + (w * obj.ctrlpts_size_u * obj.ctrlpts_size_v)] for uv in
-                             range(obj.ctrlpts_size_u * obj.ctrlpts_size_v)]
-                cpt2d.append(temp_surf)
+    Keyword Arguments:
+        * ``num``: number of insertions of each knot in [num_u, num_v, num_w] format. *Default: 1 for each knot*
+        * ``refinement_matrix``: if True, returns the refinement matrices in [T_u, T_v, T_w] format. *Default: False*
+        * ``check_num``: enables/disables operation validity checks. *Default: True*
 
-            # Compute new control points
-            ctrlpts_tmp = helpers.knot_insertion(obj.degree_w, obj.knotvector_w, cpt2d, param[2],
-                                                 num=num[2], s=s_w, span=span_w)
+    :param obj: spline geometry
+    :type obj: abstract.SplineGeometry
+    :param knots: list of knots to be inserted in [knots_u, knots_v, knots_w] format
+    :type knots: list, tuple
+    :return: updated spline geometry or a tuple containing the updated spline geometry and the refinement matrices
+    """
+    # Get keyword arguments
+    num = kwargs.get('num', None)
+    ret_matrix = kwargs.get('refinement_matrix', False)
+    check_num = kwargs.get('check_num', True)  # can be set to False when the caller checks number of insertions
 
-            # Flatten to 1-dimensional structure
-            ctrlpts_new = []
-            for w in range(obj.ctrlpts_size_w + num[2]):
-                ctrlpts_new += ctrlpts_tmp[w]
+    if not isinstance(obj, abstract.SplineGeometry):
+        raise GeomdlException("Can only operate on spline geometry objects")
 
-            # Update the volume after knot insertion
-            obj.set_ctrlpts(ctrlpts_new, obj.ctrlpts_size_u, obj.ctrlpts_size_v, obj.ctrlpts_size_w + num[2])
-            obj.knotvector_w = kv_w
+    if check_num:
+        if not isinstance(knots, (list, tuple)) or len(knots) != obj.pdimension:
+            raise GeomdlException("The length of the knots array must be equal to the number of parametric dimensions",
+                                  data=dict(pdim=obj.pdimension, knots=knots))
+        if num is not None and len(num) != obj.pdimension:
+            raise GeomdlException("The length of the num array must be equal to the number of parametric dimensions",
+                                  data=dict(pdim=obj.pdimension, num_len=len(num)))
 
-    # Return updated spline geometry
+    # Use Pw if rational
+    cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
+    datadict = obj.data
+    cpsize = list(datadict['size'])
+    kv_new = [list(kv) for kv in datadict['knotvector']]
+    matrices = [None for _ in range(obj.pdimension)]
+
+    for idx in range(obj.pdimension):
+        if not knots[idx]:
+            continue
+        degree = datadict['degree'][idx]
+        kv = kv_new[idx]
+
+        # Expand the knot list w.r.t. the number of insertions
+        if num is not None and num[idx] is not None:
+            knot_list = [k for k, n in zip(knots[idx], num[idx]) for _ in range(n)]
+        else:
+            knot_list = list(knots[idx])
+        if not knot_list:
+            continue
+
+        # Check if it is possible to insert the knots
+        if check_num:
+            for knot in sorted(set(knot_list)):
+                if not kv[degree] < knot < kv[-(degree + 1)]:
+                    raise GeomdlException("Knot " + str(knot) + " is not an internal knot of the parametric domain",
+                                          data=dict(knot=knot, pdir=idx))
+                s = helpers.find_multiplicity(knot, kv)
+                r = knot_list.count(knot)
+                if s + r > degree:
+                    raise GeomdlException("Knot " + str(knot) + " cannot be inserted " + str(r) + " times",
+                                          data=dict(knot=knot, num=r, multiplicity=s, pdir=idx))
+
+        # Compute the new knot vector and the refinement matrix
+        kv_new[idx] = sorted(kv + knot_list)
+        matrix = helpers.knot_refinement_oslo(degree, kv, kv_new[idx])
+        if ret_matrix:
+            matrices[idx] = helpers.knot_refinement_matrix(degree, kv, kv_new[idx])
+
+        # Compute new control points for all rows of the control points grid at once
+        rows = ops.ctrlpts_to_rows(cpts, cpsize, idx)
+        rows_new = helpers.knot_refinement_apply(matrix, rows)
+        cpsize[idx] = len(rows_new)
+        cpts = ops.rows_to_ctrlpts(rows_new, cpsize, idx, len(cpts[0]))
+
+    # Update the spline geometry after knot insertion
+    if cpsize != list(datadict['size']):
+        obj.set_ctrlpts(cpts, *cpsize)
+        obj.knotvector = kv_new[0] if obj.pdimension == 1 else kv_new
+
+    if ret_matrix:
+        return obj, matrices
     return obj
 
 
@@ -561,6 +514,87 @@ def remove_knot(obj, param, num, **kwargs):
     return obj
 
 
+@export
+def remove_knots(obj, param, **kwargs):
+    """ Removes as many knots as possible from a spline geometry within the error tolerance.
+
+    This function simplifies over-refined spline geometries, e.g. imported or knot-refined geometries, by removing all
+    removable internal knots in a single sweep on each parametric direction. The following code snippet illustrates the
+    usage of this function:
+
+    .. code-block:: python
+
+        # Simplify a curve with a maximum deviation of 0.001
+        operations.remove_knots(curve, [True], tol=0.001)
+
+        # Simplify a surface only on the v-direction
+        operations.remove_knots(surface, [False, True], tol=0.001)
+
+    All control points rows on a parametric direction are processed at once. Therefore, the knots removed from a
+    surface or a volume satisfy the tolerance for all isoparametric curves. Please refer to
+    :func:`.helpers.knot_removal_spline` function for details.
+
+    Please note that input spline geometry object will always be updated.
+
+    Keyword Arguments:
+        * ``tol``: maximum distance between the input and the simplified geometry. *Default: 10e-4*
+        * ``check_num``: enables/disables operation validity checks. *Default: True*
+
+    :param obj: spline geometry
+    :type obj: abstract.SplineGeometry
+    :param param: parametric dimensions to be simplified in [u, v, w] format
+    :type param: list, tuple
+    :return: updated spline geometry
+    """
+    # Get keyword arguments
+    tol = kwargs.get('tol', 10e-4)  # maximum error tolerance
+    check_num = kwargs.get('check_num', True)  # enables/disables input validity checks
+
+    if not isinstance(obj, abstract.SplineGeometry):
+        raise GeomdlException("Can only operate on spline geometry objects")
+
+    if check_num:
+        if not isinstance(param, (list, tuple)) or len(param) != obj.pdimension:
+            raise GeomdlException("The length of the param array must be equal to the number of parametric dimensions",
+                                  data=dict(pdim=obj.pdimension, param=param))
+        if tol <= 0:
+            raise GeomdlException("Tolerance must be a positive number", data=dict(tol=tol))
+
+    # Use Pw if rational
+    cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
+    dim = len(cpts[0])
+    datadict = obj.data
+    cpsize = list(datadict['size'])
+    kv_new = [list(kv) for kv in datadict['knotvector']]
+
+    # Convert the tolerance to the homogeneous space (refer to Eq. 5.30 of The NURBS Book, 2nd Edition)
+    if obj.rational:
+        pt_max = max(linalg.vector_magnitude(pt) for pt in obj.ctrlpts)
+        tol *= min(obj.weights) / (1.0 + pt_max)
+
+    for idx in range(obj.pdimension):
+        if not param[idx]:
+            continue
+
+        # Apply knot removal to all rows of the control points grid at once
+        rows = ops.ctrlpts_to_rows(cpts, cpsize, idx)
+        rows, kv_new[idx], _ = helpers.knot_removal_spline(datadict['degree'][idx], kv_new[idx], rows,
+                                                           tol=tol, dimension=dim)
+        cpsize[idx] = len(rows)
+        cpts = ops.rows_to_ctrlpts(rows, cpsize, idx, dim)
+
+    # Update the spline geometry after knot removal
+    if isinstance(obj, abstract.Curve):
+        obj.set_ctrlpts(cpts)
+        obj.knotvector = kv_new[0]
+    else:
+        obj.set_ctrlpts(cpts, *cpsize)
+        obj.knotvector = kv_new
+
+    # Return updated spline geometry
+    return obj
+
+
 @export
 def refine_knotvector(obj, param, **kwargs):
     """ Refines the knot vector(s) of a spline geometry.
@@ -638,138 +672,62 @@ def refine_knotvector(obj, param, **kwargs):
             obj.set_ctrlpts(new_cpts)
             obj.knotvector = new_kv
 
-    # Start surface knot refinement
-    if isinstance(obj, abstract.Surface):
-        # u-direction
-        if param[0] > 0:
-            # Get curves
-            new_cpts = []
-            new_cpts_size = 0
-            new_kv = []
-            cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
-            for v in range(obj.ctrlpts_size_v):
-                ccu = [cpts[v + (obj.ctrlpts_size_v * u)] for u in range(obj.ctrlpts_size_u)]
-                ptmp, new_kv = helpers.knot_refinement(obj.degree_u, obj.knotvector_u, ccu, density=param[0])
-                new_cpts_size = len(ptmp)
-                new_cpts += ptmp
-
-            # Update the surface after knot refinement
-            obj.set_ctrlpts(compatibility.flip_ctrlpts_u(new_cpts, new_cpts_size, obj.ctrlpts_size_v),
-                            new_cpts_size, obj.ctrlpts_size_v)
-            obj.knotvector_u = new_kv
-
-        # v-direction
-        if param[1] > 0:
-            # Get curves
-            new_cpts = []
-            new_cpts_size = 0
-            new_kv = []
-            cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
-            for u in range(obj.ctrlpts_size_u):
-                ccv = [cpts[v + (obj.ctrlpts_size_v * u)] for v in range(obj.ctrlpts_size_v)]
-                ptmp, new_kv = helpers.knot_refinement(obj.degree_v, obj.knotvector_v, ccv, density=param[1])
-                new_cpts_size = len(ptmp)
-                new_cpts += ptmp
-
-            # Update the surface after knot refinement
-            obj.set_ctrlpts(new_cpts, obj.ctrlpts_size_u, new_cpts_size)
-            obj.knotvector_v = new_kv
-
-    # Start volume knot refinement
-    if isinstance(obj, abstract.Volume):
-        # u-direction
-        if param[0] > 0:
-            # Use Pw if rational
-            cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
-
-            # Construct 2-dimensional structure
-            cpt2d = []
-            for u in range(obj.ctrlpts_size_u):
-                temp_surf = []
-                for w in range(obj.ctrlpts_size_w):
-                    for v in range(obj.ctrlpts_size_v):
-                        temp_pt = cpts[v + (u * obj.ctrlpts_size_v) + (w * obj.ctrlpts_size_u * obj.ctrlpts_size_v)]
-                        temp_surf.append(temp_pt)
-                cpt2d.append(temp_surf)
-
-            # Apply knot refinement
-            ctrlpts_tmp, kv_new = helpers.knot_refinement(obj.degree_u, obj.knotvector_u, cpt2d, density=param[0])
-            new_cpts_size = len(ctrlpts_tmp)
-
-            # Flatten to 1-dimensional structure
-            ctrlpts_new = []
-            for w in range(obj.ctrlpts_size_w):
-                for u in range(new_cpts_size):
-                    for v in range(obj.ctrlpts_size_v):
-                        temp_pt = ctrlpts_tmp[u][v + (w * obj.ctrlpts_size_v)]
-                        ctrlpts_new.append(temp_pt)
-
-            # Update the volume after knot removal
-            obj.set_ctrlpts(ctrlpts_new, new_cpts_size, obj.ctrlpts_size_v, obj.ctrlpts_size_w)
-            obj.knotvector_u = kv_new
-
-        # v-direction
-        if param[1] > 0:
-            # Use Pw if rational
-            cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
+    # Start surface and volume knot refinement
+    if isinstance(obj, (abstract.Surface, abstract.Volume)) and any(p > 0 for p in param):
+        # Use Pw if rational
+        cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
+        cpsize = list(obj.cpsize)
+        kv_new = list(obj.knotvector)
+
+        for idx in range(obj.pdimension):
+            if param[idx] > 0:
+                # Apply knot refinement to all rows of the control points grid at once
+                rows = ops.ctrlpts_to_rows(cpts, cpsize, idx)
+                rows_new, kv_new[idx] = helpers.knot_refinement(obj.degree[idx], kv_new[idx], rows,
+                                                                density=param[idx])
+                cpsize[idx] = len(rows_new)
+                cpts = ops.rows_to_ctrlpts(rows_new, cpsize, idx, len(cpts[0]))
+
+        # Update the spline geometry after knot refinement
+        obj.set_ctrlpts(cpts, *cpsize)
+        obj.knotvector = kv_new
 
-            # Construct 2-dimensional structure
-            cpt2d = []
-            for v in range(obj.ctrlpts_size_v):
-                temp_surf = []
-                for w in range(obj.ctrlpts_size_w):
-                    for u in range(obj.ctrlpts_size_u):
-                        temp_pt = cpts[v + (u * obj.ctrlpts_size_v) + (w * obj.ctrlpts_size_u * obj.ctrlpts_size_v)]
-                        temp_surf.append(temp_pt)
-                cpt2d.append(temp_surf)
+    # Return updated spline geometry
+    return obj
 
-            # Apply knot refinement
-            ctrlpts_tmp, kv_new = helpers.knot_refinement(obj.degree_v, obj.knotvector_v, cpt2d, density=param[1])
-            new_cpts_size = len(ctrlpts_tmp)
 
-            # Flatten to 1-dimensional structure
-            ctrlpts_new = []
-            for w in range(obj.ctrlpts_size_w):
-                for u in range(obj.ctrlpts_size_u):
-                    for v in range(new_cpts_size):
-                        temp_pt = ctrlpts_tmp[v][u + (w * obj.ctrlpts_size_u)]
-                        ctrlpts_new.append(temp_pt)
-
-            # Update the volume after knot removal
-            obj.set_ctrlpts(ctrlpts_new, obj.ctrlpts_size_u, new_cpts_size, obj.ctrlpts_size_w)
-            obj.knotvector_v = kv_new
+def degree_operations(obj, param, **kwargs):
+    """ Applies degree elevation and degree reduction algorithms to spline geometries.
 
-        # w-direction
-        if param[2] > 0:
-            # Use Pw if rational
-            cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
+    The ``param`` argument defines the number of degree elevations on each parametric direction in [u, v, w] format.
+    Positive values apply degree elevation and negative values apply degree reduction. Zero or None leaves the
+    degree of the corresponding parametric direction unchanged.
 
-            # Construct 2-dimensional structure
-            cpt2d = []
-            for w in range(obj.ctrlpts_size_w):
-                temp_surf = [cpts[uv + (w * obj.ctrlpts_size_u * obj.ctrlpts_size_v)] for uv in
-                             range(obj.ctrlpts_size_u * obj.ctrlpts_size_v)]
-                cpt2d.append(temp_surf)
+    .. code-block:: python
 
-            # Apply knot refinement
-            ctrlpts_tmp, kv_new = helpers.knot_refinement(obj.degree_w, obj.knotvector_w, cpt2d, density=param[2])
-            new_cpts_size = len(ctrlpts_tmp)
+        from geomdl import operations
 
-            # Flatten to 1-dimensional structure
-            ctrlpts_new = []
-            for w in range(new_cpts_size):
-                ctrlpts_new += ctrlpts_tmp[w]
+        # Elevates the degree of a curve by 1
+        operations.degree_operations(curve, [1])
 
-            # Update the volume after knot removal
-            obj.set_ctrlpts(ctrlpts_new, obj.ctrlpts_size_u, obj.ctrlpts_size_v, new_cpts_size)
-            obj.knotvector_w = kv_new
+        # Reduces the degree of a surface on the v-direction by 1 with a maximum error of 0.001
+        operations.degree_operations(surface, [0, -1], tol=0.001)
 
-    # Return updated spline geometry
-    return obj
+        # Elevates the degree of a volume on the u-direction by 2 and on the w-direction by 1
+        operations.degree_operations(volume, [2, 0, 1])
 
+    All control points rows on a parametric direction are processed at once with Algorithm A5.9 (degree elevation)
+    and Algorithm A5.11 (degree reduction) of The NURBS Book by Piegl & Tiller. Degree elevation preserves the shape
+    of the spline geometry. Degree reduction is an approximation and raises an exception if the accumulated error
+    bound of all reductions exceeds the tolerance. The accumulated error bound is stored in the ``reduction_error``
+    key of the :py:attr:`~opt` property of the spline geometry. If the tolerance is not set, a warning is issued when
+    the error bound is larger than 1% of the bounding box diagonal. For rational geometries, the error bound is
+    computed on the weighted control points. Please refer to :func:`.helpers.degree_elevation_spline` and
+    :func:`.helpers.degree_reduction_spline` functions for details.
 
-def degree_operations(obj, param, **kwargs):
-    """ Applies degree elevation and degree reduction algorithms to spline geometries.
+    Keyword Arguments:
+        * ``tol``: maximum error tolerance for degree reduction. If None, the error is not checked. *Default: None*
+        * ``check_num``: enables/disables operation validity checks. *Default: True*
 
     :param obj: spline geometry
     :type obj: abstract.SplineGeometry
@@ -781,94 +739,71 @@ def degree_operations(obj, param, **kwargs):
         if degree < 2:
             raise GeomdlException("Input spline geometry must have degree > 1")
 
-    # Start curve degree manipulation operations
-    if isinstance(obj, abstract.Curve):
-        if param[0] is not None and param[0] != 0:
-            # Find multiplicity of the internal knots
-            int_knots = set(obj.knotvector[obj.degree + 1:-(obj.degree + 1)])
-            mult_arr = []
-            for ik in int_knots:
-                s = helpers.find_multiplicity(ik, obj.knotvector)
-                mult_arr.append(s)
-
-            # Decompose the input by knot insertion
-            crv_list = decompose_curve(obj, **kwargs)
-
-            # If parameter is positive, apply degree elevation. Otherwise, apply degree reduction
-            if param[0] > 0:
-                # Loop through to apply degree elevation
-                for crv in crv_list:
-                    cpts = crv.ctrlptsw if crv.rational else crv.ctrlpts
-                    new_cpts = helpers.degree_elevation(crv.degree, cpts, num=param[0])
-                    crv.degree += param[0]
-                    crv.set_ctrlpts(new_cpts)
-                    crv.knotvector = [crv.knotvector[0] for _ in range(param[0])] + list(crv.knotvector) + [crv.knotvector[-1] for _ in range(param[0])]
-
-                # Compute new degree
-                nd = obj.degree + param[0]
-
-                # Number of knot removals
-                num = obj.degree + 1
-            else:
-                # Validate degree reduction operation
-                validate_reduction(obj.degree)
-
-                # Loop through to apply degree reduction
-                for crv in crv_list:
-                    cpts = crv.ctrlptsw if crv.rational else crv.ctrlpts
-                    new_cpts = helpers.degree_reduction(crv.degree, cpts)
-                    crv.degree -= 1
-                    crv.set_ctrlpts(new_cpts)
-                    crv.knotvector = list(crv.knotvector[1:-1])
-
-                # Compute new degree
-                nd = obj.degree - 1
-
-                # Number of knot removals
-                num = obj.degree - 1
-
-            # Link curves together (reverse of decomposition)
-            kv, cpts, ws, knots = ops.link_curves(*crv_list, validate=False)
-
-            # Organize control points (if necessary)
-            ctrlpts = compatibility.combine_ctrlpts_weights(cpts, ws) if obj.rational else cpts
-
-            # Apply knot removal
-            for k, s in zip(knots, mult_arr):
-                span = helpers.find_span_linear(nd, kv, len(ctrlpts), k)
-                ctrlpts = helpers.knot_removal(nd, kv, ctrlpts, k, num=num-s)
-                kv = helpers.knot_removal_kv(kv, span, num-s)
-
-            # Update input curve
-            obj.degree = nd
-            obj.set_ctrlpts(ctrlpts)
-            obj.knotvector = kv
+    # Get keyword arguments
+    tol = kwargs.get('tol', None)  # maximum error tolerance for degree reduction
+    check_num = kwargs.get('check_num', True)  # enables/disables input validity checks
 
-    # Start surface degree manipulation operations
-    if isinstance(obj, abstract.Surface):
-        # u-direction
-        if param[0] is not None and param[0] != 0:
+    if check_num:
+        if not isinstance(param, (list, tuple)):
+            raise GeomdlException("Parametric dimensions argument (param) must be a list or a tuple")
 
-            # If parameter is positive, apply degree elevation. Else, apply degree reduction
-            if param[0] > 0:
-                pass
-            else:
-                # Apply degree reduction operation
-                validate_reduction(obj.degree_u)
+        if len(param) != obj.pdimension:
+            raise GeomdlException("The length of the param array must be equal to the number of parametric dimensions",
+                                  data=dict(pdim=obj.pdimension, param_len=len(param)))
 
-        # v-direction
-        if param[1] is not None and param[1] != 0:
+    # Nothing to do
+    if not any(param):
+        return obj
 
-            # If parameter is positive, apply degree elevation. Otherwise, apply degree reduction
-            if param[1] > 0:
-                pass
-            else:
+    # Use Pw if rational
+    cpts = obj.ctrlptsw if obj.rational else obj.ctrlpts
+    dim = len(cpts[0])
+    cpsize = list(obj.cpsize)
+    degree_new = list(obj.data['degree'])
+    kv_new = [list(kv) for kv in obj.data['knotvector']]
+    reduction_error = None  # accumulated error bound of the degree reductions
+
+    # Start degree manipulation operations
+    for idx in range(obj.pdimension):
+        if not param[idx]:
+            continue
+
+        # Apply degree elevation or degree reduction to all rows of the control points grid at once
+        rows = ops.ctrlpts_to_rows(cpts, cpsize, idx)
+        if param[idx] > 0:
+            rows, kv_new[idx] = helpers.degree_elevation_spline(degree_new[idx], kv_new[idx], rows, num=param[idx])
+            degree_new[idx] += param[idx]
+        else:
+            if reduction_error is None:
+                reduction_error = 0.0
+            for _ in range(-param[idx]):
                 # Validate degree reduction operation
-                validate_reduction(obj.degree_v)
+                validate_reduction(degree_new[idx])
+                # The error bounds of the successive reductions add up
+                rows, kv_new[idx], err = helpers.degree_reduction_spline(
+                    degree_new[idx], kv_new[idx], rows, tol=None if tol is None else tol - reduction_error,
+                    dimension=dim)
+                reduction_error += err
+                degree_new[idx] -= 1
+        cpsize[idx] = len(rows)
+        cpts = ops.rows_to_ctrlpts(rows, cpsize, idx, dim)
+
+    # Update the spline geometry
+    if isinstance(obj, abstract.Curve):
+        obj.degree = degree_new[0]
+        obj.set_ctrlpts(cpts)
+        obj.knotvector = kv_new[0]
+    else:
+        obj.degree = degree_new
+        obj.set_ctrlpts(cpts, *cpsize)
+        obj.knotvector = kv_new
 
-    # Start surface degree manipulation operations
-    if isinstance(obj, abstract.Volume):
-        raise GeomdlException("Degree manipulation operations are not available for spline volumes")
+    # Store the error bound of the degree reductions
+    if reduction_error is not None:
+        obj.opt = ['reduction_error', reduction_error]
+        # Warn if the unchecked error bound is larger than 1% of the bounding box diagonal
+        if tol is None and reduction_error > 0.01 * linalg.point_distance(*obj.bbox):
+            warnings.warn("Degree reduction error bound is %g. Use 'tol' argument to limit the error" % reduction_error)
 
     # Return updated spline geometry
     return obj
@@ -905,7 +840,7 @@ def add_dimension(obj, **kwargs):
         obj.ctrlpts = new_ctrlpts
         return obj
     else:
-        ret = copy.deepcopy(obj)
+        ret = copy.copy(obj)
         ret.ctrlpts = new_ctrlpts
         return ret
 
@@ -945,7 +880,7 @@ def split_curve(obj, param, **kwargs):
     r = obj.degree - s
 
     # Create backups of the original curve
-    temp_obj = copy.deepcopy(obj)
+    temp_obj = copy.copy(obj)
 
     # Insert knot
     insert_knot_func(temp_obj, [param], num=[r], check_num=False)
@@ -980,15 +915,38 @@ def split_curve(obj, param, **kwargs):
     return ret_val
 
 
+@export
+def split_curve_multi(obj, params):
+    """ Splits the curve at the input parametric coordinates.
+
+    This method splits the curve into ``len(params) + 1`` pieces and returns them. It does not modify the input curve.
+    All parameters are inserted as knots in a single knot refinement pass and the refined control points are sliced
+    into the curve segments. Therefore, it is much faster than calling :func:`.split_curve` repeatedly.
+
+    :param obj: Curve to be split
+    :type obj: abstract.Curve
+    :param params: list of parameters
+    :type params: list, tuple
+    :return: a list of curve segments
+    :rtype: list
+    """
+    # Validate input
+    if not isinstance(obj, abstract.Curve):
+        raise GeomdlException("Input shape must be an instance of abstract.Curve class")
+
+    for param in params:
+        if not obj.domain[0] < param < obj.domain[1]:
+            raise GeomdlException("Cannot split from the domain edge or outside of the domain", data=dict(param=param))
+
+    return ops.split_geometry(obj, [params])
+
+
 @export
 def decompose_curve(obj, **kwargs):
     """ Decomposes the curve into Bezier curve segments of the same degree.
 
-    This operation does not modify the input curve, instead it returns the split curve segments.
-
-    Keyword Arguments:
-        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_linear`
-        * ``insert_knot_func``: knot insertion algorithm implementation. *Default:* :func:`.operations.insert_knot`
+    This operation does not modify the input curve, instead it returns the split curve segments. All segments are
+    computed in a single pass over the knot vector using Algorithm A5.6 of The NURBS Book by Piegl & Tiller.
 
     :param obj: Curve to be decomposed
     :type obj: abstract.Curve
@@ -998,18 +956,7 @@ def decompose_curve(obj, **kwargs):
     if not isinstance(obj, abstract.Curve):
         raise GeomdlException("Input shape must be an instance of abstract.Curve class")
 
-    multi_curve = []
-    curve = copy.deepcopy(obj)
-    knots = curve.knotvector[curve.degree + 1:-(curve.degree + 1)]
-    while knots:
-        knot = knots[0]
-        curves = split_curve(curve, param=knot, **kwargs)
-        multi_curve.append(curves[0])
-        curve = curves[1]
-        knots = curve.knotvector[curve.degree + 1:-(curve.degree + 1)]
-    multi_curve.append(curve)
-
-    return multi_curve
+    return ops.decompose_geometry(obj, [0])
 
 
 @export
@@ -1017,7 +964,8 @@ def derivative_curve(obj):
     """ Computes the hodograph (first derivative) curve of the input curve.
 
     This function constructs the hodograph (first derivative) curve from the input curve by computing the degrees,
-    knot vectors and the control points of the derivative curve.
+    knot vectors and the control points of the derivative curve. The hodograph data is cached on the input curve until
+    it changes and it is shared with the tangent and the projection computations.
 
     :param obj: input curve
     :type obj: abstract.Curve
@@ -1032,31 +980,37 @@ def derivative_curve(obj):
         warnings.warn("Cannot compute hodograph curve for a rational curve")
         return obj
 
-    # Find the control points of the derivative curve
-    pkl = helpers.curve_deriv_cpts(obj.dimension, obj.degree, obj.knotvector, obj.ctrlpts,
-                                          rs=(0, obj.ctrlpts_size - 1), deriv_order=1)
+    # Get the derivative curve data from the hodograph cache of the curve
+    degrees, kvs, _, cpts, _ = ops.hodograph(obj, (1,))
 
     # Generate the derivative curve
     curve = obj.__class__()
-    curve.degree = obj.degree - 1
-    curve.ctrlpts = pkl[1][0:-1]
-    curve.knotvector = obj.knotvector[1:-1]
+    curve.degree = degrees[0]
+    curve.ctrlpts = cpts
+    curve.knotvector = kvs[0]
     curve.delta = obj.delta
 
     return curve
 
 
 @export
-def length_curve(obj):
-    """ Computes the approximate length of the parametric curve.
+def length_curve(obj, **kwargs):
+    """ Computes the arc length of the parametric curve.
 
-    Uses the following equation to compute the approximate length:
+    Each non-zero knot span of the curve is divided into intervals and the curve speed, :math:`|C'(u)|`, is
+    integrated on each interval using Gauss-Legendre quadrature:
 
     .. math::
 
-        \\sum_{i=0}^{n-1} \\sqrt{P_{i + 1}^2-P_{i}^2}
+        L = \\sum_{k} \\frac{u_{k+1} - u_{k}}{2} \\sum_{j} w_{j} \\left| C'(u_{k,j}) \\right|
 
-    where :math:`n` is number of evaluated curve points and :math:`P` is the n-dimensional point.
+    where :math:`u_{k,j}` and :math:`w_{j}` are the Gauss-Legendre points and weights mapped to the k-th interval.
+    The computed arc lengths are stored in the lookup table used by :func:`.param_at_length` and
+    :func:`.arc_length_params`, which is cached until the curve changes.
+
+    Keyword Arguments:
+        * ``gauss_points``: number of Gauss-Legendre points on each interval. *Default: degree + 1*
+        * ``intervals``: number of intervals on each knot span. *Default: 8*
 
     :param obj: input curve
     :type obj: abstract.Curve
@@ -1066,12 +1020,76 @@ def length_curve(obj):
     if not isinstance(obj, abstract.Curve):
         raise GeomdlException("Input shape must be an instance of abstract.Curve class")
 
-    length = 0.0
-    evalpts = obj.evalpts
-    num_evalpts = len(obj.evalpts)
-    for idx in range(num_evalpts - 1):
-        length += linalg.point_distance(evalpts[idx], evalpts[idx + 1])
-    return length
+    return ops.arc_length_table(obj, **kwargs).length
+
+
+@export
+def param_at_length(obj, length, **kwargs):
+    """ Finds the parameter(s) of the curve at the input arc length(s).
+
+    The parameters are computed from the cached arc length lookup table (please see :func:`.length_curve`) using
+    binary search and monotone cubic Hermite interpolation. Therefore, each query costs :math:`O(\\log n)` after the
+    table is generated.
+
+    .. code-block:: python
+
+        # Find the parameter at the middle of the curve
+        u = operations.param_at_length(curve, operations.length_curve(curve) / 2.0)
+
+    Keyword Arguments:
+        * ``gauss_points``: number of Gauss-Legendre points on each interval. *Default: degree + 1*
+        * ``intervals``: number of intervals on each knot span. *Default: 8*
+
+    :param obj: input curve
+    :type obj: abstract.Curve
+    :param length: arc length or a list of arc lengths measured from the start of the curve
+    :type length: float, list, tuple
+    :return: a parameter or a list of parameters
+    :rtype: float or list
+    """
+    if not isinstance(obj, abstract.Curve):
+        raise GeomdlException("Input shape must be an instance of abstract.Curve class")
+
+    table = ops.arc_length_table(obj, **kwargs)
+
+    # Single arc length input
+    if isinstance(length, (int, float)):
+        return table.param(length)
+    return [table.param(s) for s in length]
+
+
+@export
+def arc_length_params(obj, sample_size, **kwargs):
+    """ Computes the parameters of the points equally spaced by the arc length on the curve.
+
+    The first and the last parameters are the start and the end of the curve domain, respectively.
+
+    .. code-block:: python
+
+        # Generate 100 points with equal arc length spacing, e.g. for a tool path
+        params = operations.arc_length_params(curve, 100)
+        points = curve.evaluate_list(params)
+
+    Keyword Arguments:
+        * ``gauss_points``: number of Gauss-Legendre points on each interval. *Default: degree + 1*
+        * ``intervals``: number of intervals on each knot span. *Default: 8*
+
+    :param obj: input curve
+    :type obj: abstract.Curve
+    :param sample_size: number of parameters
+    :type sample_size: int
+    :return: parameters
+    :rtype: list
+    """
+    if not isinstance(obj, abstract.Curve):
+        raise GeomdlException("Input shape must be an instance of abstract.Curve class")
+
+    if sample_size < 2:
+        raise GeomdlException("Sample size must be greater than 1", data=dict(sample_size=sample_size))
+
+    table = ops.arc_length_table(obj, **kwargs)
+    step = table.length / (sample_size - 1)
+    return [table.param(i * step) for i in range(sample_size)]
 
 
 @export
@@ -1109,7 +1127,7 @@ def split_surface_u(obj, param, **kwargs):
     r = obj.degree_u - s
 
     # Create backups of the original surface
-    temp_obj = copy.deepcopy(obj)
+    temp_obj = copy.copy(obj)
 
     # Split the original surface
     insert_knot_func(temp_obj, [param, None], num=[r, 0], check_num=False)
@@ -1182,7 +1200,7 @@ def split_surface_v(obj, param, **kwargs):
     r = obj.degree_v - s
 
     # Create backups of the original surface
-    temp_obj = copy.deepcopy(obj)
+    temp_obj = copy.copy(obj)
 
     # Split the original surface
     insert_knot_func(temp_obj, [None, param], num=[0, r], check_num=False)
@@ -1226,75 +1244,111 @@ def split_surface_v(obj, param, **kwargs):
     return ret_val
 
 
+@export
+def split_surface_multi(obj, params):
+    """ Splits the surface at the input parametric coordinates on the u- and v-directions.
+
+    This method splits the surface into ``(len(params_u) + 1) * (len(params_v) + 1)`` patches and returns them in
+    *[u][v]* order, i.e. the v index varies first. It does not modify the input surface. All parameters of a
+    parametric direction are inserted as knots in a single knot refinement pass and the refined control points are
+    sliced into the surface patches.
+
+    .. code-block:: python
+
+        # Split the surface at u=0.25 and u=0.5 into 3 patches
+        surfs = operations.split_surface_multi(surf, [[0.25, 0.5], None])
+
+        # Split the surface at u=0.5, v=0.2 and v=0.7 into 6 patches
+        surfs = operations.split_surface_multi(surf, [[0.5], [0.2, 0.7]])
+
+    :param obj: surface
+    :type obj: abstract.Surface
+    :param params: parameters in [params_u, params_v] format
+    :type params: list, tuple
+    :return: a list of surface patches
+    :rtype: list
+    """
+    # Validate input
+    if not isinstance(obj, abstract.Surface):
+        raise GeomdlException("Input shape must be an instance of abstract.Surface class")
+
+    if len(params) != obj.pdimension:
+        raise GeomdlException("The length of the params array must be equal to the number of parametric dimensions",
+                              data=dict(pdim=obj.pdimension, params_len=len(params)))
+
+    for pdir, prm, domain in zip(("u", "v"), params, obj.domain):
+        for param in (prm if prm else []):
+            if not domain[0] < param < domain[1]:
+                raise GeomdlException("Cannot split from the " + pdir + "-domain edge or outside of the domain",
+                                      data=dict(param=param))
+
+    return ops.split_geometry(obj, params)
+
+
 @export
 def decompose_surface(obj, **kwargs):
     """ Decomposes the surface into Bezier surface patches of the same degree.
 
-    This operation does not modify the input surface, instead it returns the surface patches.
+    This operation does not modify the input surface, instead it returns the surface patches. All patches are computed
+    in a single pass on each parametric direction using Algorithm A5.7 of The NURBS Book by Piegl & Tiller.
 
     Keyword Arguments:
-        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_linear`
-        * ``insert_knot_func``: knot insertion algorithm implementation. *Default:* :func:`.operations.insert_knot`
+        * ``decompose_dir``: parametric direction(s) to decompose. Acceptable values: u, v, uv. *Default: uv*
 
     :param obj: surface
     :type obj: abstract.Surface
     :return: a list of Bezier patches
     :rtype: list
     """
-    def decompose(srf, idx, split_func_list, **kws):
-        srf_list = []
-        knots = srf.knotvector[idx][srf.degree[idx] + 1:-(srf.degree[idx] + 1)]
-        while knots:
-            knot = knots[0]
-            srfs = split_func_list[idx](srf, param=knot, **kws)
-            srf_list.append(srfs[0])
-            srf = srfs[1]
-            knots = srf.knotvector[idx][srf.degree[idx] + 1:-(srf.degree[idx] + 1)]
-        srf_list.append(srf)
-        return srf_list
-
     # Validate input
     if not isinstance(obj, abstract.Surface):
         raise GeomdlException("Input shape must be an instance of abstract.Surface class")
 
     # Get keyword arguments
     decompose_dir = kwargs.get('decompose_dir', 'uv')  # possible directions: u, v, uv
-    if "decompose_dir" in kwargs:
-        kwargs.pop("decompose_dir")
-
-    # List of split functions
-    split_funcs = [split_surface_u, split_surface_v]
-
-    # Work with an identical copy
-    surf = copy.deepcopy(obj)
-
-    # Only u-direction
-    if decompose_dir == 'u':
-        return decompose(surf, 0, split_funcs, **kwargs)
-
-    # Only v-direction
-    if decompose_dir == 'v':
-        return decompose(surf, 1, split_funcs, **kwargs)
-
-    # Both u- and v-directions
-    if decompose_dir == 'uv':
-        multi_surf = []
-        # Process u-direction
-        surfs_u = decompose(surf, 0, split_funcs, **kwargs)
-        # Process v-direction
-        for sfu in surfs_u:
-            multi_surf += decompose(sfu, 1, split_funcs, **kwargs)
-        return multi_surf
-    else:
+
+    if decompose_dir not in ('u', 'v', 'uv'):
         raise GeomdlException("Cannot decompose in " + str(decompose_dir) + " direction. Acceptable values: u, v, uv")
 
+    return ops.decompose_geometry(obj, ['uv'.index(d) for d in decompose_dir])
+
+
+@export
+def decompose_volume(obj, **kwargs):
+    """ Decomposes the volume into Bezier volumes of the same degree.
+
+    This operation does not modify the input volume, instead it returns the Bezier volumes. All volumes are computed
+    in a single pass on each parametric direction using Algorithm A5.6 of The NURBS Book by Piegl & Tiller.
+
+    Keyword Arguments:
+        * ``decompose_dir``: parametric direction(s) to decompose, e.g. u, vw, uvw. *Default: uvw*
+
+    :param obj: volume
+    :type obj: abstract.Volume
+    :return: a list of Bezier volumes
+    :rtype: list
+    """
+    # Validate input
+    if not isinstance(obj, abstract.Volume):
+        raise GeomdlException("Input shape must be an instance of abstract.Volume class")
+
+    # Get keyword arguments
+    decompose_dir = kwargs.get('decompose_dir', 'uvw')  # possible directions: any combination of u, v and w
+
+    if not decompose_dir or any(d not in 'uvw' for d in decompose_dir) or len(set(decompose_dir)) != len(decompose_dir):
+        raise GeomdlException("Cannot decompose in " + str(decompose_dir) + " direction. Acceptable values: u, v, w "
+                              "and their combinations")
+
+    return ops.decompose_geometry(obj, ['uvw'.index(d) for d in decompose_dir])
+
 
 @export
 def derivative_surface(obj):
     """ Computes the hodograph (first derivative) surface of the input surface.
 
     This function constructs the hodograph (first derivative) surface from the input surface by computing the degrees,
-    knot vectors and the control points of the derivative surface.
+    knot vectors and the control points of the derivative surface. The hodograph data is cached on the input surface
+    until it changes and it is shared with the tangent, normal and projection computations.
 
     The return value of this function is a tuple containing the following derivative surfaces in the given order:
 
@@ -1314,42 +1368,29 @@ def derivative_surface(obj):
         warnings.warn("Cannot compute hodograph surface for a rational surface")
         return obj
 
-    # Find the control points of the derivative surface
-    d = 2  # 0 <= k + l <= d, see pg. 114 of The NURBS Book, 2nd Ed.
-    pkl = helpers.surface_deriv_cpts(obj.dimension, obj.degree, obj.knotvector, obj.ctrlpts, obj.cpsize,
-                                            rs=(0, obj.ctrlpts_size_u - 1), ss=(0, obj.ctrlpts_size_v - 1), deriv_order=d)
-
-    ctrlpts2d_u = []
-    for i in range(0, len(pkl[1][0]) - 1):
-        ctrlpts2d_u.append(pkl[1][0][i])
-
-    surf_u = copy.deepcopy(obj)
-    surf_u.degree_u = obj.degree_u - 1
-    surf_u.ctrlpts2d = ctrlpts2d_u
-    surf_u.knotvector_u = obj.knotvector_u[1:-1]
+    # Get the derivative surfaces data from the hodograph cache of the surface
+    degrees, kvs, sizes, cpts, _ = ops.hodograph(obj, (1, 0))
+    surf_u = copy.copy(obj)
+    surf_u.degree_u = degrees[0]
+    surf_u.set_ctrlpts(cpts, *sizes)
+    surf_u.knotvector_u = kvs[0]
     surf_u.delta = obj.delta
 
-    ctrlpts2d_v = []
-    for i in range(0, len(pkl[0][1])):
-        ctrlpts2d_v.append(pkl[0][1][i][0:-1])
-
-    surf_v = copy.deepcopy(obj)
-    surf_v.degree_v = obj.degree_v - 1
-    surf_v.ctrlpts2d = ctrlpts2d_v
-    surf_v.knotvector_v = obj.knotvector_v[1:-1]
+    degrees, kvs, sizes, cpts, _ = ops.hodograph(obj, (0, 1))
+    surf_v = copy.copy(obj)
+    surf_v.degree_v = degrees[1]
+    surf_v.set_ctrlpts(cpts, *sizes)
+    surf_v.knotvector_v = kvs[1]
     surf_v.delta = obj.delta
 
-    ctrlpts2d_uv = []
-    for i in range(0, len(pkl[1][1]) - 1):
-        ctrlpts2d_uv.append(pkl[1][1][i][0:-1])
-
-    # Generate the derivative curve
+    # Generate the derivative surface on both directions
+    degrees, kvs, sizes, cpts, _ = ops.hodograph(obj, (1, 1))
     surf_uv = obj.__class__()
-    surf_uv.degree_u = obj.degree_u - 1
-    surf_uv.degree_v = obj.degree_v - 1
-    surf_uv.ctrlpts2d = ctrlpts2d_uv
-    surf_uv.knotvector_u = obj.knotvector_u[1:-1]
-    surf_uv.knotvector_v = obj.knotvector_v[1:-1]
+    surf_uv.degree_u = degrees[0]
+    surf_uv.degree_v = degrees[1]
+    surf_uv.set_ctrlpts(cpts, *sizes)
+    surf_uv.knotvector_u = kvs[0]
+    surf_uv.knotvector_v = kvs[1]
     surf_uv.delta = obj.delta
 
     return surf_u, surf_v, surf_uv
@@ -1429,6 +1470,66 @@ def normal(obj, params, **kwargs):
             return ops.normal_surface_single_list(obj, params, normalize)
 
 
+@export
+def transform(obj, matrix, **kwargs):
+    """ Applies the homogeneous transformation matrix to curves, surfaces or volumes.
+
+    The transformation matrix can be a 3x3 matrix (linear transformation), a 3x4 or a 4x4 matrix (affine or
+    projective transformation in homogeneous coordinates). The matrix is applied to the weighted control points of the
+    rational geometries in a single pass, so that the NURBS weights are transformed consistently. Projective
+    transformations require rational geometries. 2-dimensional geometries are assumed to lie on the xy-plane.
+
+    When ``lazy=True``, the containers store the transformation and compose it with the subsequent ones. The
+    resultant transformation is applied to all contained geometries at once when they are accessed or evaluated.
+
+    Keyword Arguments:
+        * ``inplace``: if False, operation applied to a copy of the object. *Default: False*
+        * ``lazy``: if True, defers the transformation of the container elements. *Default: False*
+
+    :param obj: input geometry
+    :type obj: abstract.SplineGeometry or multi.AbstractContainer
+    :param matrix: transformation matrix
+    :type matrix: list, tuple
+    :return: transformed geometry object
+    """
+    # Input validity checks
+    if len(matrix) not in (3, 4) or any(len(row) != len(matrix[0]) for row in matrix) or \
+            len(matrix[0]) not in (3, 4):
+        raise GeomdlException("Transformation matrix must be 3x3, 3x4 or 4x4", data=dict(matrix=matrix))
+    if obj.dimension not in (2, 3):
+        raise GeomdlException("Can only transform 2- and 3-dimensional geometries", data=dict(dimension=obj.dimension))
+    mat = [[float(c) for c in row] + [0.0] * (4 - len(row)) for row in matrix]
+    if len(mat) == 3:
+        mat.append([0.0, 0.0, 0.0, 1.0])
+
+    # Keyword arguments
+    inplace = kwargs.get('inplace', False)
+    lazy = kwargs.get('lazy', False)
+
+    if not inplace:
+        geom = copy.copy(obj)
+    else:
+        geom = obj
+
+    # Projective transformations are only defined for the rational geometries
+    if mat[3] != [0.0, 0.0, 0.0, 1.0] and not all(g.rational for g in geom):
+        raise GeomdlException("Projective transformations require rational geometries", data=dict(matrix=matrix))
+
+    if isinstance(geom, abstract.SplineGeometry):
+        ops.transform_geometry(geom, mat)
+        return geom
+
+    # Compose with the pending transformation of the container
+    if geom._transform is not None:
+        mat = linalg.matrix_multiply(mat, geom._transform)
+    geom._transform = mat
+    if not lazy:
+        geom._apply_transform()
+    geom.reset()
+
+    return geom
+
+
 @export
 def translate(obj, vec, **kwargs):
     """ Translates curves, surface or volumes by the input vector.
@@ -1454,7 +1555,7 @@ def translate(obj, vec, **kwargs):
     inplace = kwargs.get('inplace', False)
 
     if not inplace:
-        geom = copy.deepcopy(obj)
+        geom = copy.copy(obj)
     else:
         geom = obj
 
@@ -1473,6 +1574,9 @@ def translate(obj, vec, **kwargs):
 def rotate(obj, angle, **kwargs):
     """ Rotates curves, surfaces or volumes about the chosen axis.
 
+    The geometries with more than 3 spatial dimensions are rotated on their first 3 coordinates and the remaining
+    coordinates are kept as they are.
+
     Keyword Arguments:
         * ``axis``: rotation axis; x, y, z correspond to 0, 1, 2 respectively. *Default: 2*
         * ``inplace``: if False, operation applied to a copy of the object. *Default: False*
@@ -1483,86 +1587,36 @@ def rotate(obj, angle, **kwargs):
     :type angle: float
     :return: rotated geometry object
     """
-    def rotate_x(ncs, opt, alpha):
-        # Generate translation vector
-        translate_vector = linalg.vector_generate(opt, [0.0 for _ in range(ncs.dimension)])
-
-        # Translate to the origin
-        translate(ncs, translate_vector, inplace=True)
-
-        # Then, rotate about the axis
-        rot = math.radians(alpha)
-        new_ctrlpts = [[0.0 for _ in range(ncs.dimension)] for _ in range(len(ncs.ctrlpts))]
-        for idx, pt in enumerate(ncs.ctrlpts):
-            new_ctrlpts[idx][0] = pt[0]
-            new_ctrlpts[idx][1] = (pt[1] * math.cos(rot)) - (pt[2] * math.sin(rot))
-            new_ctrlpts[idx][2] = (pt[2] * math.cos(rot)) + (pt[1] * math.sin(rot))
-        ncs.ctrlpts = new_ctrlpts
-
-        # Finally, translate back to the starting location
-        translate(ncs, [-tv for tv in translate_vector], inplace=True)
-
-    def rotate_y(ncs, opt, alpha):
-        # Generate translation vector
-        translate_vector = linalg.vector_generate(opt, [0.0 for _ in range(ncs.dimension)])
-
-        # Translate to the origin
-        translate(ncs, translate_vector, inplace=True)
-
-        # Then, rotate about the axis
-        rot = math.radians(alpha)
-        new_ctrlpts = [[0.0 for _ in range(ncs.dimension)] for _ in range(len(ncs.ctrlpts))]
-        for idx, pt in enumerate(ncs.ctrlpts):
-            new_ctrlpts[idx][0] = (pt[0] * math.cos(rot)) - (pt[2] * math.sin(rot))
-            new_ctrlpts[idx][1] = pt[1]
-            new_ctrlpts[idx][2] = (pt[2] * math.cos(rot)) + (pt[0] * math.sin(rot))
-        ncs.ctrlpts = new_ctrlpts
-
-        # Finally, translate back to the starting location
-        translate(ncs, [-tv for tv in translate_vector], inplace=True)
-
-    def rotate_z(ncs, opt, alpha):
-        # Generate translation vector
-        translate_vector = linalg.vector_generate(opt, [0.0 for _ in range(ncs.dimension)])
-
-        # Translate to the origin
-        translate(ncs, translate_vector, inplace=True)
-
-        # Then, rotate about the axis
-        rot = math.radians(alpha)
-        new_ctrlpts = [list(ncs.ctrlpts[i]) for i in range(len(ncs.ctrlpts))]
-        for idx, pt in enumerate(ncs.ctrlpts):
-            new_ctrlpts[idx][0] = (pt[0] * math.cos(rot)) - (pt[1] * math.sin(rot))
-            new_ctrlpts[idx][1] = (pt[1] * math.cos(rot)) + (pt[0] * math.sin(rot))
-        ncs.ctrlpts = new_ctrlpts
-
-        # Finally, translate back to the starting location
-        translate(ncs, [-tv for tv in translate_vector], inplace=True)
-
     # Set rotation axis
     axis = 2 if obj.dimension == 2 else int(kwargs.get('axis', 2))
     if not 0 <= axis <= 2:
         raise GeomdlException("Value of the 'axis' argument should be 0, 1 or 2")
-    rotfunc = (rotate_x, rotate_y, rotate_z)
-
-    # Operate on a copy or the actual object
-    inplace = kwargs.get('inplace', False)
-    if not inplace:
-        geom = copy.deepcopy(obj)
-    else:
-        geom = obj
 
     # Set a single origin
-    if geom[0].pdimension == 1:
-        params = geom[0].domain[0]
+    if obj[0].pdimension == 1:
+        params = obj[0].domain[0]
     else:
-        params = [geom[0].domain[i][0] for i in range(geom[0].pdimension)]
-    origin = geom[0].evaluate_single(params)
-
-    # Start rotation
+        params = [obj[0].domain[i][0] for i in range(obj[0].pdimension)]
+    origin = list(obj[0].evaluate_single(params)) + [0.0] * (3 - obj.dimension)
+
+    # Generate the rotation matrix about the origin
+    rot = math.radians(angle)
+    cos_rot, sin_rot = math.cos(rot), math.sin(rot)
+    i, j = [k for k in range(3) if k != axis]
+    matrix = [[1.0 if r == c else 0.0 for c in range(4)] for r in range(4)]
+    matrix[i][i], matrix[i][j], matrix[j][i], matrix[j][j] = cos_rot, -sin_rot, sin_rot, cos_rot
+    for r in range(3):
+        matrix[r][3] = origin[r] - sum(matrix[r][c] * origin[c] for c in range(3))
+
+    # Rotate in a single pass
+    if obj.dimension <= 3:
+        return transform(obj, matrix, **kwargs)
+
+    # Rotate the first 3 coordinates of the higher dimensional geometries
+    geom = obj if kwargs.get('inplace', False) else copy.copy(obj)
     for g in geom:
-        rotfunc[axis](g, origin, angle)
-
+        g.ctrlpts = [[sum(matrix[r][c] * pt[c] for c in range(3)) + matrix[r][3] for r in range(3)] + list(pt[3:])
+                     for pt in g.ctrlpts]
     return geom
 
 
@@ -1587,7 +1641,7 @@ def scale(obj, multiplier, **kwargs):
     inplace = kwargs.get('inplace', False)
 
     if not inplace:
-        geom = copy.deepcopy(obj)
+        geom = copy.copy(obj)
     else:
         geom = obj
 
@@ -1619,7 +1673,7 @@ def transpose(surf, **kwargs):
     inplace = kwargs.get('inplace', False)
 
     if not inplace:
-        geom = copy.deepcopy(surf)
+        geom = copy.copy(surf)
     else:
         geom = surf
 
@@ -1667,7 +1721,7 @@ def flip(surf, **kwargs):
     inplace = kwargs.get('inplace', False)
 
     if not inplace:
-        geom = copy.deepcopy(surf)
+        geom = copy.copy(surf)
     else:
         geom = surf
 
@@ -7,7 +7,7 @@
 
 """
 
-from copy import deepcopy
+from copy import copy
 from . import linalg
 from . import construct
 from .exceptions import GeomdlException
@@ -38,7 +38,7 @@ def sweep_vector(obj, vec, **kwargs):
         swept_cps[i] = linalg.point_translate(p, vec)
 
     # Generate copy of the input geometry
-    obj_swept = deepcopy(obj)
+    obj_swept = copy(obj)
 
     # Update control points of the copy
     obj_swept.ctrlpts = swept_cps
@@ -8,7 +8,9 @@
 """
 
 import abc
+import math
 from .exceptions import GeomdlException
+from . import elements
 from . import _tessellate as tsl
 from ._utilities import add_metaclass, export
 
@@ -19,6 +21,70 @@ make_quad_mesh = tsl.make_quad_mesh
 polygon_triangulate = tsl.polygon_triangulate
 surface_tessellate = tsl.surface_tessellate
 surface_trim_tessellate = tsl.surface_trim_tessellate
+weld_vertices = tsl.weld_vertices
+weld_mesh = tsl.weld_mesh
+
+
+@export
+def select_lod(levels, **kwargs):
+    """ Selects a level from a level-of-detail (LOD) pyramid.
+
+    The input is the list of levels generated by :py:meth:`.abstract.Surface.tessellate_lod` or
+    :py:meth:`.multi.SurfaceContainer.tessellate_lod`, ordered from the finest to the coarsest level. This function
+    returns the coarsest level whose error is smaller than or equal to the allowed error. If there is no such level,
+    the finest level is returned.
+
+    The allowed error can be a geometric error, i.e. a distance in model units, or a screen-space error in pixels.
+    The screen-space error is converted to the geometric error using the distance to the viewer, the vertical field
+    of view and the viewport height.
+
+    .. code-block:: python
+        :linenos:
+
+        # Generate the LOD pyramid
+        levels = surf.tessellate_lod(num_levels=5)
+
+        # Select using geometric error
+        lvl = tessellate.select_lod(levels, error=0.01)
+
+        # Select using screen-space error
+        lvl = tessellate.select_lod(levels, pixel_error=1.0, distance=250.0, fov=45.0, viewport=1080)
+
+    Keyword Arguments:
+        * ``error``: allowed geometric error
+        * ``pixel_error``: allowed screen-space error in pixels
+        * ``distance``: distance between the viewer and the geometry (for screen-space error)
+        * ``fov``: vertical field of view in degrees (for screen-space error). *Default: 45.0*
+        * ``viewport``: viewport height in pixels (for screen-space error). *Default: 1080*
+
+    :param levels: LOD pyramid
+    :type levels: list, tuple
+    :return: the selected level
+    :rtype: dict
+    """
+    if not levels:
+        raise GeomdlException("LOD pyramid is empty")
+
+    error = kwargs.get('error', None)
+    pixel_error = kwargs.get('pixel_error', None)
+
+    # Convert screen-space error to geometric error
+    if pixel_error is not None:
+        distance = kwargs.get('distance', None)
+        if distance is None:
+            raise GeomdlException("Distance to the viewer is required for screen-space error")
+        fov = float(kwargs.get('fov', 45.0))
+        viewport = float(kwargs.get('viewport', 1080))
+        error = float(pixel_error) * 2.0 * float(distance) * math.tan(math.radians(fov) / 2.0) / viewport
+
+    if error is None:
+        raise GeomdlException("Please input a geometric or a screen-space error value")
+
+    selected = levels[0]
+    for lvl in levels:
+        if lvl['error'] <= error:
+            selected = lvl
+    return selected
 
 
 @add_metaclass(abc.ABCMeta)
@@ -29,6 +95,7 @@ class AbstractTessellate(object):
         self._tsl_func = None
         self._vertices = []
         self._faces = []
+        self._mesh = None
         self._arguments = dict()
 
     @property
@@ -49,6 +116,19 @@ class AbstractTessellate(object):
         """
         return self._faces
 
+    @property
+    def mesh(self):
+        """ Vertices and faces generated after tessellation as a structure of arrays.
+
+        Please see :py:class:`.elements.Mesh` for details.
+
+        :getter: Gets the mesh
+        :type: elements.Mesh
+        """
+        if self._mesh is None:
+            self._mesh = elements.Mesh.from_elements(self._vertices, self._faces)
+        return self._mesh
+
     @property
     def arguments(self):
         """ Arguments passed to the tessellation function.
@@ -76,6 +156,7 @@ class AbstractTessellate(object):
         """ Clears stored vertices and faces. """
         self._vertices[:] = []
         self._faces[:] = []
+        self._mesh = None
 
     def is_tessellated(self):
         """ Checks if vertices and faces are generated.
@@ -97,7 +178,8 @@ class AbstractTessellate(object):
 
         :param points: points to be tessellated
         """
-        pass
+        # Invalidate the mesh generated by the previous tessellation
+        self._mesh = None
 
 
 @export
@@ -116,6 +198,8 @@ class TriangularTessellate(AbstractTessellate):
         Keyword Arguments:
             * ``size_u``: number of points on the u-direction
             * ``size_v``: number of points on the v-direction
+            * ``num_procs``: number of concurrent processes for tessellating the tiles of the grid. *Default: 1*
+            * ``tile_size``: number of quad elements on each side of a tile. *Default: 32*
 
         :param points: array of points
         :type points: list, tuple
@@ -142,6 +226,8 @@ class TrimTessellate(AbstractTessellate):
         Keyword Arguments:
             * ``size_u``: number of points on the u-direction
             * ``size_v``: number of points on the v-direction
+            * ``num_procs``: number of concurrent processes for tessellating the tiles of the grid. *Default: 1*
+            * ``tile_size``: number of quad elements on each side of a tile. *Default: 32*
 
         :param points: array of points
         :type points: list, tuple
@@ -8,6 +8,7 @@
 """
 
 import abc
+from . import elements
 from . import _utilities as utl
 from .exceptions import GeomdlException
 
@@ -52,8 +53,11 @@ class VisAbstract(object):
     def add(self, ptsarr, plot_type, name="", color="", idx=0):
         """ Adds points sets to the visualization instance for plotting.
 
+        A :py:class:`.elements.Mesh` instance is converted to a list containing the vertices and the faces, which is
+        the format used for the tessellated surfaces.
+
         :param ptsarr: control or evaluated points
-        :type ptsarr: list, tuple
+        :type ptsarr: list, tuple or elements.Mesh
         :param plot_type: type of the plot, e.g. ctrlpts, evalpts, bbox, etc.
         :type plot_type: str
         :param name: name of the plot displayed on the legend
@@ -63,6 +67,9 @@ class VisAbstract(object):
         :param color: plot index
         :type color: int
         """
+        # Convert the mesh to vertices and faces
+        if isinstance(ptsarr, elements.Mesh):
+            ptsarr = list(ptsarr.to_elements())
         # ptsarr can be a list, a tuple or an array
         if ptsarr is None or len(ptsarr) == 0:
             return
@@ -8,6 +8,7 @@
 """
 
 from geomdl import vis
+from geomdl import voxelize
 import numpy as np
 import matplotlib as mpl
 import matplotlib.tri as mpltri
@@ -877,10 +878,15 @@ class VisVoxel(vis.VisAbstract):
 
             # Plot evaluated points
             if plot['type'] == 'evalpts' and self.vconf.display_evalpts:
-                faces = np.array(plot['ptsarr'][1], dtype=self.vconf.dtype)
-                filled = np.array(plot['ptsarr'][2], dtype=self.vconf.dtype)
-                # Find filled voxels
-                faces_filled = np.concatenate(faces[filled == 1.0])
+                if isinstance(plot['ptsarr'], voxelize.VoxelGrid):
+                    # Generate faces of the filled voxels only
+                    faces = np.array(list(voxelize.convert_bb_to_faces(plot['ptsarr'])), dtype=self.vconf.dtype)
+                    faces_filled = np.concatenate(faces)
+                else:
+                    faces = np.array(plot['ptsarr'][1], dtype=self.vconf.dtype)
+                    filled = np.array(plot['ptsarr'][2], dtype=self.vconf.dtype)
+                    # Find filled voxels
+                    faces_filled = np.concatenate(faces[filled == 1.0])
                 # Create a single Poly3DCollection object
                 pc3d = Poly3DCollection(faces_filled, facecolors=plot['color'], edgecolors='k')
                 ax.add_collection3d(pc3d)
@@ -10,6 +10,7 @@
 from random import random
 from . import vis
 from . import vtk_helpers as vtkh
+from .. import voxelize
 import numpy as np
 from vtk.util.numpy_support import numpy_to_vtk
 from vtk import VTK_FLOAT
@@ -330,9 +331,13 @@ class VisVoxel(vis.VisAbstract):
 
             # Plot evaluated points
             if plot['type'] == 'evalpts' and self.vconf.display_evalpts:
-                faces = np.array(plot['ptsarr'][1], dtype=np.float)
-                filled = np.array(plot['ptsarr'][2], dtype=np.int)
-                grid_filled = faces[filled == 1]
+                if isinstance(plot['ptsarr'], voxelize.VoxelGrid):
+                    # Generate faces of the filled voxels only
+                    grid_filled = voxelize.convert_bb_to_faces(plot['ptsarr'])
+                else:
+                    faces = np.array(plot['ptsarr'][1], dtype=np.float)
+                    filled = np.array(plot['ptsarr'][2], dtype=np.int)
+                    grid_filled = faces[filled == 1]
                 temp_actor = vtkh.create_actor_hexahedron(grid=grid_filled, color=vtkh.create_color(plot['color']),
                                                           name=plot['name'], index=plot['idx'])
                 vtk_actors.append(temp_actor)
@@ -10,6 +10,7 @@
 import struct
 from . import _voxelize as vxl
 from ._utilities import export
+from .exceptions import GeomdlException
 
 
 @export
@@ -20,17 +21,50 @@ def voxelize(obj, **kwargs):
         * ``grid_size``: size of the voxel grid. *Default: (8, 8, 8)*
         * ``padding``: voxel padding for in-outs finding. *Default: 10e-8*
         * ``use_cubes``: use cube voxels instead of cuboid ones. *Default: False*
-        * ``num_procs``: number of concurrent processes for voxelization. *Default: 1*
+        * ``solid``: if True, fills the voxels inside the closed shells and volumes. *Default: False*
+        * ``brute_force``: if True, checks all points against all voxels. *Default: False*
+        * ``num_procs``: number of concurrent processes for solid or brute-force voxelization. *Default: 1*
+        * ``compact``: if True, returns a list of :py:class:`.VoxelGrid` instances. *Default: False*
+
+    By default, the evaluated points are binned into the voxels in a single pass, i.e. each point is mapped to its
+    voxel index using :math:`\\lfloor (p - bb_{min}) / step \\rfloor`. The complexity of binning is O(points) while the
+    brute-force method, which checks every point against every voxel, is O(voxels x points). Both methods generate the
+    same filled array.
+
+    The voxels generated by the default method only contain the evaluated points, i.e. the voxelization of a volume or
+    a closed surface is a hollow shell. ``solid`` option fills the voxels whose centers are inside the geometry using
+    ray parity: the rays cast in z-direction through the voxel centers are intersected with the triangles of the shell
+    and a voxel center is inside if there is an odd number of intersections below it. The shell of a
+    :py:class:`.multi.SurfaceContainer` (or a single surface) is generated by tessellating the surfaces, and the shell
+    of a volume is generated from its evaluated points on the boundary faces. All surfaces inside the container are
+    considered as a single closed shell and each volume is voxelized separately. The rows of voxels are processed in
+    parallel, if ``num_procs`` is bigger than 1.
+
+    .. code-block:: python
+        :linenos:
+
+        from geomdl import voxelize
+
+        # Fill the interior of the closed shell generated by the surfaces inside the container
+        grid, filled = voxelize.voxelize(surf_container, grid_size=(64, 64, 64), solid=True, num_procs=4)
+
+    The voxel grid and the filled information are stored as lists containing an entry for each voxel by default. For
+    large grids, ``compact`` option returns a :py:class:`.VoxelGrid` instance for each shell or volume, which stores the
+    voxel grid implicitly and the filled information as a bitset. The filled voxels are directly packed into the bitset
+    and the lists are never generated.
 
     :param obj: input surface(s) or volume(s)
-    :type obj: abstract.Surface or abstract.Volume
-    :return: voxel grid and filled information
-    :rtype: tuple
+    :type obj: abstract.Surface, abstract.Volume or multi.AbstractContainer
+    :return: voxel grid and filled information, or a list of VoxelGrid instances if ``compact=True``
+    :rtype: tuple or list
     """
     # Get keyword arguments
     grid_size = kwargs.pop('grid_size', (8, 8, 8))
     use_cubes = kwargs.pop('use_cubes', False)
+    solid = kwargs.pop('solid', False)
+    brute_force = kwargs.pop('brute_force', False)
     num_procs = kwargs.get('num_procs', 1)
+    compact = kwargs.pop('compact', False)
 
     if not isinstance(grid_size, (list, tuple)):
         raise TypeError("Grid size must be a list or a tuple of integers")
@@ -38,70 +72,379 @@ def voxelize(obj, **kwargs):
     # Initialize result arrays
     grid = []
     filled = []
+    vgrids = []
+
+    # All surfaces compose a single shell for solid voxelization
+    objs = [obj] if solid and obj.pdimension == 2 else obj
 
     # Should also work with multi surfaces and volumes
-    for o in obj:
+    for o in objs:
+        if compact:
+            vgrids.append(_voxelize_compact(o, grid_size, use_cubes, solid, brute_force, **kwargs))
+            continue
+
         # Generate voxel grid
         grid_temp = vxl.generate_voxel_grid(o.bbox, grid_size, use_cubes=use_cubes)
-        args = [grid_temp, o.evalpts]
 
         # Find in-outs
-        filled_temp = vxl.find_inouts_mp(*args, **kwargs) if num_procs > 1 else vxl.find_inouts_st(*args, **kwargs)
+        if solid:
+            voxel_ranges = vxl.generate_voxel_ranges(o.bbox, grid_size, use_cubes=use_cubes)
+            filled_temp = vxl.find_inouts_parity(voxel_ranges, vxl.shell_triangles(o), num_procs=num_procs)
+        elif brute_force:
+            args = [grid_temp, o.evalpts]
+            filled_temp = vxl.find_inouts_mp(*args, **kwargs) if num_procs > 1 else vxl.find_inouts_st(*args, **kwargs)
+        else:
+            voxel_ranges = vxl.generate_voxel_ranges(o.bbox, grid_size, use_cubes=use_cubes)
+            filled_temp = vxl.find_inouts_bin(voxel_ranges, o.evalpts, **kwargs)
 
         # Add to result arrays
         grid += grid_temp
         filled += filled_temp
 
     # Return result arrays
+    if compact:
+        return vgrids
     return grid, filled
 
 
+def _voxelize_compact(obj, grid_size, use_cubes, solid, brute_force, **kwargs):
+    """ Voxelizes a single shell or volume into a :py:class:`.VoxelGrid` instance.
+
+    Please see :py:func:`.voxelize` for details.
+    """
+    voxel_ranges = vxl.generate_voxel_ranges(obj.bbox, grid_size, use_cubes=use_cubes)
+    vgrid = VoxelGrid.from_ranges(*voxel_ranges)
+    if solid:
+        # Rows in x-direction are generated in order
+        row_size = vgrid.dims[1] * vgrid.dims[2]
+        for row_idx, row in enumerate(vxl.find_inouts_parity_rows(voxel_ranges, vxl.shell_triangles(obj), **kwargs)):
+            offset = row_idx * row_size
+            vgrid.fill(offset + idx for idx, val in enumerate(row) if val)
+    elif brute_force:
+        args = [vxl.generate_voxel_grid(obj.bbox, grid_size, use_cubes=use_cubes), obj.evalpts]
+        filled = vxl.find_inouts_mp(*args, **kwargs) if kwargs.get('num_procs', 1) > 1 \
+            else vxl.find_inouts_st(*args, **kwargs)
+        vgrid.fill(idx for idx, val in enumerate(filled) if val)
+    else:
+        vgrid.fill(vxl.find_filled_bin(voxel_ranges, obj.evalpts, **kwargs))
+    return vgrid
+
+
 def convert_bb_to_faces(voxel_grid):
     """ Converts a voxel grid defined by min and max coordinates to a voxel grid defined by faces.
 
+    If the input is a :py:class:`.VoxelGrid` instance, the faces of the filled voxels are generated lazily.
+
     :param voxel_grid: voxel grid defined by the bounding box of all voxels
+    :type voxel_grid: list, tuple or VoxelGrid
     :return: voxel grid with face data
     """
-    new_vg = []
-    for v in voxel_grid:
-        # Vertices
-        p1 = v[0]
-        p2 = [v[1][0], v[0][1], v[0][2]]
-        p3 = [v[1][0], v[1][1], v[0][2]]
-        p4 = [v[0][0], v[1][1], v[0][2]]
-        p5 = [v[0][0], v[0][1], v[1][2]]
-        p6 = [v[1][0], v[0][1], v[1][2]]
-        p7 = v[1]
-        p8 = [v[0][0], v[1][1], v[1][2]]
-        # Faces
-        fb = [p1, p2, p3, p4]  # bottom face
-        ft = [p5, p6, p7, p8]  # top face
-        fs1 = [p1, p2, p6, p5]  # side face 1
-        fs2 = [p2, p3, p7, p6]  # side face 2
-        fs3 = [p3, p4, p8, p7]  # side face 3
-        fs4 = [p1, p4, p8, p5]  # side face 4
-        # Append to return list
-        new_vg.append([fb, fs1, fs2, fs3, fs4, ft])
-    return new_vg
+    if isinstance(voxel_grid, VoxelGrid):
+        return (vxl.bb_to_faces(bb) for bb in voxel_grid.filled_voxels())
+    return [vxl.bb_to_faces(v) for v in voxel_grid]
 
 
 @export
 def save_voxel_grid(voxel_grid, file_name):
     """ Saves binary voxel grid as a binary file.
 
-    The binary file is structured in little-endian unsigned int format.
+    The binary file is structured in little-endian unsigned int format. If the input is a :py:class:`.VoxelGrid`
+    instance, the grid is saved using :py:meth:`.VoxelGrid.save`.
 
     :param voxel_grid: binary voxel grid
-    :type voxel_grid: list, tuple
+    :type voxel_grid: list, tuple or VoxelGrid
     :param file_name: file name to save
     :type file_name: str
     """
+    if isinstance(voxel_grid, VoxelGrid):
+        return voxel_grid.save(file_name)
     try:
         with open(file_name, 'wb') as fp:
-            for voxel in voxel_grid:
-                fp.write(struct.pack("<I", voxel))
+            # Pack in fixed-size chunks to avoid expanding the whole grid into the arguments of a single call
+            chunk_size = 65536
+            for idx in range(0, len(voxel_grid), chunk_size):
+                chunk = voxel_grid[idx:idx + chunk_size]
+                fp.write(struct.pack("<" + str(len(chunk)) + "I", *chunk))
     except IOError as e:
         print("An error occurred: {}".format(e.args[-1]))
         raise e
     except Exception:
         raise
+
+
+@export
+def load_voxel_grid(file_name):
+    """ Loads a compact voxel grid saved by :py:meth:`.VoxelGrid.save`.
+
+    :param file_name: file name to load
+    :type file_name: str
+    :return: voxel grid
+    :rtype: VoxelGrid
+    """
+    return VoxelGrid.load(file_name)
+
+
+@export
+class VoxelGrid(object):
+    """ Compact binary voxel grid.
+
+    The voxel grid is defined implicitly by its origin, i.e. the minimum point of the first voxel, the step sizes and
+    the number of voxels in x-, y- and z-directions. The occupancy is stored as a bitset, i.e. 1 bit per voxel, and
+    therefore a 512x512x512 grid requires 16 MB of memory.
+
+    The voxels are ordered in the same way as :py:func:`.voxelize` output, i.e. the flat index of the voxel
+    :math:`(i, j, k)` is :math:`(i \\times d_y + j) \\times d_z + k`. The voxels can be accessed using the flat index or
+    the :math:`(i, j, k)` tuple.
+
+    .. code-block:: python
+        :linenos:
+
+        from geomdl import voxelize
+
+        # Voxelize the volume into a compact voxel grid
+        vgrid = voxelize.voxelize(vol, grid_size=(256, 256, 256), solid=True, compact=True)[0]
+
+        # Number of filled voxels
+        print(vgrid.count)
+
+        # Save the voxel grid and load it back
+        vgrid.save("volume.vox")
+        vgrid = voxelize.load_voxel_grid("volume.vox")
+
+    :param dims: number of voxels in x-, y- and z-directions
+    :type dims: list, tuple
+    :param origin: minimum point of the first voxel
+    :type origin: list, tuple
+    :param step: step sizes in x-, y- and z-directions
+    :type step: list, tuple
+    """
+    # File header: magic, number of voxels (3 x uint32), origin and step (6 x double)
+    _file_magic = b'GVXL'
+    _file_header = "<4s3I6d"
+
+    def __init__(self, dims, origin=(0.0, 0.0, 0.0), step=(1.0, 1.0, 1.0)):
+        if len(dims) != 3 or len(origin) != 3 or len(step) != 3:
+            raise GeomdlException("Voxel grid dimensions, origin and step must have 3 components")
+        if min(dims) < 1:
+            raise GeomdlException("Voxel grid dimensions must be positive", data=dict(dims=dims))
+        self._dims = tuple(int(d) for d in dims)
+        self._origin = tuple(float(o) for o in origin)
+        self._step = tuple(float(s) for s in step)
+        self._bits = bytearray((len(self) + 7) // 8)
+
+    def __len__(self):
+        return self._dims[0] * self._dims[1] * self._dims[2]
+
+    def __iter__(self):
+        bits = self._bits
+        for idx in range(len(self)):
+            yield (bits[idx >> 3] >> (idx & 7)) & 1
+
+    def __getitem__(self, key):
+        idx = self.index(key)
+        return (self._bits[idx >> 3] >> (idx & 7)) & 1
+
+    def __setitem__(self, key, value):
+        idx = self.index(key)
+        if value:
+            self._bits[idx >> 3] |= 1 << (idx & 7)
+        else:
+            self._bits[idx >> 3] &= ~(1 << (idx & 7)) & 0xFF
+
+    def __eq__(self, other):
+        if not isinstance(other, VoxelGrid):
+            return False
+        return (self._dims, self._origin, self._step, self._bits) == \
+            (other._dims, other._origin, other._step, other._bits)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    @property
+    def dims(self):
+        """ Number of voxels in x-, y- and z-directions.
+
+        :getter: Gets the grid dimensions
+        :type: tuple
+        """
+        return self._dims
+
+    @property
+    def origin(self):
+        """ Minimum point of the first voxel.
+
+        :getter: Gets the grid origin
+        :type: tuple
+        """
+        return self._origin
+
+    @property
+    def step(self):
+        """ Step sizes in x-, y- and z-directions, i.e. the dimensions of a single voxel.
+
+        :getter: Gets the step sizes
+        :type: tuple
+        """
+        return self._step
+
+    @property
+    def count(self):
+        """ Number of filled voxels.
+
+        :getter: Gets the number of filled voxels
+        :type: int
+        """
+        return sum(_POPCOUNT[b] for b in self._bits)
+
+    @property
+    def bbox(self):
+        """ Bounding box of the voxel grid.
+
+        :getter: Gets the minimum and the maximum points of the voxel grid
+        :type: tuple
+        """
+        return self._origin, tuple(o + d * s for o, d, s in zip(self._origin, self._dims, self._step))
+
+    def index(self, key):
+        """ Converts the input voxel position to the flat index.
+
+        :param key: flat index or (i, j, k) position of the voxel
+        :type key: int, list, tuple
+        :return: flat index
+        :rtype: int
+        """
+        if isinstance(key, (list, tuple)):
+            if any(not 0 <= k < d for k, d in zip(key, self._dims)):
+                raise IndexError("Voxel position out of range")
+            return (key[0] * self._dims[1] + key[1]) * self._dims[2] + key[2]
+        if not 0 <= key < len(self):
+            raise IndexError("Voxel index out of range")
+        return key
+
+    def fill(self, indices):
+        """ Fills the voxels with the input flat indices.
+
+        :param indices: flat indices of the voxels to be filled
+        """
+        bits = self._bits
+        for idx in indices:
+            bits[idx >> 3] |= 1 << (idx & 7)
+
+    def filled_indices(self):
+        """ Generates the flat indices of the filled voxels in ascending order.
+
+        :return: flat indices of the filled voxels
+        :rtype: generator
+        """
+        for byte_idx, b in enumerate(self._bits):
+            if b:
+                for bit in range(8):
+                    if (b >> bit) & 1:
+                        yield (byte_idx << 3) + bit
+
+    def voxel(self, key):
+        """ Computes the bounding box of the voxel.
+
+        :param key: flat index or (i, j, k) position of the voxel
+        :type key: int, list, tuple
+        :return: minimum and maximum points of the voxel
+        :rtype: list
+        """
+        idx = self.index(key)
+        nyz = self._dims[1] * self._dims[2]
+        ijk = (idx // nyz, (idx // self._dims[2]) % self._dims[1], idx % self._dims[2])
+        bbmin = [o + i * s for o, i, s in zip(self._origin, ijk, self._step)]
+        bbmax = [b + s for b, s in zip(bbmin, self._step)]
+        return [bbmin, bbmax]
+
+    def voxels(self):
+        """ Generates the bounding boxes of all voxels, in the same format as :py:func:`.voxelize` output.
+
+        :return: minimum and maximum points of the voxels
+        :rtype: generator
+        """
+        for idx in range(len(self)):
+            yield self.voxel(idx)
+
+    def filled_voxels(self):
+        """ Generates the bounding boxes of the filled voxels.
+
+        :return: minimum and maximum points of the filled voxels
+        :rtype: generator
+        """
+        for idx in self.filled_indices():
+            yield self.voxel(idx)
+
+    def to_list(self):
+        """ Converts the occupancy to a list of 0 and 1 values, in the same format as :py:func:`.voxelize` output.
+
+        :return: filled information of the voxels
+        :rtype: list
+        """
+        filled = [0 for _ in range(len(self))]
+        for idx in self.filled_indices():
+            filled[idx] = 1
+        return filled
+
+    def save(self, file_name):
+        """ Saves the voxel grid as a binary file.
+
+        The file contains a header with the grid dimensions (little-endian unsigned int), origin and step sizes
+        (little-endian double) followed by the occupancy bitset.
+
+        :param file_name: file name to save
+        :type file_name: str
+        """
+        try:
+            with open(file_name, 'wb') as fp:
+                fp.write(struct.pack(self._file_header, self._file_magic, *(self._dims + self._origin + self._step)))
+                fp.write(self._bits)
+        except IOError as e:
+            print("An error occurred: {}".format(e.args[-1]))
+            raise e
+        except Exception:
+            raise
+
+    @classmethod
+    def load(cls, file_name):
+        """ Loads a voxel grid saved by :py:meth:`save`.
+
+        :param file_name: file name to load
+        :type file_name: str
+        :return: voxel grid
+        :rtype: VoxelGrid
+        """
+        try:
+            with open(file_name, 'rb') as fp:
+                header = fp.read(struct.calcsize(cls._file_header))
+                bits = fp.read()
+        except IOError as e:
+            print("An error occurred: {}".format(e.args[-1]))
+            raise e
+        except Exception:
+            raise
+        data = struct.unpack(cls._file_header, header)
+        if data[0] != cls._file_magic:
+            raise GeomdlException("Input file is not a voxel grid file", data=dict(file_name=file_name))
+        vgrid = cls(data[1:4], data[4:7], data[7:10])
+        if len(bits) != len(vgrid._bits):
+            raise GeomdlException("Voxel grid file is corrupted", data=dict(file_name=file_name))
+        vgrid._bits[:] = bits
+        return vgrid
+
+    @classmethod
+    def from_ranges(cls, ranges, steps):
+        """ Creates an empty voxel grid from the voxel ranges and the step sizes.
+
+        :param ranges: minimum coordinates of the voxels in x-, y- and z-directions
+        :type ranges: list, tuple
+        :param steps: step sizes in x-, y- and z-directions
+        :type steps: list, tuple
+        :return: voxel grid
+        :rtype: VoxelGrid
+        """
+        return cls([len(rng) for rng in ranges], [rng[0] for rng in ranges], steps)
+
+
+# Number of set bits for all byte values
+_POPCOUNT = [bin(b).count('1') for b in range(256)]
@@ -6,13 +6,17 @@
     Requires "pytest" to run.
 """
 
-from pytest import fixture, mark
+import copy
+import math
+from pytest import fixture, mark, raises, warns
 from geomdl import BSpline
+from geomdl import NURBS
 from geomdl import evaluators
 from geomdl import helpers
 from geomdl import convert
 from geomdl import operations
 from geomdl import linalg
+from geomdl.exceptions import GeomdlException
 
 GEOMDL_DELTA = 0.001
 
@@ -45,6 +49,34 @@ def test_bspline_curve_knot_vector(spline_curve):
     assert spline_curve.knotvector == [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
 
 
+def test_bspline_curve_copy(spline_curve):
+    evalpts = spline_curve.evalpts
+    curve = copy.copy(spline_curve)
+    assert curve.evalpts == evalpts
+    curve.ctrlpts[0][0] = 0.0
+    curve.knotvector[4] = 0.25
+    curve.delta = 0.1
+    assert spline_curve.ctrlpts[0] == [5.0, 5.0]
+    assert spline_curve.knotvector[4] == 0.33
+    assert spline_curve.evalpts == evalpts
+    spline_curve.ctrlpts[1][1] = 0.0
+    assert curve.ctrlpts[1] == [10.0, 10.0]
+
+
+def test_bspline_curve_copy_exposed(spline_curve):
+    # References taken before the copy cannot update the copy
+    ctrlpts = spline_curve.ctrlpts
+    knotvector = spline_curve.knotvector
+    curve = copy.copy(spline_curve)
+    translated = operations.translate(spline_curve, [1.0, 0.0])
+    ctrlpts[0][0] = 0.0
+    knotvector[4] = 0.25
+    assert spline_curve.ctrlpts[0] == [0.0, 5.0]
+    assert curve.ctrlpts[0] == [5.0, 5.0]
+    assert curve.knotvector[4] == 0.33
+    assert translated.knotvector[4] == 0.33
+
+
 @mark.parametrize("param, res", [
     (0.0, (5.0, 5.0)),
     (0.3, (18.617, 13.377)),
@@ -108,6 +140,23 @@ def test_bspline_curve2d_insert_knot_kv(spline_curve):
     assert s == 3
 
 
+def test_bspline_curve2d_insert_knots(spline_curve):
+    curve = BSpline.Curve()
+    curve.degree = spline_curve.degree
+    curve.ctrlpts = spline_curve.ctrlpts
+    curve.knotvector = spline_curve.knotvector
+    for param, num in ((0.2, 2), (0.5, 1), (0.9, 1)):
+        operations.insert_knot(curve, [param], [num])
+
+    _, matrices = operations.insert_knots(spline_curve, [[0.5, 0.2, 0.9]], num=[[1, 2, 1]], refinement_matrix=True)
+
+    assert spline_curve.knotvector == curve.knotvector
+    assert len(matrices[0]) == 10 and len(matrices[0][0]) == 6
+    for pt, res in zip(spline_curve.ctrlpts, curve.ctrlpts):
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+
+
 @mark.parametrize("param, num_remove", [
     (0.33, 1),
     (0.66, 1)
@@ -149,24 +198,125 @@ def test_bspline_curve2d_degree_elevate_degree(spline_curve):
 
 
 def test_bspline_curve2d_degree_elevate_ctrlpts_size(spline_curve):
+    # Each knot span adds one control point per elevation
     dops = 1
-    ctrlpts_size = spline_curve.ctrlpts_size + dops
+    ctrlpts_size = spline_curve.ctrlpts_size + (3 * dops)
     operations.degree_operations(spline_curve, [dops])
     assert spline_curve.ctrlpts_size == ctrlpts_size
 
 
+@mark.parametrize("dops", [1, 2])
+def test_bspline_curve2d_degree_elevate_eval(spline_curve, dops):
+    params = [0.0, 0.2, 0.33, 0.5, 0.66, 0.8, 1.0]
+    evalpts = spline_curve.evaluate_list(params)
+    operations.degree_operations(spline_curve, [dops])
+    assert spline_curve.knotvector.count(0.33) == 1 + dops
+    for pt1, pt2 in zip(evalpts, spline_curve.evaluate_list(params)):
+        assert linalg.point_distance(pt1, pt2) < GEOMDL_DELTA
+
+
 def test_bspline_curve2d_degree_reduce_degree(spline_curve):
     dops = -1
     degree_new = spline_curve.degree + dops
-    operations.degree_operations(spline_curve, [dops])
+    with warns(UserWarning):
+        operations.degree_operations(spline_curve, [dops])
     assert spline_curve.degree == degree_new
 
 
 def test_bspline_curve2d_degree_reduce_ctrlpts_size(spline_curve):
+    # The cubic is reduced to a single quadratic Bezier segment, i.e. there are no internal knots
+    params = linalg.linspace(0.0, 1.0, 101)
+    evalpts = spline_curve.evaluate_list(params)
     dops = -1
-    ctrlpts_size_new = spline_curve.ctrlpts_size + dops
-    operations.degree_operations(spline_curve, [dops])
-    assert spline_curve.ctrlpts_size == ctrlpts_size_new
+    with warns(UserWarning):
+        operations.degree_operations(spline_curve, [dops])
+    assert spline_curve.ctrlpts_size == 3
+    assert spline_curve.knotvector == [0.0, 0.0, 0.0, 1.0, 1.0, 1.0]
+
+    # The approximation error is reported and bounded by the error bound
+    error = spline_curve.opt_get('reduction_error')
+    assert abs(error - 3.5497829) < GEOMDL_DELTA
+    deviation = max(linalg.point_distance(pt1, pt2) for pt1, pt2 in zip(evalpts, spline_curve.evaluate_list(params)))
+    assert 1.0 < deviation <= error
+
+
+def test_bspline_curve2d_degree_elevate_reduce(spline_curve):
+    ctrlpts = spline_curve.ctrlpts
+    knotvector = spline_curve.knotvector
+    operations.degree_operations(spline_curve, [2])
+    operations.degree_operations(spline_curve, [-2], tol=GEOMDL_DELTA)
+    assert spline_curve.degree == 3
+    assert spline_curve.knotvector == knotvector
+    for pt1, pt2 in zip(ctrlpts, spline_curve.ctrlpts):
+        assert linalg.point_distance(pt1, pt2) < GEOMDL_DELTA
+
+
+def test_bspline_curve2d_degree_reduce_tol(spline_curve):
+    with raises(GeomdlException):
+        operations.degree_operations(spline_curve, [-1], tol=GEOMDL_DELTA)
+
+
+def test_degree_reduction_spline_error_bound(spline_curve):
+    cpts, kv, err = helpers.degree_reduction_spline(spline_curve.degree, spline_curve.knotvector, spline_curve.ctrlpts)
+    crv = BSpline.Curve()
+    crv.degree = spline_curve.degree - 1
+    crv.ctrlpts = cpts
+    crv.knotvector = kv
+    params = [float(i) / 50 for i in range(51)]
+    for pt1, pt2 in zip(spline_curve.evaluate_list(params), crv.evaluate_list(params)):
+        assert linalg.point_distance(pt1, pt2) <= err
+
+
+@mark.parametrize("density", [1, 2, 3])
+def test_bspline_curve2d_remove_knots_refined(spline_curve, density):
+    ctrlpts = spline_curve.ctrlpts
+    knotvector = spline_curve.knotvector
+    operations.refine_knotvector(spline_curve, [density])
+    operations.remove_knots(spline_curve, [True], tol=GEOMDL_DELTA)
+    assert spline_curve.knotvector == knotvector
+    for pt1, pt2 in zip(ctrlpts, spline_curve.ctrlpts):
+        assert linalg.point_distance(pt1, pt2) < GEOMDL_DELTA
+
+
+@mark.parametrize("tol", [0.1, 1.0, 5.0])
+def test_bspline_curve2d_remove_knots_tol(spline_curve, tol):
+    params = [float(i) / 100 for i in range(101)]
+    evalpts = spline_curve.evaluate_list(params)
+    operations.remove_knots(spline_curve, [True], tol=tol)
+    for pt1, pt2 in zip(evalpts, spline_curve.evaluate_list(params)):
+        assert linalg.point_distance(pt1, pt2) <= tol
+
+
+@mark.parametrize("kv, knots", [
+    ([0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0], [0.0, 0.33, 0.66, 1.0]),
+    ([0.0, 0.0, 0.0, 0.0, 0.5, 0.5, 1.0, 1.0, 1.0, 1.0], [0.0, 0.5, 1.0])
+])
+def test_bspline_curve2d_decompose(spline_curve, kv, knots):
+    spline_curve.knotvector = kv
+    segments = operations.decompose_curve(spline_curve)
+    assert len(segments) == len(knots) - 1
+    for seg, k_start, k_end in zip(segments, knots[:-1], knots[1:]):
+        assert seg.degree == spline_curve.degree
+        assert seg.ctrlpts_size == spline_curve.degree + 1
+        for t in (0.0, 0.25, 0.5, 1.0):
+            evalpt = spline_curve.evaluate_single(k_start + t * (k_end - k_start))
+            segpt = seg.evaluate_single(t)
+            assert abs(evalpt[0] - segpt[0]) < GEOMDL_DELTA
+            assert abs(evalpt[1] - segpt[1]) < GEOMDL_DELTA
+
+
+def test_bspline_curve2d_split_multi(spline_curve):
+    params = [0.2, 0.33, 0.5, 0.9]
+    curves = operations.split_curve_multi(spline_curve, params)
+    assert len(curves) == len(params) + 1
+
+    knots = [0.0] + params + [1.0]
+    for crv, k_start, k_end in zip(curves, knots[:-1], knots[1:]):
+        for t in (0.0, 0.25, 0.5, 1.0):
+            evalpt = spline_curve.evaluate_single(k_start + t * (k_end - k_start))
+            crvpt = crv.evaluate_single(t)
+            assert abs(evalpt[0] - crvpt[0]) < GEOMDL_DELTA
+            assert abs(evalpt[1] - crvpt[1]) < GEOMDL_DELTA
 
 
 @fixture
@@ -218,6 +368,95 @@ def test_nurbs_curve2d_deriv(nurbs_curve, param, order, res):
             assert abs(c - e) < GEOMDL_DELTA
 
 
+def test_nurbs_curve2d_length_circle():
+    # Full circle with radius 2
+    curve = NURBS.Curve()
+    curve.degree = 2
+    w = 0.5 ** 0.5
+    curve.ctrlptsw = [[2.0, 0.0, 1.0], [2.0 * w, 2.0 * w, w], [0.0, 2.0, 1.0], [-2.0 * w, 2.0 * w, w],
+                      [-2.0, 0.0, 1.0], [-2.0 * w, -2.0 * w, w], [0.0, -2.0, 1.0], [2.0 * w, -2.0 * w, w],
+                      [2.0, 0.0, 1.0]]
+    curve.knotvector = [0.0, 0.0, 0.0, 0.25, 0.25, 0.5, 0.5, 0.75, 0.75, 1.0, 1.0, 1.0]
+    assert abs(operations.length_curve(curve) - 4.0 * math.pi) < GEOMDL_DELTA
+
+    # Points with equal arc length spacing have equal angular spacing on the circle
+    params = operations.arc_length_params(curve, 17)
+    assert params[0] == 0.0 and params[-1] == 1.0
+    pts = curve.evaluate_list(params)
+    for pt1, pt2 in zip(pts[:-1], pts[1:]):
+        assert abs(linalg.point_distance(pt1, pt2) - 4.0 * math.sin(math.pi / 16)) < GEOMDL_DELTA
+
+
+def test_nurbs_curve2d_transform_projective():
+    # Quarter circle with radius 1
+    curve = NURBS.Curve()
+    curve.degree = 2
+    w = 0.5 ** 0.5
+    curve.ctrlptsw = [[1.0, 0.0, 1.0], [w, w, w], [0.0, 1.0, 1.0]]
+    curve.knotvector = [0.0, 0.0, 0.0, 1.0, 1.0, 1.0]
+
+    # Projective transformations map the points through the homogeneous division
+    matrix = [[2.0, 0.0, 0.0, 1.0], [0.0, 1.0, 0.0, -1.0], [0.0, 0.0, 1.0, 0.0], [0.5, 0.0, 0.0, 1.0]]
+    res = operations.transform(curve, matrix)
+    for u in (0.0, 0.3, 0.5, 0.8, 1.0):
+        x, y = curve.evaluate_single(u)
+        pt = res.evaluate_single(u)
+        assert abs(pt[0] - (2.0 * x + 1.0) / (0.5 * x + 1.0)) < GEOMDL_DELTA
+        assert abs(pt[1] - (y - 1.0) / (0.5 * x + 1.0)) < GEOMDL_DELTA
+
+    # The input curve is unchanged
+    assert curve.ctrlptsw[1] == [w, w, w]
+
+
+def test_bspline_curve4d_rotate():
+    curve = BSpline.Curve()
+    curve.degree = 2
+    curve.ctrlpts = [[1.0, 0.0, 0.0, 5.0], [2.0, 1.0, 1.0, 6.0], [3.0, 0.0, 2.0, 7.0]]
+    curve.knotvector = [0.0, 0.0, 0.0, 1.0, 1.0, 1.0]
+
+    # Rotation is applied on the first 3 coordinates about the first control point
+    res = operations.rotate(curve, 90, axis=2)
+    expected = [[1.0, 0.0, 0.0, 5.0], [0.0, 1.0, 1.0, 6.0], [1.0, 2.0, 2.0, 7.0]]
+    for pt, ept in zip(res.ctrlpts, expected):
+        assert all(abs(c - ec) < GEOMDL_DELTA for c, ec in zip(pt, ept))
+    assert curve.ctrlpts[1] == [2.0, 1.0, 1.0, 6.0]
+
+
+def test_bspline_curve2d_param_at_length(spline_curve):
+    length = operations.length_curve(spline_curve)
+    spline_curve.sample_size = 5001
+    evalpts = spline_curve.evalpts
+    chords = [linalg.point_distance(pt1, pt2) for pt1, pt2 in zip(evalpts[:-1], evalpts[1:])]
+    assert abs(sum(chords) - length) < GEOMDL_DELTA
+
+    # Compare with the chord lengths of the dense polyline
+    for idx in (0, 1000, 2500, 4321, 5000):
+        u = operations.param_at_length(spline_curve, sum(chords[:idx]))
+        assert abs(u - idx / 5000.0) < GEOMDL_DELTA
+
+    # The lookup table is generated again after the curve changes
+    spline_curve.ctrlpts = [[5.0, 5.0], [10.0, 10.0], [20.0, 15.0], [35.0, 15.0], [45.0, 10.0], [60.0, 5.0]]
+    assert operations.length_curve(spline_curve) > length
+
+
+def test_bspline_curve2d_tangent(spline_curve):
+    params = [0.0, 0.2, 0.33, 0.5, 0.9, 1.0]
+    for u, (pt, vec) in zip(params, operations.tangent(spline_curve, params, normalize=False)):
+        ders = spline_curve.derivatives(u, 1)
+        assert abs(pt[0] - ders[0][0]) < GEOMDL_DELTA and abs(pt[1] - ders[0][1]) < GEOMDL_DELTA
+        assert abs(vec[0] - ders[1][0]) < GEOMDL_DELTA and abs(vec[1] - ders[1][1]) < GEOMDL_DELTA
+
+    # The hodographs are computed again after the curve changes
+    operations.insert_knot(spline_curve, [0.5], [1])
+    spline_curve.ctrlpts = [[p[0], 2.0 * p[1]] for p in spline_curve.ctrlpts]
+    dcurve = operations.derivative_curve(spline_curve)
+    for u in params:
+        ders = spline_curve.derivatives(u, 1)
+        vec = operations.tangent(spline_curve, u, normalize=False)[1]
+        dpt = dcurve.evaluate_single(u)
+        assert abs(vec[1] - ders[1][1]) < GEOMDL_DELTA and abs(dpt[1] - ders[1][1]) < GEOMDL_DELTA
+
+
 @fixture
 def spline_curve_kv_norm1():
     """ Creates a spline Curve with knot vector normalization """
@@ -264,3 +503,20 @@ def test_bspline_curve2d_eval_kv_norm2(spline_curve_kv_norm2, param, res):
 
     assert abs(evalpt[0] - res[0]) < GEOMDL_DELTA
     assert abs(evalpt[1] - res[1]) < GEOMDL_DELTA
+
+
+def test_bspline_curve_project(spline_curve):
+    params = [0.0, 0.1, 0.3, 0.5, 0.77, 1.0]
+    pts = spline_curve.evaluate_list(params)
+    res = spline_curve.project(pts)
+    assert len(res) == len(params)
+    for r, u in zip(res, params):
+        assert abs(r - u) < GEOMDL_DELTA
+
+    # Off-curve points project onto the closest point on the curve
+    pt = [27.645, 20.0]
+    u = spline_curve.project(pt)
+    dense = [i / 1000.0 for i in range(1001)]
+    dists = [linalg.point_distance(pt, cpt) for cpt in spline_curve.evaluate_list(dense)]
+    assert abs(u - dense[dists.index(min(dists))]) < GEOMDL_DELTA
+    assert spline_curve.project([60.0, 0.0]) == 1.0
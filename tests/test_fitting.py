@@ -0,0 +1,202 @@
+"""
+    Tests for the NURBS-Python package
+    Released under The MIT License. See LICENSE file for details.
+    Copyright (c) 2018-2019 Onur Rauf Bingol
+
+    Tests geomdl.fitting module. Requires "pytest" to run.
+"""
+
+import math
+from pytest import fixture, mark, raises
+from geomdl import fitting
+from geomdl import helpers
+from geomdl import linalg
+from geomdl import multi
+from geomdl.exceptions import GeomdlException
+
+GEOMDL_DELTA = 10e-6
+
+
+@fixture
+def curve_points():
+    """ Generates data points on a helix """
+    return [[math.cos(t * 0.4), math.sin(t * 0.4), t * 0.1] for t in range(25)]
+
+
+@fixture
+def surface_points():
+    """ Generates a grid of data points with size (8, 6) """
+    return [[float(u), float(v), math.sin(u * 0.5) * math.cos(v * 0.4)] for u in range(8) for v in range(6)]
+
+
+@mark.parametrize("degree", [1, 2, 3, 4])
+def test_interpolate_curve(curve_points, degree):
+    curve = fitting.interpolate_curve(curve_points, degree)
+    uk = fitting.compute_params_curve(curve_points)
+    for u, pt in zip(uk, curve_points):
+        assert linalg.point_distance(curve.evaluate_single(u), pt) < GEOMDL_DELTA
+
+    # Compare with the dense solution
+    matrix_a = fitting._build_coeff_matrix(degree, curve.knotvector, uk, curve_points)
+    ctrlpts = linalg.lu_solve(matrix_a, curve_points)
+    for cpt, res in zip(curve.ctrlpts, ctrlpts):
+        assert linalg.point_distance(cpt, res) < GEOMDL_DELTA
+
+
+def test_interpolate_surface(surface_points):
+    surf = fitting.interpolate_surface(surface_points, 8, 6, 3, 2)
+    uk, vl = fitting.compute_params_surface(surface_points, 8, 6)
+    for i, u in enumerate(uk):
+        for j, v in enumerate(vl):
+            assert linalg.point_distance(surf.evaluate_single((u, v)), surface_points[j + 6 * i]) < GEOMDL_DELTA
+
+
+def test_approximate_curve(curve_points):
+    curve = fitting.approximate_curve(curve_points, 3, ctrlpts_size=12)
+    assert len(curve.ctrlpts) == 12
+    assert curve.ctrlpts[0] == curve_points[0]
+    assert curve.ctrlpts[-1] == curve_points[-1]
+    uk = fitting.compute_params_curve(curve_points)
+    for u, pt in zip(uk, curve_points):
+        assert linalg.point_distance(curve.evaluate_single(u), pt) < 0.01
+
+
+def test_approximate_surface(surface_points):
+    surf = fitting.approximate_surface(surface_points, 8, 6, 2, 2, ctrlpts_size_u=6, ctrlpts_size_v=5)
+    assert (surf.ctrlpts_size_u, surf.ctrlpts_size_v) == (6, 5)
+    assert surf.ctrlpts[0] == surface_points[0]
+    assert surf.ctrlpts[4] == surface_points[5]
+    assert surf.ctrlpts[-1] == surface_points[-1]
+
+    # Each row is fitted in the same way as a single curve
+    uk, vl = fitting.compute_params_surface(surface_points, 8, 6)
+    kv_u = fitting.compute_knot_vector2(2, 8, 6, uk)
+    rows = [[surface_points[j + 6 * i] for i in range(8)] for j in range(6)]
+    ctrlpts_tmp = fitting._approximate_rows(rows, 2, kv_u, uk, 6)
+    for j, row in enumerate(rows):
+        assert fitting._approximate_rows([row], 2, kv_u, uk, 6)[0] == ctrlpts_tmp[j]
+
+
+def test_approximate_curve_weights(curve_points):
+    pts = [list(pt) for pt in curve_points]
+    pts[12][2] += 1.0  # outlier
+    weights = [1.0 for _ in pts]
+    weights[12] = 10e-8
+    curve = fitting.approximate_curve(pts, 3, ctrlpts_size=12)
+    curve_w = fitting.approximate_curve(pts, 3, ctrlpts_size=12, weights=weights)
+    curve_ref = fitting.approximate_curve(curve_points, 3, ctrlpts_size=12)
+    uk = fitting.compute_params_curve(pts)
+    dist = linalg.point_distance(curve.evaluate_single(uk[12]), curve_points[12])
+    dist_w = linalg.point_distance(curve_w.evaluate_single(uk[12]), curve_ref.evaluate_single(uk[12]))
+    assert dist_w < dist
+    with raises(GeomdlException):
+        fitting.approximate_curve(pts, 3, ctrlpts_size=12, weights=weights[1:])
+
+
+def test_approximate_curve_stream(curve_points):
+    uk = fitting.compute_params_curve(curve_points)
+    kv = [0.0, 0.0, 0.0, 0.0, 0.2, 0.4, 0.6, 0.8, 1.0, 1.0, 1.0, 1.0]
+
+    # Dense least squares solution
+    matrix_n = [[helpers.basis_function_one(3, kv, j, u) for j in range(8)] for u in uk]
+    matrix_nt = linalg.matrix_transpose(matrix_n)
+    ctrlpts = linalg.lu_solve(linalg.matrix_multiply(matrix_nt, matrix_n),
+                              linalg.matrix_multiply(matrix_nt, curve_points))
+
+    chunks = [dict(points=curve_points[idx:idx + 7], params=uk[idx:idx + 7]) for idx in range(0, 25, 7)]
+    curve = fitting.approximate_curve_stream(chunks, 3, 8, knotvector=kv)
+    for cpt, res in zip(curve.ctrlpts, ctrlpts):
+        assert linalg.point_distance(cpt, res) < GEOMDL_DELTA
+
+    # Compute parameters on the fly
+    chord_length = sum(linalg.point_distance(p1, p2) for p1, p2 in zip(curve_points[1:], curve_points[:-1]))
+    chunks = [curve_points[idx:idx + 7] for idx in range(0, 25, 7)]
+    curve = fitting.approximate_curve_stream(chunks, 3, 8, knotvector=kv, chord_length=chord_length)
+    for cpt, res in zip(curve.ctrlpts, ctrlpts):
+        assert linalg.point_distance(cpt, res) < GEOMDL_DELTA
+
+    # Parallel accumulation
+    curve_mp = fitting.approximate_curve_stream(iter(chunks), 3, 8, knotvector=kv, chord_length=chord_length,
+                                                num_procs=2)
+    for cpt, res in zip(curve_mp.ctrlpts, curve.ctrlpts):
+        assert linalg.point_distance(cpt, res) < GEOMDL_DELTA
+
+
+def test_streaming_curve_fit_merge(curve_points):
+    uk = fitting.compute_params_curve(curve_points)
+    fitter1 = fitting.StreamingCurveFit(2, 6)
+    fitter1.add(curve_points[:10], uk[:10])
+    fitter2 = fitting.StreamingCurveFit(2, 6)
+    fitter2.add(curve_points[10:], uk[10:])
+    fitter1.merge(fitter2)
+    assert fitter1.num_points == 25
+    fitter = fitting.StreamingCurveFit(2, 6)
+    fitter.add(curve_points, uk)
+    for cpt, res in zip(fitter1.solve().ctrlpts, fitter.solve().ctrlpts):
+        assert linalg.point_distance(cpt, res) < GEOMDL_DELTA
+    with raises(GeomdlException):
+        fitter.add(curve_points)
+
+
+def test_streaming_curve_fit_empty_chunk(curve_points):
+    uk = fitting.compute_params_curve(curve_points)
+    fitter = fitting.StreamingCurveFit(2, 6)
+    fitter.add([], params=[])
+    assert fitter.num_points == 0
+    with raises(GeomdlException):
+        fitter.solve()
+    fitter.add(curve_points, uk)
+    fitter.add([], params=[])
+    assert fitter.num_points == 25
+
+    # Empty chunks are skipped in parallel accumulation
+    chunks = [dict(points=[], params=[]), dict(points=curve_points, params=uk), dict(points=[], params=[])]
+    curve = fitting.approximate_curve_stream(chunks, 2, 6, num_procs=2)
+    for cpt, res in zip(curve.ctrlpts, fitter.solve().ctrlpts):
+        assert linalg.point_distance(cpt, res) < GEOMDL_DELTA
+
+
+@mark.parametrize("shared_params", [False, True])
+def test_interpolate_curves(curve_points, shared_params):
+    points_list = [[[pt[0] * (idx + 1), pt[1], pt[2] + idx] for pt in curve_points] for idx in range(4)]
+    points_list.append(curve_points[:12])
+    params = fitting.compute_params_curve(curve_points) if shared_params else None
+    if shared_params:
+        points_list.pop()
+    crvs = fitting.interpolate_curves(points_list, 3, params=params)
+    assert isinstance(crvs, multi.CurveContainer)
+    assert len(crvs) == len(points_list)
+    for crv, points in zip(crvs, points_list):
+        uk = params if shared_params else fitting.compute_params_curve(points)
+        for u, pt in zip(uk, points):
+            assert linalg.point_distance(crv.evaluate_single(u), pt) < GEOMDL_DELTA
+
+
+def test_approximate_curves(curve_points):
+    points_list = [[[pt[0], pt[1] * (idx + 1), pt[2]] for pt in curve_points] for idx in range(3)]
+    crvs = fitting.approximate_curves(points_list, 3, ctrlpts_size=10, num_procs=2)
+    for crv, points in zip(crvs, points_list):
+        crv_ref = fitting.approximate_curve(points, 3, ctrlpts_size=10)
+        assert crv.knotvector == crv_ref.knotvector
+        for cpt, res in zip(crv.ctrlpts, crv_ref.ctrlpts):
+            assert linalg.point_distance(cpt, res) < GEOMDL_DELTA
+
+
+def test_approximate_curve_adaptive(curve_points):
+    curve = fitting.approximate_curve_adaptive(curve_points, 3, tol=10e-3)
+    iterations = curve.opt_get('iterations')
+    assert iterations[0]['ctrlpts_size'] == 4
+    assert iterations[-1]['ctrlpts_size'] == len(curve.ctrlpts) < len(curve_points) - 1
+    assert curve.opt_get('max_error') <= 10e-3
+    assert curve.opt_get('rms_error') <= curve.opt_get('max_error')
+    uk = fitting.compute_params_curve(curve_points)
+    for u, pt in zip(uk, curve_points):
+        assert linalg.point_distance(curve.evaluate_single(u), pt) <= 10e-3 + GEOMDL_DELTA
+
+
+def test_approximate_curve_adaptive_basis(curve_points):
+    uk = fitting.compute_params_curve(curve_points)
+    kv = [0.0, 0.0, 0.0, 0.0, 0.3, 0.6, 1.0, 1.0, 1.0, 1.0]
+    kv_new = [0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.6, 1.0, 1.0, 1.0, 1.0]
+    basis = fitting._update_basis(fitting._compute_basis(3, kv, uk, 6), 3, kv, kv_new, uk, 7)
+    assert basis == fitting._compute_basis(3, kv_new, uk, 7)
@@ -152,3 +152,33 @@ def test_basis_function_ders_one():
 	assert abs(to_check[2][0] - result[2][0]) < GEOMDL_DELTA
 	assert abs(to_check[2][1] - result[2][1]) < GEOMDL_DELTA
 	assert abs(to_check[2][2] - result[2][2]) < GEOMDL_DELTA
+
+
+def test_bezier_decomposition():
+    degree = 2
+    knot_vector = [0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 1.0]
+    ctrlpts = [[0.0, 0.0], [1.0, 2.0], [3.0, 2.0], [4.0, 0.0]]
+
+    segments, knots = helpers.bezier_decomposition(degree, knot_vector, ctrlpts)
+    result = [[[0.0, 0.0], [1.0, 2.0], [2.0, 2.0]], [[2.0, 2.0], [3.0, 2.0], [4.0, 0.0]]]
+
+    assert knots == [0.0, 0.5, 1.0]
+    assert len(segments) == len(result)
+    for seg, res in zip(segments, result):
+        for pt, pt_res in zip(seg, res):
+            assert abs(pt[0] - pt_res[0]) < GEOMDL_DELTA
+            assert abs(pt[1] - pt_res[1]) < GEOMDL_DELTA
+
+
+def test_knot_refinement_matrix():
+    degree = 2
+    knot_vector = [0.0, 0.0, 0.0, 1.0, 1.0, 1.0]
+    knot_vector_new = [0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 1.0]
+
+    to_check = helpers.knot_refinement_matrix(degree, knot_vector, knot_vector_new)
+    result = [[1.0, 0.0, 0.0], [0.5, 0.5, 0.0], [0.0, 0.5, 0.5], [0.0, 0.0, 1.0]]
+
+    assert len(to_check) == len(result)
+    for row, row_res in zip(to_check, result):
+        for val, val_res in zip(row, row_res):
+            assert abs(val - val_res) < GEOMDL_DELTA
@@ -238,3 +238,41 @@ def test_vector_sum():
 def test_is_vector_zero():
     vec = [10e-4 for _ in range(3)]
     assert linalg.vector_is_zero(vec, 10e-3)
+
+
+def test_lu_solve_banded():
+    # Banded matrix with 1 sub-diagonal and 2 super-diagonals
+    matrix_a = [[4.0, 1.0, 0.5, 0.0], [1.0, 4.0, 1.0, 0.5], [0.0, 1.0, 4.0, 1.0], [0.0, 0.0, 1.0, 4.0]]
+    matrix_ab = [[0.0, 4.0, 1.0, 0.5], [1.0, 4.0, 1.0, 0.5], [1.0, 4.0, 1.0, 0.0], [1.0, 4.0, 0.0, 0.0]]
+    b = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0]]
+    result = linalg.lu_solve(matrix_a, b)
+    to_check = linalg.lu_solve_banded(matrix_ab, 1, 2, b)
+    for res, chk in zip(result, to_check):
+        assert abs(res[0] - chk[0]) < GEOMDL_DELTA
+        assert abs(res[1] - chk[1]) < GEOMDL_DELTA
+
+
+def test_lu_decomposition_banded():
+    with pytest.raises(ValueError):
+        linalg.lu_decomposition_banded([[1.0, 2.0], [1.0, 2.0, 3.0]], 1, 1)
+
+
+def test_cholesky_solve_banded():
+    matrix_a = [[4.0, 1.0, 0.5, 0.0], [1.0, 4.0, 1.0, 0.5], [0.5, 1.0, 4.0, 1.0], [0.0, 0.5, 1.0, 4.0]]
+    matrix_ab = [[0.0, 0.0, 4.0], [0.0, 1.0, 4.0], [0.5, 1.0, 4.0], [0.5, 1.0, 4.0]]
+    b = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0]]
+    result = linalg.lu_solve(matrix_a, b)
+    to_check = linalg.cholesky_solve_banded(matrix_ab, 2, b)
+    for res, chk in zip(result, to_check):
+        assert abs(res[0] - chk[0]) < GEOMDL_DELTA
+        assert abs(res[1] - chk[1]) < GEOMDL_DELTA
+
+
+@pytest.mark.parametrize("num", [1, 2, 3, 5, 8])
+def test_gauss_legendre(num):
+    nodes, weights = linalg.gauss_legendre(num)
+    assert len(nodes) == len(weights) == num
+    # Integrates the polynomials up to degree 2n - 1 exactly
+    for k in range(2 * num):
+        result = 2.0 / (k + 1) if k % 2 == 0 else 0.0
+        assert abs(sum(w * x ** k for x, w in zip(nodes, weights)) - result) < GEOMDL_DELTA
@@ -11,6 +11,9 @@ from geomdl import BSpline
 from geomdl import evaluators
 from geomdl import convert
 from geomdl import helpers
+from geomdl import linalg
+from geomdl import multi
+from geomdl import operations
 
 GEOMDL_DELTA = 0.001
 
@@ -188,6 +191,117 @@ def test_bspline_surface_remove_knot_kv_v(spline_surf):
     assert s == 0
 
 
+@mark.parametrize("decompose_dir, num_u, num_v", [
+    ('u', 3, 1),
+    ('v', 1, 3),
+    ('uv', 3, 3)
+])
+def test_bspline_surface_decompose(spline_surf, decompose_dir, num_u, num_v):
+    knots = [0.0, 0.33, 0.66, 1.0]
+    knots_u = knots if num_u > 1 else [0.0, 1.0]
+    knots_v = knots if num_v > 1 else [0.0, 1.0]
+    patches = operations.decompose_surface(spline_surf, decompose_dir=decompose_dir)
+    assert len(patches) == num_u * num_v
+    for idx, patch in enumerate(patches):
+        iu, iv = divmod(idx, num_v)
+        for t_u, t_v in ((0.0, 0.0), (0.3, 0.6), (1.0, 0.5)):
+            u = knots_u[iu] + t_u * (knots_u[iu + 1] - knots_u[iu])
+            v = knots_v[iv] + t_v * (knots_v[iv + 1] - knots_v[iv])
+            evalpt = spline_surf.evaluate_single((u, v))
+            patchpt = patch.evaluate_single((t_u, t_v))
+            assert abs(evalpt[0] - patchpt[0]) < GEOMDL_DELTA
+            assert abs(evalpt[1] - patchpt[1]) < GEOMDL_DELTA
+            assert abs(evalpt[2] - patchpt[2]) < GEOMDL_DELTA
+
+
+@mark.parametrize("density, cpsize", [
+    ([1, 0], [19, 6]),
+    ([0, 2], [6, 37]),
+    ([1, 1], [19, 19])
+])
+def test_bspline_surface_knot_refine(spline_surf, density, cpsize):
+    params = [(0.0, 0.0), (0.2, 0.9), (0.5, 0.5), (0.85, 0.4), (1.0, 1.0)]
+    evalpts = spline_surf.evaluate_list(params)
+    operations.refine_knotvector(spline_surf, density)
+    assert spline_surf.cpsize == cpsize
+    for pt, res in zip(spline_surf.evaluate_list(params), evalpts):
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_insert_knots(spline_surf):
+    params = [(0.0, 0.0), (0.2, 0.9), (0.5, 0.5), (0.85, 0.4), (1.0, 1.0)]
+    evalpts = spline_surf.evaluate_list(params)
+    operations.insert_knots(spline_surf, [[0.2, 0.5], [0.5, 0.5, 0.8]])
+    assert spline_surf.cpsize == [8, 9]
+    assert helpers.find_multiplicity(0.5, spline_surf.knotvector_v) == 2
+    for pt, res in zip(spline_surf.evaluate_list(params), evalpts):
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_split_multi(spline_surf):
+    knots_u = [0.0, 0.25, 0.66, 1.0]
+    knots_v = [0.0, 0.5, 1.0]
+    patches = operations.split_surface_multi(spline_surf, [knots_u[1:-1], knots_v[1:-1]])
+    assert len(patches) == 6
+    for idx, patch in enumerate(patches):
+        iu, iv = divmod(idx, 2)
+        for t_u, t_v in ((0.0, 0.0), (0.3, 0.6), (1.0, 1.0)):
+            u = knots_u[iu] + t_u * (knots_u[iu + 1] - knots_u[iu])
+            v = knots_v[iv] + t_v * (knots_v[iv + 1] - knots_v[iv])
+            evalpt = spline_surf.evaluate_single((u, v))
+            patchpt = patch.evaluate_single((t_u, t_v))
+            assert abs(evalpt[0] - patchpt[0]) < GEOMDL_DELTA
+            assert abs(evalpt[1] - patchpt[1]) < GEOMDL_DELTA
+            assert abs(evalpt[2] - patchpt[2]) < GEOMDL_DELTA
+
+
+@mark.parametrize("dops, degree, cpsize", [
+    ([1, 0], [4, 3], [9, 6]),
+    ([0, 2], [3, 5], [6, 12]),
+    ([1, 1], [4, 4], [9, 9])
+])
+def test_bspline_surface_degree_elevate(spline_surf, dops, degree, cpsize):
+    params = [(0.0, 0.0), (0.2, 0.9), (0.5, 0.5), (0.85, 0.4), (1.0, 1.0)]
+    evalpts = spline_surf.evaluate_list(params)
+    operations.degree_operations(spline_surf, dops)
+    assert spline_surf.degree == degree
+    assert spline_surf.cpsize == cpsize
+    for pt, res in zip(spline_surf.evaluate_list(params), evalpts):
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_degree_elevate_reduce(spline_surf):
+    ctrlpts = spline_surf.ctrlpts
+    operations.degree_operations(spline_surf, [1, 1])
+    operations.degree_operations(spline_surf, [-1, -1], tol=GEOMDL_DELTA)
+    assert spline_surf.degree == [3, 3]
+    assert spline_surf.cpsize == [6, 6]
+    for pt, res in zip(spline_surf.ctrlpts, ctrlpts):
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_remove_knots(spline_surf):
+    ctrlpts = spline_surf.ctrlpts
+    operations.refine_knotvector(spline_surf, [2, 1])
+    operations.remove_knots(spline_surf, [True, False], tol=GEOMDL_DELTA)
+    assert spline_surf.knotvector_u == [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+    assert spline_surf.cpsize[0] == 6
+    operations.remove_knots(spline_surf, [False, True], tol=GEOMDL_DELTA)
+    assert spline_surf.cpsize == [6, 6]
+    for pt, res in zip(spline_surf.ctrlpts, ctrlpts):
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
 @fixture
 def nurbs_surf(spline_surf):
     surf = convert.bspline_to_nurbs(spline_surf)
@@ -199,6 +313,21 @@ def test_nurbs_weights(nurbs_surf):
     assert nurbs_surf.weights[5] == 1.0
 
 
+def test_nurbs_surface_tangent_normal(nurbs_surf):
+    params = [(0.0, 0.0), (0.2, 0.7), (0.5, 0.5), (1.0, 0.35)]
+    for weight in (2.0, 0.5):
+        # The hodographs are computed again after the weights change
+        nurbs_surf.weights = [weight if idx == 14 else w for idx, w in enumerate(nurbs_surf.weights)]
+        tangents = operations.tangent(nurbs_surf, params, normalize=False)
+        normals = operations.normal(nurbs_surf, params, normalize=False)
+        for uv, tan, nrm in zip(params, tangents, normals):
+            skl = nurbs_surf.derivatives(uv[0], uv[1], 1)
+            for i in range(3):
+                assert abs(tan[1][i] - skl[1][0][i]) < GEOMDL_DELTA
+                assert abs(tan[2][i] - skl[0][1][i]) < GEOMDL_DELTA
+                assert abs(nrm[1][i] - linalg.vector_cross(skl[1][0], skl[0][1])[i]) < GEOMDL_DELTA
+
+
 @mark.parametrize("param, res", [
     ((0.0, 0.0), (-25.0, -25.0, -10.0)),
     ((0.0, 0.2), (-25.0, -11.403, -3.385)),
@@ -246,3 +375,74 @@ def test_surface_bounding_box(spline_surf):
     assert abs(to_check[1][0] - result[1][0]) < GEOMDL_DELTA
     assert abs(to_check[1][1] - result[1][1]) < GEOMDL_DELTA
     assert abs(to_check[1][2] - result[1][2]) < GEOMDL_DELTA
+
+
+def test_surface_tessellate_tiled(spline_surf):
+    spline_surf.sample_size = 15
+
+    # Serial tessellation
+    spline_surf.tessellate()
+    vertices = [v.data for v in spline_surf.vertices]
+    faces = sorted([tuple(t.data) for t in spline_surf.faces])
+
+    # Tiled tessellation
+    spline_surf.tessellate(force=True, num_procs=2, tile_size=4)
+
+    assert [v.data for v in spline_surf.vertices] == vertices
+    assert sorted([tuple(t.data) for t in spline_surf.faces]) == faces
+    assert [t.id for t in spline_surf.faces] == list(range(len(faces)))
+
+
+def test_surface_project(spline_surf):
+    params = [(0.0, 0.0), (0.2, 0.7), (0.45, 0.5), (0.9, 0.15), (1.0, 0.6)]
+    pts = spline_surf.evaluate_list(params)
+    res = spline_surf.project(pts)
+    assert len(res) == len(params)
+    for r, uv in zip(res, params):
+        assert abs(r[0] - uv[0]) < GEOMDL_DELTA
+        assert abs(r[1] - uv[1]) < GEOMDL_DELTA
+
+    # Off-surface point is projected along the surface normal
+    evalpt, normal = operations.normal(spline_surf, (0.4, 0.3))
+    pt = [evalpt[i] + 2.0 * normal[i] for i in range(3)]
+    uv = spline_surf.project(pt)
+    assert abs(uv[0] - 0.4) < GEOMDL_DELTA
+    assert abs(uv[1] - 0.3) < GEOMDL_DELTA
+
+
+def test_surface_project_boundary(spline_surf):
+    # Points outside the surface footprint are projected onto the boundary curves
+    pts = [[-40.0, 10.0, 0.0], [30.0, 40.0, -5.0], [10.0, -35.0, 3.0], [-18.47, -34.01, 9.92], [-26.21, 23.18, 11.0]]
+    res = spline_surf.project(pts)
+    samples = spline_surf.evaluate_list([(i / 50.0, j / 50.0) for i in range(51) for j in range(51)])
+    for pt, uv in zip(pts, res):
+        dist = linalg.point_distance(spline_surf.evaluate_single(uv), pt)
+        assert dist <= min(linalg.point_distance(spt, pt) for spt in samples) + GEOMDL_DELTA
+
+
+def test_surface_container_transform(spline_surf):
+    mcontainer = multi.SurfaceContainer(operations.split_surface_u(spline_surf, 0.4))
+    pts = [surf.evaluate_single((0.2, 0.7)) for surf in mcontainer]
+
+    # Successive transformations are composed and applied when the surfaces are accessed
+    res = operations.transform(mcontainer, [[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]], lazy=True)
+    operations.transform(res, [[1.0, 0.0, 0.0, 5.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 2.0, 0.0]], lazy=True,
+                         inplace=True)
+    for surf, pt in zip(res, pts):
+        evalpt = surf.evaluate_single((0.2, 0.7))
+        assert abs(evalpt[0] - (5.0 - pt[1])) < GEOMDL_DELTA
+        assert abs(evalpt[1] - pt[0]) < GEOMDL_DELTA
+        assert abs(evalpt[2] - 2.0 * pt[2]) < GEOMDL_DELTA
+
+    # The input container is unchanged
+    assert mcontainer[0].evaluate_single((0.2, 0.7)) == pts[0]
+
+
+def test_surface_rotate(spline_surf):
+    origin = spline_surf.evaluate_single((0.0, 0.0))
+    pt = spline_surf.evaluate_single((0.3, 0.6))
+    res = operations.rotate(spline_surf, 90, axis=0)
+    evalpt = res.evaluate_single((0.3, 0.6))
+    assert abs(evalpt[0] - pt[0]) < GEOMDL_DELTA
+    assert abs(evalpt[1] - (origin[1] - (pt[2] - origin[2]))) < GEOMDL_DELTA
+    assert abs(evalpt[2] - (origin[2] + (pt[1] - origin[1]))) < GEOMDL_DELTA
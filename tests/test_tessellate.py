@@ -0,0 +1,251 @@
+"""
+    Tests for the NURBS-Python package
+    Released under The MIT License. See LICENSE file for details.
+    Copyright (c) 2018-2019 Onur Rauf Bingol
+
+    Requires "pytest" to run.
+"""
+
+import copy
+import pickle
+from pytest import fixture
+from geomdl import BSpline
+from geomdl import multi
+from geomdl import operations
+from geomdl import tessellate
+from geomdl import utilities
+from geomdl import elements
+from geomdl import exchange
+from geomdl import exchange_vtk
+
+
+@fixture
+def spline_surf():
+    """ Creates a B-spline surface instance """
+    surf = BSpline.Surface()
+    surf.degree_u = 3
+    surf.degree_v = 3
+    ctrlpts = [[u * 10.0, v * 10.0, float((u * v) % 3)] for u in range(6) for v in range(6)]
+    surf.set_ctrlpts(ctrlpts, 6, 6)
+    surf.knotvector_u = utilities.generate_knot_vector(3, 6)
+    surf.knotvector_v = utilities.generate_knot_vector(3, 6)
+    return surf
+
+
+def test_weld_vertices():
+    v1 = elements.Vertex(0.0, 0.0, 0.0)
+    v2 = elements.Vertex(1.0, 0.0, 0.0)
+    v3 = elements.Vertex(1.0, 1.0, 0.0)
+    v4 = elements.Vertex(1.0, 0.0, 0.0)
+    v5 = elements.Vertex(0.0, 1.0, 0.0)
+    v6 = elements.Vertex(1.0, 1.0, 0.0 + 10e-10)
+    tris = [elements.Triangle(v1, v2, v3), elements.Triangle(v4, v6, v5)]
+
+    vertices, faces = tessellate.weld_vertices([v1, v2, v3, v4, v5, v6], tris)
+
+    assert len(vertices) == 4
+    assert [v.id for v in vertices] == [0, 1, 2, 3]
+    assert [f.data for f in faces] == [[0, 1, 2], [1, 2, 3]]
+
+
+def test_surface_container_tessellate_watertight(spline_surf):
+    surf1, surf2 = operations.split_surface_u(spline_surf, 0.4)
+    mcontainer = multi.SurfaceContainer(surf1, surf2)
+    mcontainer.sample_size = 11
+
+    mcontainer.tessellate()
+    size_u, size_v = mcontainer[0].sample_size_u, mcontainer[0].sample_size_v
+    num_vertices = len(mcontainer.vertices)
+    num_faces = len(mcontainer.faces)
+
+    mcontainer.tessellate(watertight=True, force=True)
+
+    # Vertices on the shared boundary are welded
+    assert len(mcontainer.vertices) == num_vertices - size_v
+    assert len(mcontainer.faces) == num_faces
+
+    # Each edge is shared by at most 2 triangles
+    edges = {}
+    for tri in mcontainer.faces:
+        vids = tri.data
+        for idx in range(3):
+            edge = tuple(sorted((vids[idx], vids[idx - 1])))
+            edges[edge] = edges.get(edge, 0) + 1
+    assert max(edges.values()) == 2
+    assert sum(1 for cnt in edges.values() if cnt == 1) == 4 * (size_u - 1) + 2 * (size_v - 1)
+
+
+def test_surface_container_tessellate_watertight_mismatch(spline_surf):
+    surf1, surf2 = operations.split_surface_u(spline_surf, 0.4)
+    surf1.sample_size = 11
+    surf2.sample_size_u = 9
+    surf2.sample_size_v = 7
+    mcontainer = multi.SurfaceContainer(surf1, surf2)
+    mcontainer.tessellate(watertight=True, force=True, delta=False)
+
+    # Tessellation results stored in the surfaces are not modified
+    for surf in mcontainer:
+        for vert in surf.vertices:
+            assert list(vert.data) == surf.evaluate_single(vert.uv)
+
+    # Shared boundary is sampled at the union of the boundary parameters, i.e. there are no T-junctions
+    edges = {}
+    for tri in mcontainer.faces:
+        vids = tri.data
+        for idx in range(3):
+            edge = tuple(sorted((vids[idx], vids[idx - 1])))
+            edges[edge] = edges.get(edge, 0) + 1
+    assert max(edges.values()) == 2
+    assert sum(1 for cnt in edges.values() if cnt == 1) == 2 * (11 - 1) + 2 * (9 - 1) + (11 - 1) + (7 - 1)
+
+
+def test_surface_tessellate_lod(spline_surf):
+    spline_surf.sample_size = 15
+    levels = spline_surf.tessellate_lod(num_levels=3)
+
+    # Finest sample size is rounded up to be halved twice
+    assert [lvl['sample_size'] for lvl in levels] == [(17, 17), (9, 9), (5, 5)]
+    assert [len(lvl['vertices']) for lvl in levels] == [17 * 17, 9 * 9, 5 * 5]
+    assert [len(lvl['faces']) for lvl in levels] == [2 * 16 * 16, 2 * 8 * 8, 2 * 4 * 4]
+
+    # Coarser levels reuse the finest points
+    finest = set([v.data for v in levels[0]['vertices']])
+    assert all(v.data in finest for v in levels[2]['vertices'])
+
+    # Error increases with decreasing resolution
+    assert levels[0]['error'] == 0.0
+    assert levels[0]['error'] < levels[1]['error'] < levels[2]['error']
+
+
+def test_select_lod(spline_surf):
+    levels = spline_surf.tessellate_lod(num_levels=3)
+    assert tessellate.select_lod(levels, error=0.0) is levels[0]
+    assert tessellate.select_lod(levels, error=levels[1]['error']) is levels[1]
+    assert tessellate.select_lod(levels, error=levels[2]['error'] * 2) is levels[2]
+    assert tessellate.select_lod(levels, pixel_error=1.0, distance=10e8) is levels[2]
+
+
+def test_surface_container_tessellate_lod(spline_surf):
+    surf1, surf2 = operations.split_surface_u(spline_surf, 0.4)
+    mcontainer = multi.SurfaceContainer(surf1, surf2)
+    levels = mcontainer.tessellate_lod(num_levels=2)
+    assert len(levels) == 2
+    for lvl in levels:
+        assert [v.id for v in lvl['vertices']] == list(range(len(lvl['vertices'])))
+        assert len(lvl['sample_size']) == 2
+
+
+def test_vertex_opt_flags():
+    vert = elements.Vertex(1, 2, 3, id=5)
+    assert vert.opt == {'inside': False}
+    vert.inside = True
+    vert.opt = ['trim', False]
+    vert.opt = ['face_id', 4]
+    assert vert.opt == {'inside': True, 'trim': False, 'face_id': 4}
+    vert.opt = ['trim', None]
+    assert vert.opt_get('trim') is None
+    vert.x = 7
+    vert.u = 0.25
+    assert vert.data == (7.0, 2.0, 3.0)
+    assert vert.uv == (0.25, 0.0)
+    del vert.opt
+    assert vert.opt == {}
+
+
+def test_vertex_copy():
+    vert = elements.Vertex(1, 2, 3, id=5)
+    vert.inside = True
+    vert.opt = ['face_id', [4]]
+    vert_copy = copy.deepcopy(vert)
+    assert vert_copy.id == 5
+    assert vert_copy.data == vert.data
+    assert vert_copy.inside
+    assert vert_copy.opt['face_id'] == [4] and vert_copy.opt['face_id'] is not vert.opt['face_id']
+    assert not hasattr(vert_copy, '__dict__')
+
+
+def test_vertex_triangle_pickle():
+    verts = [elements.Vertex(0, 0, 0, id=1), elements.Vertex(1, 0, 0, id=2), elements.Vertex(0, 1, 0, id=3)]
+    verts[1].uv = [0.5, 0.25]
+    verts[2].inside = True
+    verts[2].opt = ['face_id', 4]
+    tri = elements.Triangle(*verts, id=7)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        tri_copy = pickle.loads(pickle.dumps(tri, protocol))
+        assert tri_copy.id == 7
+        assert [v.data for v in tri_copy.vertices] == [v.data for v in verts]
+        assert tri_copy.vertices[1].uv == (0.5, 0.25)
+        assert tri_copy.vertices[2].inside
+        assert tri_copy.vertices[2].opt == {'inside': True, 'face_id': 4}
+
+
+def test_mesh_from_elements(spline_surf):
+    spline_surf.sample_size = 5
+    mesh = spline_surf.mesh
+    assert mesh.num_vertices == 25
+    assert mesh.num_faces == 32
+    assert mesh.positions[7] == spline_surf.vertices[7].data
+    assert mesh.uvs[7] == spline_surf.vertices[7].uv
+    assert mesh.faces[3] == tuple(spline_surf.faces[3].data)
+    vertices, faces = mesh.to_elements()
+    assert [v.data for v in vertices] == mesh.positions
+    assert [tuple(f.data) for f in faces] == mesh.faces
+
+
+def test_mesh_merge():
+    mesh1 = elements.Mesh([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]])
+    mesh2 = elements.Mesh([[0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]], [[0, 1, 2, 3]], surface_ids=[1])
+    mesh = elements.Mesh.merge(mesh1, mesh2)
+    assert mesh.num_vertices == 7
+    assert mesh.faces == [(0, 1, 2), (3, 4, 5, 6)]
+    assert mesh.surface_ids == [0, 1]
+    assert mesh.uvs is None
+    assert mesh.bbox == ((0.0, 0.0, 0.0), (1.0, 1.0, 1.0))
+
+
+def test_mesh_pickle():
+    mesh = elements.Mesh([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]], uvs=[[0, 0], [1, 0], [0, 1]])
+    mesh.compute_normals()
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        mesh_copy = pickle.loads(pickle.dumps(mesh, protocol))
+        assert mesh_copy.positions == mesh.positions
+        assert mesh_copy.uvs == mesh.uvs
+        assert mesh_copy.normals == mesh.normals
+        assert mesh_copy.faces == mesh.faces
+        assert mesh_copy.surface_ids == mesh.surface_ids
+
+
+def test_mesh_normals_transform():
+    mesh = elements.Mesh([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], [[0, 1, 2], [0, 2, 3]])
+    assert mesh.face_normals() == [(0.0, 0.0, 1.0), (0.0, 0.0, 1.0)]
+    assert mesh.compute_normals() == [(0.0, 0.0, 1.0) for _ in range(4)]
+
+    # Rotate 90 degrees around the x-axis and translate
+    mesh.transform([[1, 0, 0, 1], [0, 0, -1, 2], [0, 1, 0, 3], [0, 0, 0, 1]])
+    assert mesh.positions[2] == (2.0, 2.0, 4.0)
+    assert mesh.normals[0] == (0.0, -1.0, 0.0)
+    assert mesh.face_normals()[0] == (0.0, -1.0, 0.0)
+
+
+def test_surface_container_mesh(spline_surf):
+    surf1, surf2 = operations.split_surface_u(spline_surf, 0.4)
+    mcontainer = multi.SurfaceContainer(surf1, surf2)
+    mcontainer.sample_size = 6
+    mesh = mcontainer.mesh
+    nf = len(mcontainer[0].faces)
+    assert mesh.num_vertices == len(mcontainer.vertices)
+    assert mesh.surface_ids == [0] * nf + [1] * (mesh.num_faces - nf)
+
+    # Welded mesh keeps the surface indices
+    mcontainer.tessellate(watertight=True, force=True)
+    mesh = mcontainer.mesh
+    assert mesh.num_vertices == len(mcontainer.vertices)
+    assert set(mesh.surface_ids) == {0, 1}
+
+
+def test_export_mesh():
+    mesh = elements.Mesh([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], [[0, 1, 2, 3]])
+    assert exchange.export_off_str(mesh) == "OFF\n4 1 0\n0.0 0.0 0.0\n1.0 0.0 0.0\n1.0 1.0 0.0\n0.0 1.0 0.0\n4 0 1 2 3\n"
+    assert "vn 0.0 0.0 1.0\nf 1 2 3 4\n" in exchange.export_obj_str(mesh, vertex_normals=True)
+    assert exchange.export_stl_str(mesh).count("facet normal") == 2
+    assert "POLYGONS 1 5\n4 0 1 2 3\n" in exchange_vtk.export_polydata_str(mesh)
@@ -0,0 +1,49 @@
+"""
+    Tests for the NURBS-Python package
+    Released under The MIT License. See LICENSE file for details.
+    Copyright (c) 2018-2019 Onur Rauf Bingol
+
+    Requires "pytest" to run.
+"""
+
+from pytest import fixture, mark
+from geomdl import BSpline
+from geomdl import operations
+
+GEOMDL_DELTA = 0.001
+
+
+@fixture
+def spline_vol():
+    """ Creates a B-spline volume instance """
+    vol = BSpline.Volume()
+    vol.degree_u = 2
+    vol.degree_v = 2
+    vol.degree_w = 3
+    ctrlpts = [[u * 10.0, v * 10.0 + float((u * w) % 3), w * 10.0 + float((u + v) % 2)]
+               for u in range(4) for v in range(4) for w in range(6)]
+    vol.set_ctrlpts(ctrlpts, 4, 4, 6)
+    vol.knotvector_u = [0.0, 0.0, 0.0, 0.4, 1.0, 1.0, 1.0]
+    vol.knotvector_v = [0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 1.0]
+    vol.knotvector_w = [0.0, 0.0, 0.0, 0.0, 0.3, 0.7, 1.0, 1.0, 1.0, 1.0]
+    return vol
+
+
+@mark.parametrize("decompose_dir", ['u', 'w', 'uw', 'vw', 'uvw'])
+def test_bspline_volume_decompose(spline_vol, decompose_dir):
+    knots = ([0.0, 0.4, 1.0], [0.0, 0.5, 1.0], [0.0, 0.3, 0.7, 1.0])
+    knots = [kts if d in decompose_dir else [0.0, 1.0] for d, kts in zip('uvw', knots)]
+    num = [len(kts) - 1 for kts in knots]
+    patches = operations.decompose_volume(spline_vol, decompose_dir=decompose_dir)
+    assert len(patches) == num[0] * num[1] * num[2]
+    for idx, patch in enumerate(patches):
+        iu, ivw = divmod(idx, num[1] * num[2])
+        iv, iw = divmod(ivw, num[2])
+        for tpar in ((0.0, 0.0, 0.0), (0.3, 0.6, 0.2), (1.0, 0.5, 0.8), (1.0, 1.0, 1.0)):
+            # Decomposed directions are evaluated on the knot spans of the volume
+            uvw = [kts[i] + t * (kts[i + 1] - kts[i]) for kts, i, t in zip(knots, (iu, iv, iw), tpar)]
+            evalpt = spline_vol.evaluate_single(uvw)
+            patchpt = patch.evaluate_single(tpar)
+            assert abs(evalpt[0] - patchpt[0]) < GEOMDL_DELTA
+            assert abs(evalpt[1] - patchpt[1]) < GEOMDL_DELTA
+            assert abs(evalpt[2] - patchpt[2]) < GEOMDL_DELTA
@@ -0,0 +1,123 @@
+"""
+    Tests for the NURBS-Python package
+    Released under The MIT License. See LICENSE file for details.
+    Copyright (c) 2018-2019 Onur Rauf Bingol
+
+    Requires "pytest" to run.
+"""
+
+import struct
+from pytest import approx, fixture, mark
+from geomdl import BSpline
+from geomdl import construct
+from geomdl import multi
+from geomdl import utilities
+from geomdl import voxelize
+
+
+@fixture
+def spline_surf():
+    """ Creates a B-spline surface instance """
+    surf = BSpline.Surface()
+    surf.degree_u = 3
+    surf.degree_v = 3
+    ctrlpts = [[u * 10.0, v * 10.0, float((u * v) % 3)] for u in range(6) for v in range(6)]
+    surf.set_ctrlpts(ctrlpts, 6, 6)
+    surf.knotvector_u = utilities.generate_knot_vector(3, 6)
+    surf.knotvector_v = utilities.generate_knot_vector(3, 6)
+    surf.sample_size = 15
+    return surf
+
+
+@fixture
+def spline_vol():
+    """ Creates a B-spline volume instance, which fills the box [0, 10] x [0, 10] x [0, 4] """
+    vol = BSpline.Volume()
+    vol.degree_u = 1
+    vol.degree_v = 2
+    vol.degree_w = 1
+    ctrlpts = [[u * 10.0, v * 5.0 + (2.0 if v == 1 else 0.0) * u, w * 4.0]
+               for w in range(2) for u in range(2) for v in range(3)]
+    vol.set_ctrlpts(ctrlpts, 2, 3, 2)
+    vol.knotvector_u = utilities.generate_knot_vector(1, 2)
+    vol.knotvector_v = utilities.generate_knot_vector(2, 3)
+    vol.knotvector_w = utilities.generate_knot_vector(1, 2)
+    vol.sample_size = 10
+    return vol
+
+
+@mark.parametrize("grid_size, use_cubes", [
+    ((6, 6, 6), False),
+    ((4, 7, 3), False),
+    ((3, 3, 2), True)
+])
+def test_voxelize_binning(spline_surf, grid_size, use_cubes):
+    grid, filled = voxelize.voxelize(spline_surf, grid_size=grid_size, use_cubes=use_cubes)
+    grid_bf, filled_bf = voxelize.voxelize(spline_surf, grid_size=grid_size, use_cubes=use_cubes, brute_force=True)
+    assert grid == grid_bf
+    assert filled == filled_bf
+    assert 0 < sum(filled) < len(filled)
+
+
+def test_voxelize_solid_volume(spline_vol):
+    grid, filled = voxelize.voxelize(spline_vol, grid_size=(10, 10, 6), solid=True)
+    assert len(grid) == len(filled) == 600
+    # Voxel centers inside the box: 9 in x-, 9 in y- and 5 in z-direction
+    assert sum(filled) == 405
+    for bb, f in zip(grid, filled):
+        center = [(a + b) / 2.0 for a, b in zip(*bb)]
+        assert f == int(center[0] < 10.0 and center[1] < 10.0 and center[2] < 4.0)
+
+
+def test_voxelize_solid_shell(spline_vol):
+    grid_vol, filled_vol = voxelize.voxelize(spline_vol, grid_size=(10, 10, 6), solid=True)
+    shell = multi.SurfaceContainer(list(construct.extract_surfaces(spline_vol).values()))
+    shell.sample_size = 10
+    grid, filled = voxelize.voxelize(shell, grid_size=(10, 10, 6), solid=True)
+    assert filled == filled_vol
+    grid_mp, filled_mp = voxelize.voxelize(shell, grid_size=(10, 10, 6), solid=True, num_procs=2)
+    assert filled_mp == filled
+
+
+@mark.parametrize("options", [
+    dict(),
+    dict(brute_force=True),
+    dict(solid=True)
+])
+def test_voxelize_compact(spline_vol, options):
+    grid, filled = voxelize.voxelize(spline_vol, grid_size=(10, 10, 6), **options)
+    vgrids = voxelize.voxelize(spline_vol, grid_size=(10, 10, 6), compact=True, **options)
+    assert len(vgrids) == 1
+    vgrid = vgrids[0]
+    assert vgrid.dims == (10, 10, 6)
+    assert vgrid.to_list() == filled
+    assert vgrid.count == sum(filled)
+    for bb, bb_c in zip(grid, vgrid.voxels()):
+        assert bb_c[0] == approx(bb[0]) and bb_c[1] == approx(bb[1])
+    assert vgrid[(9, 9, 5)] == filled[-1]
+
+
+def test_voxel_grid_save_load(tmpdir):
+    vgrid = voxelize.VoxelGrid((3, 4, 5), origin=(1.0, 2.0, 3.0), step=(0.5, 0.25, 2.0))
+    vgrid.fill([0, 7, 8, 59])
+    vgrid[(1, 2, 3)] = 1
+    vgrid[8] = 0
+    assert list(vgrid.filled_indices()) == [0, 7, 33, 59]
+    assert vgrid.voxel(33) == [[1.5, 2.5, 9.0], [2.0, 2.75, 11.0]]
+
+    file_name = str(tmpdir.join("grid.vox"))
+    voxelize.save_voxel_grid(vgrid, file_name)
+    assert voxelize.load_voxel_grid(file_name) == vgrid
+
+    faces = voxelize.convert_bb_to_faces(vgrid)
+    assert len(list(faces)) == vgrid.count
+
+
+def test_save_voxel_grid_list(tmpdir):
+    # The grid is larger than a single write chunk
+    grid = [(idx * 7) % 3 // 2 for idx in range(150000)]
+    file_name = str(tmpdir.join("grid.bin"))
+    voxelize.save_voxel_grid(grid, file_name)
+    with open(file_name, 'rb') as fp:
+        data = fp.read()
+    assert list(struct.unpack("<" + str(len(grid)) + "I", data)) == grid